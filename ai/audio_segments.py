@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import os
+import struct
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator
+
+CHUNK_BYTES = 64 * 1024
+
+_PCM_FORMATS = {1, 3}  # integer PCM, IEEE float
+
+
+class RangeNotSatisfiableError(ValueError):
+	"""Raised when a Range header lies entirely outside the resource."""
+
+
+@dataclass(frozen=True)
+class WavLayout:
+	"""Where the samples of a WAV file live and how they are framed."""
+
+	data_offset: int
+	data_size: int
+	format_tag: int
+	channels: int
+	sample_rate: int
+	sample_width: int
+
+	@property
+	def block_align(self) -> int:
+		return self.channels * self.sample_width
+
+	@property
+	def byte_rate(self) -> int:
+		return self.sample_rate * self.block_align
+
+	@property
+	def duration_seconds(self) -> float:
+		return self.data_size / self.byte_rate if self.byte_rate else 0.0
+
+
+def _read_exact(handle, size: int) -> bytes:
+	data = handle.read(size)
+	if len(data) < size:
+		raise ValueError("Truncated WAV header.")
+	return data
+
+
+@lru_cache(maxsize=256)
+def _read_layout(path: str, _mtime_ns: int, size: int) -> WavLayout:
+	with open(path, "rb") as handle:
+		riff, _, wave_id = struct.unpack("<4sI4s", _read_exact(handle, 12))
+		if riff != b"RIFF" or wave_id != b"WAVE":
+			raise ValueError("Not a RIFF/WAVE file.")
+
+		fmt = None
+		while True:
+			chunk = handle.read(8)
+			if len(chunk) < 8:
+				raise ValueError("WAV file has no data chunk.")
+			chunk_id, chunk_size = struct.unpack("<4sI", chunk)
+			if chunk_id == b"fmt ":
+				if chunk_size < 16:
+					raise ValueError("Truncated WAV header.")
+				fmt = struct.unpack("<HHIIHH", _read_exact(handle, 16))
+				handle.seek(chunk_size - 16 + (chunk_size & 1), os.SEEK_CUR)
+			elif chunk_id == b"data":
+				if fmt is None:
+					raise ValueError("WAV data chunk precedes its fmt chunk.")
+				data_offset = handle.tell()
+				break
+			else:
+				# Chunks are word aligned
+				handle.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+
+	format_tag, channels, sample_rate, _, _, bits = fmt
+	if format_tag not in _PCM_FORMATS:
+		raise ValueError("Only PCM WAV files can be segmented.")
+	if not channels or bits < 8:
+		raise ValueError("WAV fmt chunk describes no samples.")
+	# Recorders that stream to disk may leave the data size 0 or overstated
+	available = size - data_offset
+	data_size = chunk_size if 0 < chunk_size <= available else available
+	return WavLayout(data_offset, data_size, format_tag, channels, sample_rate, bits // 8)
+
+
+def read_wav_layout(path: str | Path) -> WavLayout:
+	"""Parse (and cache) the chunk layout of a WAV file; only the header is read."""
+	stat = os.stat(path)
+	return _read_layout(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def wav_header(layout: WavLayout, data_size: int) -> bytes:
+	"""Canonical 44-byte header for a file holding data_size bytes of layout's samples."""
+	return struct.pack(
+		"<4sI4s4sIHHIIHH4sI",
+		b"RIFF",
+		36 + data_size,
+		b"WAVE",
+		b"fmt ",
+		16,
+		layout.format_tag,
+		layout.channels,
+		layout.sample_rate,
+		layout.byte_rate,
+		layout.block_align,
+		layout.sample_width * 8,
+		b"data",
+		data_size,
+	)
+
+
+@dataclass(frozen=True)
+class AudioSegment:
+	"""
+	A time range of a WAV file, served as a standalone WAV.
+
+	The segment is a virtual file: a fresh header followed by a contiguous
+	slice of the source's data chunk. Both ends are computed from the byte
+	rate, so seeking anywhere in a long recording costs one stat and one seek.
+	"""
+
+	path: Path
+	header: bytes
+	data_start: int
+	data_size: int
+
+	@property
+	def size(self) -> int:
+		return len(self.header) + self.data_size
+
+	def iter_bytes(self, first: int = 0, last: int | None = None) -> Iterator[bytes]:
+		"""Bytes first..last (inclusive) of the virtual file, read in chunks."""
+		last = self.size - 1 if last is None else last
+		header_len = len(self.header)
+		if first < header_len:
+			yield self.header[first:min(last + 1, header_len)]
+			first = header_len
+		if first > last:
+			return
+
+		remaining = last - first + 1
+		with open(self.path, "rb") as handle:
+			handle.seek(self.data_start + first - header_len)
+			while remaining > 0:
+				chunk = handle.read(min(CHUNK_BYTES, remaining))
+				if not chunk:
+					break
+				remaining -= len(chunk)
+				yield chunk
+
+
+def audio_segment(path: str | Path, start: float = 0.0, end: float | None = None) -> AudioSegment:
+	"""
+	Locate [start, end) seconds of a WAV file.
+
+	Raises:
+		ValueError: If the file is not a PCM WAV or the range is empty
+	"""
+	layout = read_wav_layout(path)
+	align = layout.block_align
+	# Snap to whole sample frames so channels stay interleaved correctly
+	first = min(int(start * layout.sample_rate) * align, layout.data_size)
+	last = layout.data_size if end is None else min(int(end * layout.sample_rate) * align, layout.data_size)
+	last -= (last - first) % align
+	if last <= first:
+		raise ValueError("The requested time range contains no audio.")
+	return AudioSegment(Path(path), wav_header(layout, last - first), layout.data_offset + first, last - first)
+
+
+def parse_range(value: str | None, size: int) -> tuple[int, int] | None:
+	"""
+	Resolve a single-range "bytes=" header to inclusive (first, last).
+
+	Returns None when the whole resource should be sent (no header, another
+	unit, a malformed range such as bytes=5-3, which RFC 7233 says to
+	ignore, or several ranges, which may be answered with the full body).
+	"""
+	if not value or not value.startswith("bytes=") or "," in value:
+		return None
+	first_text, _, last_text = value[len("bytes="):].strip().partition("-")
+	try:
+		first = int(first_text) if first_text else None
+		last = int(last_text) if last_text else None
+	except ValueError:
+		return None
+
+	if first is None:
+		# Suffix range: the final `last` bytes
+		if last is None or last <= 0:
+			raise RangeNotSatisfiableError(value)
+		return max(size - last, 0), size - 1
+	if last is not None and last < first:
+		# Syntactically invalid; RFC 7233 says to ignore the header
+		return None
+	if first >= size:
+		raise RangeNotSatisfiableError(value)
+	last = size - 1 if last is None else min(last, size - 1)
+	return first, last
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import json
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from bson import Binary, ObjectId
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+from src.transcripter.transcript_store import TranscriptReader, encode_transcript
+
+
+# Stored recordings, referenced from meetings by file name
+UPLOAD_DIR = Path("uploads")
+
+PREVIEW_CHARS = 280
+MAX_PAGE_SIZE = 100
+
+# Fields returned when listing; transcripts and word timings stay on the server
+LIST_PROJECTION = {
+	"filename": 1,
+	"created_at": 1,
+	"summary": 1,
+	"topics": 1,
+	"word_count": 1,
+	"duration_seconds": 1,
+	"preview": 1,
+}
+DETAIL_PROJECTION = {**LIST_PROJECTION, "action_items": 1, "highlights": 1}
+
+
+# Meetings saved before the columnar store kept "transcript" (str or zlib
+# bytes) and "words" (JSON) fields; they are still readable.
+def _unpack_text(value: str | bytes | None) -> str | None:
+	if value is None or isinstance(value, str):
+		return value
+	return zlib.decompress(bytes(value)).decode("utf-8")
+
+
+def _unpack_words(value: str | bytes | None) -> list[dict]:
+	text = _unpack_text(value)
+	return json.loads(text) if text else []
+
+
+def _serialize(doc: dict[str, Any]) -> dict[str, Any]:
+	doc["id"] = str(doc.pop("_id"))
+	doc.pop("user_id", None)
+	if isinstance(doc.get("created_at"), datetime):
+		doc["created_at"] = doc["created_at"].isoformat()
+	return doc
+
+
+async def save_meeting(
+	collection: AsyncIOMotorCollection,
+	user_id: str,
+	*,
+	filename: str,
+	transcript: str,
+	summary: str,
+	action_items: list[str],
+	highlights: list[str],
+	topics: list[str],
+	words: list[dict],
+	audio_file: str | None = None,
+) -> str:
+	"""Store one processed upload for a user and return its id."""
+	duration = words[-1].get("end", 0.0) if words else 0.0
+	result = await collection.insert_one({
+		"user_id": ObjectId(user_id),
+		"filename": filename,
+		"created_at": datetime.now(timezone.utc),
+		"summary": summary,
+		"action_items": action_items,
+		"highlights": highlights,
+		"topics": topics,
+		"word_count": len(transcript.split()),
+		"duration_seconds": round(float(duration), 2),
+		"preview": transcript[:PREVIEW_CHARS],
+		# Transcript text and word timings in one compressed, block-indexed blob
+		"transcript_store": Binary(encode_transcript(words, transcript)),
+		# Name of the stored recording in the upload directory
+		"audio_file": audio_file,
+	})
+	return str(result.inserted_id)
+
+
+async def list_meetings(
+	collection: AsyncIOMotorCollection,
+	user_id: str,
+	*,
+	limit: int = 20,
+	before: str | None = None,
+) -> dict[str, Any]:
+	"""
+	One page of a user's meetings, newest first.
+
+	Pages are keyed by the last id seen (pass next_cursor as before), so each
+	page is a bounded walk of the (user_id, _id) index instead of a skip.
+	"""
+	query: dict[str, Any] = {"user_id": ObjectId(user_id)}
+	if before:
+		query["_id"] = {"$lt": ObjectId(before)}
+	limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+	cursor = collection.find(query, LIST_PROJECTION).sort("_id", -1).limit(limit + 1)
+	items = [_serialize(doc) async for doc in cursor]
+	has_more = len(items) > limit
+	items = items[:limit]
+	return {
+		"items": items,
+		"next_cursor": items[-1]["id"] if has_more else None,
+	}
+
+
+async def get_meeting(
+	collection: AsyncIOMotorCollection,
+	user_id: str,
+	meeting_id: str,
+	*,
+	include_transcript: bool = True,
+	include_words: bool = False,
+	start: float | None = None,
+	end: float | None = None,
+) -> dict[str, Any] | None:
+	"""
+	A single meeting of the user, loading the transcript and timings only if asked.
+
+	With start and/or end (seconds), words are limited to that time range and
+	only the blocks of the stored transcript covering it are decompressed.
+	"""
+	projection = dict(DETAIL_PROJECTION)
+	if include_transcript or include_words:
+		projection.update({"transcript_store": 1, "transcript": 1, "words": 1})
+
+	doc = await collection.find_one({"_id": ObjectId(meeting_id), "user_id": ObjectId(user_id)}, projection)
+	if doc is None:
+		return None
+
+	stored = doc.pop("transcript_store", None)
+	legacy_transcript = doc.pop("transcript", None)
+	legacy_words = doc.pop("words", None)
+	reader = TranscriptReader(bytes(stored)) if stored is not None else None
+	ranged = start is not None or end is not None
+
+	if include_transcript:
+		doc["transcript"] = reader.text() if reader else _unpack_text(legacy_transcript)
+	if include_words:
+		if reader and ranged and reader.timed:
+			doc["words"] = reader.words_in_range(start or 0.0, end)
+		else:
+			words = reader.words() if reader else _unpack_words(legacy_words)
+			if ranged:
+				lo, hi = start or 0.0, end if end is not None else float("inf")
+				words = [w for w in words if w.get("end", 0.0) > lo and w.get("start", 0.0) < hi]
+			doc["words"] = words
+	return _serialize(doc)
+
+
+async def get_meeting_audio(collection: AsyncIOMotorCollection, user_id: str, meeting_id: str) -> str | None:
+	"""File name of the meeting's stored recording, if the user owns the meeting and it has one."""
+	doc = await collection.find_one(
+		{"_id": ObjectId(meeting_id), "user_id": ObjectId(user_id)}, {"audio_file": 1}
+	)
+	return doc.get("audio_file") if doc else None
+
+
+async def delete_user_data(
+	meetings: AsyncIOMotorCollection,
+	postings: AsyncIOMotorCollection,
+	search_stats: AsyncIOMotorCollection,
+	user_id: str,
+	upload_dir: Path | None = None,
+) -> dict[str, int]:
+	"""Remove everything stored for a user: meetings, search index and recordings."""
+	upload_dir = upload_dir if upload_dir is not None else UPLOAD_DIR
+	owner = ObjectId(user_id)
+	audio_files = [
+		doc["audio_file"]
+		async for doc in meetings.find({"user_id": owner, "audio_file": {"$ne": None}}, {"audio_file": 1})
+	]
+	deleted_meetings = (await meetings.delete_many({"user_id": owner})).deleted_count
+	deleted_postings = (await postings.delete_many({"user_id": owner})).deleted_count
+	await search_stats.delete_one({"_id": owner})
+
+	deleted_recordings = 0
+	for name in audio_files:
+		try:
+			# Names are generated server-side; the basename guard is belt and braces
+			(upload_dir / Path(name).name).unlink()
+			deleted_recordings += 1
+		except FileNotFoundError:
+			pass
+	return {
+		"meetings": deleted_meetings,
+		"postings": deleted_postings,
+		"recordings": deleted_recordings,
+	}
@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator
+
+# Latency buckets (seconds) spanning a fast request to a long decode
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+RTF_BUCKETS = (0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 4.0)
+LOAD_BUCKETS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# (name, type, help, labels, value) produced at scrape time
+Sample = tuple[str, str, str, dict[str, str], float]
+
+LabelValues = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+	return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+	pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+	return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+	value = float(value)
+	if value == float("inf"):
+		return "+Inf"
+	return str(int(value)) if value.is_integer() else repr(value)
+
+
+class _Metric:
+	kind = ""
+
+	def __init__(self, name: str, help_text: str, labels: Iterable[str] = ()) -> None:
+		self.name = name
+		self.help = help_text
+		self.label_names = tuple(labels)
+		self._lock = threading.Lock()
+
+	def _key(self, labels: dict[str, str]) -> LabelValues:
+		if set(labels) != set(self.label_names):
+			raise ValueError(f"{self.name} expects labels {self.label_names}, got {tuple(labels)}")
+		return tuple(str(labels[name]) for name in self.label_names)
+
+	def _header(self) -> list[str]:
+		return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+	def render(self) -> list[str]:
+		raise NotImplementedError
+
+
+class Counter(_Metric):
+	"""Monotonically increasing total."""
+
+	kind = "counter"
+
+	def __init__(self, name: str, help_text: str, labels: Iterable[str] = ()) -> None:
+		super().__init__(name, help_text, labels)
+		self._values: dict[LabelValues, float] = {}
+
+	def inc(self, amount: float = 1.0, **labels: str) -> None:
+		key = self._key(labels)
+		with self._lock:
+			self._values[key] = self._values.get(key, 0.0) + amount
+
+	def value(self, **labels: str) -> float:
+		with self._lock:
+			return self._values.get(self._key(labels), 0.0)
+
+	def render(self) -> list[str]:
+		with self._lock:
+			values = sorted(self._values.items())
+		lines = self._header()
+		lines += [f"{self.name}{_format_labels(self.label_names, key)} {_format_value(v)}" for key, v in values]
+		return lines
+
+
+class Gauge(Counter):
+	"""Value that can go up and down."""
+
+	kind = "gauge"
+
+	def set(self, value: float, **labels: str) -> None:
+		key = self._key(labels)
+		with self._lock:
+			self._values[key] = value
+
+	def dec(self, amount: float = 1.0, **labels: str) -> None:
+		self.inc(-amount, **labels)
+
+	@contextmanager
+	def track_in_progress(self, **labels: str) -> Iterator[None]:
+		self.inc(**labels)
+		try:
+			yield
+		finally:
+			self.dec(**labels)
+
+
+class Histogram(_Metric):
+	"""Observations counted into cumulative buckets, for percentiles at query time."""
+
+	kind = "histogram"
+
+	def __init__(
+		self,
+		name: str,
+		help_text: str,
+		labels: Iterable[str] = (),
+		buckets: Iterable[float] = DEFAULT_BUCKETS,
+	) -> None:
+		super().__init__(name, help_text, labels)
+		self.buckets = tuple(sorted(buckets))
+		# Per label set: observations per bucket (last slot is +Inf), and their sum
+		self._counts: dict[LabelValues, list[int]] = {}
+		self._sums: dict[LabelValues, float] = {}
+
+	def observe(self, value: float, **labels: str) -> None:
+		key = self._key(labels)
+		index = bisect.bisect_left(self.buckets, value)
+		with self._lock:
+			counts = self._counts.setdefault(key, [0] * (len(self.buckets) + 1))
+			counts[index] += 1
+			self._sums[key] = self._sums.get(key, 0.0) + value
+
+	@contextmanager
+	def time(self, **labels: str) -> Iterator[None]:
+		"""Observe the duration of the block, also when it raises."""
+		start = time.perf_counter()
+		try:
+			yield
+		finally:
+			self.observe(time.perf_counter() - start, **labels)
+
+	def count(self, **labels: str) -> int:
+		with self._lock:
+			return sum(self._counts.get(self._key(labels), ()))
+
+	def render(self) -> list[str]:
+		with self._lock:
+			values = sorted((key, (list(counts), self._sums[key])) for key, counts in self._counts.items())
+		lines = self._header()
+		bucket_labels = (*self.label_names, "le")
+		for key, (counts, total) in values:
+			cumulative = 0
+			for bound, count in zip((*self.buckets, float("inf")), counts):
+				cumulative += count
+				lines.append(
+					f"{self.name}_bucket{_format_labels(bucket_labels, (*key, _format_value(bound)))} {cumulative}"
+				)
+			suffix = _format_labels(self.label_names, key)
+			lines.append(f"{self.name}_sum{suffix} {_format_value(total)}")
+			lines.append(f"{self.name}_count{suffix} {cumulative}")
+		return lines
+
+
+class MetricsRegistry:
+	"""
+	Metrics of this process in the Prometheus text exposition format.
+
+	Counters, gauges and histograms are updated where the work happens.
+	Collectors are called at scrape time for values other modules already
+	keep (cache hit counters, executor queue lengths), so those modules need
+	no changes.
+	"""
+
+	def __init__(self) -> None:
+		self._metrics: dict[str, _Metric] = {}
+		self._collectors: list[Callable[[], Iterable[Sample]]] = []
+		self._lock = threading.Lock()
+
+	def _register(self, metric: _Metric) -> _Metric:
+		with self._lock:
+			if metric.name in self._metrics:
+				raise ValueError(f"Metric {metric.name} is already registered")
+			self._metrics[metric.name] = metric
+		return metric
+
+	def counter(self, name: str, help_text: str, labels: Iterable[str] = ()) -> Counter:
+		return self._register(Counter(name, help_text, labels))
+
+	def gauge(self, name: str, help_text: str, labels: Iterable[str] = ()) -> Gauge:
+		return self._register(Gauge(name, help_text, labels))
+
+	def histogram(
+		self,
+		name: str,
+		help_text: str,
+		labels: Iterable[str] = (),
+		buckets: Iterable[float] = DEFAULT_BUCKETS,
+	) -> Histogram:
+		return self._register(Histogram(name, help_text, labels, buckets))
+
+	def register_collector(self, collector: Callable[[], Iterable[Sample]]) -> None:
+		with self._lock:
+			self._collectors.append(collector)
+
+	def render(self) -> str:
+		with self._lock:
+			metrics = list(self._metrics.values())
+			collectors = list(self._collectors)
+
+		lines: list[str] = []
+		for metric in metrics:
+			lines += metric.render()
+
+		described: set[str] = set()
+		for collector in collectors:
+			for name, kind, help_text, labels, value in collector():
+				if name not in described:
+					described.add(name)
+					lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+				lines.append(f"{name}{_format_labels(labels, labels.values())} {_format_value(value)}")
+		return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.histogram(
+	"meeting_pipeline_stage_seconds",
+	"Time spent in each stage of processing an upload.",
+	labels=("stage",),
+)
+AUDIO_SECONDS = REGISTRY.counter(
+	"meeting_audio_seconds_total",
+	"Seconds of audio transcribed.",
+)
+TRANSCRIPTION_RTF = REGISTRY.histogram(
+	"meeting_transcription_real_time_factor",
+	"Decoding time divided by audio duration (below 1 is faster than real time).",
+	buckets=RTF_BUCKETS,
+)
+MODEL_LOAD_SECONDS = REGISTRY.histogram(
+	"meeting_model_load_seconds",
+	"Time to load a model into memory.",
+	labels=("kind", "model"),
+	buckets=LOAD_BUCKETS,
+)
+UPLOADS_IN_PROGRESS = REGISTRY.gauge(
+	"meeting_uploads_in_progress",
+	"Uploads currently being processed.",
+)
+UPLOADS_TOTAL = REGISTRY.counter(
+	"meeting_uploads_total",
+	"Processed uploads by response status code.",
+	labels=("status",),
+)
+
+
+def _cache_samples() -> Iterable[Sample]:
+	from auth.cache import cache_stats
+	from src.transcripter.pdf_cache import get_pdf_renderer
+	from src.transcripter.registry import get_registry
+
+	caches = {f"auth_{name}": stats for name, stats in cache_stats().items()}
+	models = get_registry().stats()
+	caches["models"] = models
+	caches["pdf"] = get_pdf_renderer().stats()
+	for cache, stats in caches.items():
+		for field, result in (("hits", "hit"), ("misses", "miss")):
+			yield (
+				"meeting_cache_lookups_total",
+				"counter",
+				"Cache lookups by cache and result.",
+				{"cache": cache, "result": result},
+				stats[field],
+			)
+
+	yield ("meeting_models_loaded", "gauge", "Models held by the model registry.", {}, models["models"])
+	yield ("meeting_models_bytes", "gauge", "Estimated memory of loaded models.", {}, models["bytes"])
+
+
+def _queue_samples() -> Iterable[Sample]:
+	from auth.hash import get_password_hasher
+	from src.transcripter.pdf_cache import get_pdf_renderer
+
+	hasher = get_password_hasher().stats()
+	yield ("meeting_password_hashes_in_flight", "gauge", "Password hashes running or queued.", {}, hasher["in_flight"])
+	yield (
+		"meeting_password_hashes_rejected_total",
+		"counter",
+		"Password hashes refused because the queue was full.",
+		{},
+		hasher["rejected"],
+	)
+	yield ("meeting_pdf_renders_in_progress", "gauge", "PDF reports being rendered.", {}, get_pdf_renderer().stats()["rendering"])
+
+
+REGISTRY.register_collector(_cache_samples)
+REGISTRY.register_collector(_queue_samples)
+
+
+def render_metrics() -> str:
+	return REGISTRY.render()
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from pydantic import BaseModel, Field
+
+
+class MeetingReport(BaseModel):
+	summary: str = Field("", description="Meeting summary text")
+	action_items: list[str] = Field(default_factory=list, description="Action items, optionally prefixed with '- '")
+	highlights: list[str] = Field(default_factory=list, description="Highlight sentences, optionally prefixed with '- '")
+	topics: list[str] = Field(default_factory=list, description="Topic keywords")
+	transcript: str | None = Field(None, description="Full transcript to append to the report (optional)")
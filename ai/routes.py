@@ -1,19 +1,37 @@
 from __future__ import annotations
 
+import os
 import shutil
 from pathlib import Path
+from typing import Any
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from bson import ObjectId
+from fastapi import APIRouter, Depends, File, Header, HTTPException, Query, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from motor.motor_asyncio import AsyncIOMotorCollection
 
+from auth.database import get_meetings_collection, get_postings_collection, get_search_stats_collection
 from auth.routes import get_current_user
+from src.transcripter.action_items import extract_action_items
+from src.transcripter.document import Document
+from src.transcripter.highlights import extract_highlights
+from src.transcripter.search_index import words_from_text
+from src.transcripter.topics import extract_topics
+from src.transcripter.pdf_cache import get_pdf_renderer, iter_file
+from src.transcripter.registry import get_registry
+from .audio_segments import RangeNotSatisfiableError, audio_segment, parse_range
+from .meetings import UPLOAD_DIR, get_meeting, get_meeting_audio, list_meetings, save_meeting
+from .metrics import STAGE_SECONDS, UPLOADS_IN_PROGRESS, UPLOADS_TOTAL
+from .search import index_meeting, search_meetings
+from .models import MeetingReport
 from .summarizer import SummarizationError, summarize_text
-from .transcriber import TranscriptionError, transcribe_audio
+from .transcriber import TranscriptionError, transcribe_audio_with_words
 
 
 router = APIRouter(prefix="", tags=["ai"])
 
-UPLOAD_DIR = Path("uploads")
 ALLOWED_EXTENSIONS = {".mp3", ".wav"}
 
 
@@ -34,6 +52,38 @@ def ai_test(_: str = Depends(get_current_user)) -> dict[str, str]:
 	return {"message": "AI backend working"}
 
 
+@router.get("/models", summary="Loaded models and memory budget")
+def loaded_models(_: str = Depends(get_current_user)) -> dict[str, Any]:
+	registry = get_registry()
+	return {"stats": registry.stats(), "models": registry.loaded()}
+
+
+@router.post(
+	"/export/pdf",
+	summary="Download a meeting report as PDF",
+	response_class=StreamingResponse,
+	responses={200: {"content": {"application/pdf": {}}, "description": "PDF report"}},
+)
+async def export_pdf(report: MeetingReport, _: str = Depends(get_current_user)) -> StreamingResponse:
+	# Rendered in a process pool; identical reports are served from the disk cache.
+	# The file comes back already open, so eviction cannot remove it mid-response.
+	try:
+		handle = await get_pdf_renderer().get_or_render(
+			report.summary, report.action_items, report.highlights, report.topics, report.transcript
+		)
+	except ImportError as exc:
+		raise HTTPException(
+			status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+			detail=str(exc),
+		) from exc
+
+	headers = {
+		"Content-Disposition": 'attachment; filename="meeting_summary.pdf"',
+		"Content-Length": str(os.fstat(handle.fileno()).st_size),
+	}
+	return StreamingResponse(iter_file(handle), media_type="application/pdf", headers=headers)
+
+
 @router.post(
 	"/upload",
 	summary="Upload audio and receive transcript + summary",
@@ -43,8 +93,12 @@ def ai_test(_: str = Depends(get_current_user)) -> dict[str, str]:
 			"content": {
 				"application/json": {
 					"example": {
+						"meeting_id": "665f1c2e9b1e8a3d4c2b1a00",
 						"transcript": "hello everyone welcome to the meeting",
 						"summary": "The speaker greeted the team and opened the meeting.",
+						"action_items": [],
+						"highlights": [],
+						"topics": ["Welcome", "Meeting"],
 					}
 				}
 			},
@@ -53,34 +107,34 @@ def ai_test(_: str = Depends(get_current_user)) -> dict[str, str]:
 )
 async def upload_audio(
 	file: UploadFile = File(...),
-	_: str = Depends(get_current_user),
-) -> dict[str, str]:
-	if not file:
-		raise HTTPException(
-			status_code=status.HTTP_400_BAD_REQUEST,
-			detail="No audio file provided. Attach a .mp3 or .wav file.",
-		)
+	current_user: str = Depends(get_current_user),
+	meetings: AsyncIOMotorCollection = Depends(get_meetings_collection),
+	postings: AsyncIOMotorCollection = Depends(get_postings_collection),
+	search_stats: AsyncIOMotorCollection = Depends(get_search_stats_collection),
+) -> dict[str, Any]:
+	with UPLOADS_IN_PROGRESS.track_in_progress():
+		try:
+			result = await _process_upload(file, current_user, meetings, postings, search_stats)
+		except HTTPException as exc:
+			UPLOADS_TOTAL.inc(status=str(exc.status_code))
+			raise
+		except Exception:
+			UPLOADS_TOTAL.inc(status="500")
+			raise
+	UPLOADS_TOTAL.inc(status="200")
+	return result
 
-	extension = Path(file.filename or "").suffix.lower()
-	if extension not in ALLOWED_EXTENSIONS:
-		raise HTTPException(
-			status_code=status.HTTP_400_BAD_REQUEST,
-			detail="Only .mp3 and .wav audio formats are supported.",
-		)
 
-	_ensure_upload_dir()
-	dest_path = UPLOAD_DIR / f"{uuid4().hex}{extension}"
-	print(f"[AI] Upload received: {file.filename} -> {dest_path}")
-	try:
-		with dest_path.open("wb") as buffer:
-			shutil.copyfileobj(file.file, buffer)
-	finally:
-		await file.close()
+def _save_upload(file: UploadFile, dest_path: Path) -> None:
+	with dest_path.open("wb") as buffer:
+		shutil.copyfileobj(file.file, buffer)
+
 
+def _analyze_upload(dest_path: Path) -> tuple[str, list[dict], str, list[str], list[str], list[str]]:
+	"""Transcribe, summarize and extract from a saved upload (blocking)."""
+	# WAV validation, decoding and summarization record their own stage timings
 	try:
-		print(f"[AI] Starting transcription for {dest_path.name}")
-		transcript = transcribe_audio(dest_path)
-		print(f"[AI] Finished transcription for {dest_path.name}")
+		transcript, words = transcribe_audio_with_words(dest_path)
 	except FileNotFoundError:
 		raise HTTPException(
 			status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -99,17 +153,186 @@ async def upload_audio(
 		)
 
 	try:
-		print(f"[AI] Starting summary for {dest_path.name}")
 		summary = summarize_text(transcript)
-		print(f"[AI] Finished summary for {dest_path.name}")
 	except SummarizationError as exc:
 		raise HTTPException(
 			status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
 			detail=str(exc),
 		) from exc
 
+	with STAGE_SECONDS.time(stage="extraction"):
+		doc = Document.from_text(transcript)
+		action_items = extract_action_items(doc)
+		highlights = extract_highlights(doc)
+		topics = extract_topics(doc)
+	return transcript, words, summary, action_items, highlights, topics
+
+
+async def _process_upload(
+	file: UploadFile,
+	current_user: str,
+	meetings: AsyncIOMotorCollection,
+	postings: AsyncIOMotorCollection,
+	search_stats: AsyncIOMotorCollection,
+) -> dict[str, Any]:
+	if not file:
+		raise HTTPException(
+			status_code=status.HTTP_400_BAD_REQUEST,
+			detail="No audio file provided. Attach a .mp3 or .wav file.",
+		)
+
+	extension = Path(file.filename or "").suffix.lower()
+	if extension not in ALLOWED_EXTENSIONS:
+		raise HTTPException(
+			status_code=status.HTTP_400_BAD_REQUEST,
+			detail="Only .mp3 and .wav audio formats are supported.",
+		)
+
+	_ensure_upload_dir()
+	dest_path = UPLOAD_DIR / f"{uuid4().hex}{extension}"
+	try:
+		with STAGE_SECONDS.time(stage="upload_copy"):
+			await run_in_threadpool(_save_upload, file, dest_path)
+	finally:
+		await file.close()
+
+	# Decoding, summarization and extraction block for the length of the
+	# meeting, so they run in the threadpool to keep the event loop serving
+	transcript, words, summary, action_items, highlights, topics = await run_in_threadpool(
+		_analyze_upload, dest_path
+	)
+
+	with STAGE_SECONDS.time(stage="persistence"):
+		meeting_id = await save_meeting(
+			meetings,
+			current_user,
+			filename=file.filename or dest_path.name,
+			transcript=transcript,
+			summary=summary,
+			action_items=action_items,
+			highlights=highlights,
+			topics=topics,
+			words=words,
+			audio_file=dest_path.name,
+		)
+		await index_meeting(postings, search_stats, current_user, meeting_id, words or words_from_text(transcript))
+
 	return {
+		"meeting_id": meeting_id,
 		"transcript": transcript,
 		"summary": summary,
+		"action_items": action_items,
+		"highlights": highlights,
+		"topics": topics,
 	}
 
+
+@router.get("/meetings", summary="List your processed meetings, newest first")
+async def meeting_history(
+	limit: int = Query(20, ge=1, le=100),
+	before: str | None = Query(None, description="next_cursor from the previous page"),
+	current_user: str = Depends(get_current_user),
+	meetings: AsyncIOMotorCollection = Depends(get_meetings_collection),
+) -> dict[str, Any]:
+	if before is not None and not ObjectId.is_valid(before):
+		raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor.")
+	return await list_meetings(meetings, current_user, limit=limit, before=before)
+
+
+@router.get("/search", summary="Search your meeting transcripts")
+async def search_transcripts(
+	q: str = Query(..., min_length=1, description="Words to search for"),
+	limit: int = Query(20, ge=1, le=100),
+	hits: int = Query(10, ge=1, le=100, description="Positions returned per meeting"),
+	current_user: str = Depends(get_current_user),
+	meetings: AsyncIOMotorCollection = Depends(get_meetings_collection),
+	postings: AsyncIOMotorCollection = Depends(get_postings_collection),
+	search_stats: AsyncIOMotorCollection = Depends(get_search_stats_collection),
+) -> dict[str, Any]:
+	results = await search_meetings(
+		postings, search_stats, meetings, current_user, q, limit=limit, hits_per_meeting=hits
+	)
+	return {"query": q, "results": results}
+
+
+@router.get("/meetings/{meeting_id}", summary="Get one processed meeting")
+async def meeting_detail(
+	meeting_id: str,
+	transcript: bool = Query(True, description="Include the full transcript"),
+	words: bool = Query(False, description="Include per-word timings"),
+	start: float | None = Query(None, ge=0, description="Only words from this second on"),
+	end: float | None = Query(None, ge=0, description="Only words before this second"),
+	current_user: str = Depends(get_current_user),
+	meetings: AsyncIOMotorCollection = Depends(get_meetings_collection),
+) -> dict[str, Any]:
+	meeting = None
+	if ObjectId.is_valid(meeting_id):
+		meeting = await get_meeting(
+			meetings,
+			current_user,
+			meeting_id,
+			include_transcript=transcript,
+			include_words=words,
+			start=start,
+			end=end,
+		)
+	if meeting is None:
+		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Meeting not found.")
+	return meeting
+
+
+@router.get(
+	"/meetings/{meeting_id}/audio",
+	summary="Stream a meeting's recording, or one time range of it",
+	response_class=StreamingResponse,
+	responses={
+		200: {"content": {"audio/wav": {}}, "description": "WAV audio"},
+		206: {"content": {"audio/wav": {}}, "description": "Requested byte range"},
+	},
+)
+async def meeting_audio(
+	meeting_id: str,
+	start: float = Query(0.0, ge=0, description="Segment start in seconds"),
+	end: float | None = Query(None, ge=0, description="Segment end in seconds (default: end of recording)"),
+	range_header: str | None = Header(None, alias="Range"),
+	current_user: str = Depends(get_current_user),
+	meetings: AsyncIOMotorCollection = Depends(get_meetings_collection),
+) -> StreamingResponse:
+	audio_file = None
+	if ObjectId.is_valid(meeting_id):
+		audio_file = await get_meeting_audio(meetings, current_user, meeting_id)
+	path = UPLOAD_DIR / audio_file if audio_file else None
+	if path is None or not path.is_file():
+		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Recording not found.")
+
+	# The segment is a standalone WAV whose bytes map straight onto file
+	# offsets, so both the time range and any HTTP Range are O(1) seeks
+	try:
+		segment = audio_segment(path, start, end)
+	except ValueError as exc:
+		raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+	headers = {"Accept-Ranges": "bytes"}
+	try:
+		byte_range = parse_range(range_header, segment.size)
+	except RangeNotSatisfiableError:
+		raise HTTPException(
+			# The status constant was renamed across Starlette versions
+			status_code=416,
+			detail="Requested range not satisfiable.",
+			headers={"Content-Range": f"bytes */{segment.size}"},
+		)
+
+	if byte_range is None:
+		headers["Content-Length"] = str(segment.size)
+		return StreamingResponse(segment.iter_bytes(), media_type="audio/wav", headers=headers)
+
+	first, last = byte_range
+	headers["Content-Range"] = f"bytes {first}-{last}/{segment.size}"
+	headers["Content-Length"] = str(last - first + 1)
+	return StreamingResponse(
+		segment.iter_bytes(first, last),
+		status_code=status.HTTP_206_PARTIAL_CONTENT,
+		media_type="audio/wav",
+		headers=headers,
+	)
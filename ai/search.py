@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from typing import Any
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+from src.transcripter.search_index import build_postings, query_terms, rank_meetings
+
+
+async def index_meeting(
+	postings: AsyncIOMotorCollection,
+	stats: AsyncIOMotorCollection,
+	user_id: str,
+	meeting_id: str,
+	words: list[dict],
+) -> int:
+	"""
+	Add one meeting's postings to the user's search index.
+
+	Returns:
+		Number of distinct terms indexed
+	"""
+	owner = ObjectId(user_id)
+	meeting = ObjectId(meeting_id)
+	docs = [
+		{
+			"user_id": owner,
+			"term": term,
+			"meeting_id": meeting,
+			"tf": len(entry.offsets),
+			"doc_len": len(words),
+			"offsets": entry.offsets,
+			"times_ms": entry.times_ms,
+		}
+		for term, entry in build_postings(words).items()
+	]
+	if docs:
+		await postings.insert_many(docs, ordered=False)
+	await stats.update_one({"_id": owner}, {"$inc": {"meetings": 1, "words": len(words)}}, upsert=True)
+	return len(docs)
+
+
+async def search_meetings(
+	postings: AsyncIOMotorCollection,
+	stats: AsyncIOMotorCollection,
+	meetings: AsyncIOMotorCollection,
+	user_id: str,
+	query: str,
+	*,
+	limit: int = 20,
+	hits_per_meeting: int = 10,
+) -> list[dict[str, Any]]:
+	"""Rank the user's meetings for a query, with the audio position of each hit."""
+	terms = query_terms(query)
+	owner = ObjectId(user_id)
+	corpus = await stats.find_one({"_id": owner})
+	if not terms or not corpus or not corpus.get("meetings"):
+		return []
+
+	# Only the first few occurrences are fetched; tf carries the full count
+	cursor = postings.find(
+		{"user_id": owner, "term": {"$in": terms}},
+		{
+			"term": 1,
+			"meeting_id": 1,
+			"tf": 1,
+			"doc_len": 1,
+			"offsets": {"$slice": hits_per_meeting},
+			"times_ms": {"$slice": hits_per_meeting},
+		},
+	)
+	term_postings: dict[str, dict[str, Any]] = {}
+	doc_lens: dict[str, int] = {}
+	async for doc in cursor:
+		meeting_id = str(doc["meeting_id"])
+		term_postings.setdefault(doc["term"], {})[meeting_id] = doc
+		doc_lens[meeting_id] = doc.get("doc_len", 0)
+
+	avg_doc_len = corpus.get("words", 0) / corpus["meetings"]
+	ranked = rank_meetings(term_postings, corpus["meetings"], avg_doc_len, doc_lens, limit, hits_per_meeting)
+	if not ranked:
+		return []
+
+	details = {
+		str(doc["_id"]): doc
+		async for doc in meetings.find(
+			{"_id": {"$in": [ObjectId(hit.meeting_id) for hit in ranked]}},
+			{"filename": 1, "created_at": 1},
+		)
+	}
+	results = []
+	for hit in ranked:
+		meta = details.get(hit.meeting_id, {})
+		created_at = meta.get("created_at")
+		results.append({
+			"meeting_id": hit.meeting_id,
+			"filename": meta.get("filename"),
+			"created_at": created_at.isoformat() if created_at else None,
+			"score": hit.score,
+			"hits": hit.hits,
+		})
+	return results
@@ -1,21 +1,29 @@
 from __future__ import annotations
 
-from functools import lru_cache
+import os
 from typing import Iterable
 
-from transformers import pipeline
+from src.transcripter.backends import load_summarization_pipeline
+from src.transcripter.registry import get_registry
+from .metrics import MODEL_LOAD_SECONDS, STAGE_SECONDS
 
 
 DEFAULT_MODEL = "t5-small"
+# "pytorch" (fp32), "quantized" (int8 dynamic) or "onnx" (ONNX Runtime)
+SUMMARIZER_BACKEND = os.environ.get("SUMMARIZER_BACKEND", "pytorch")
 
 
 class SummarizationError(RuntimeError):
 	"""Raised when summarization fails."""
 
 
-@lru_cache(maxsize=1)
-def _get_pipeline(model_name: str = DEFAULT_MODEL):
-	return pipeline("summarization", model=model_name, tokenizer=model_name, device=-1)
+def _get_pipeline(model_name: str = DEFAULT_MODEL, backend: str = SUMMARIZER_BACKEND):
+	def load():
+		# Only runs on a registry miss, so this times actual loads
+		with MODEL_LOAD_SECONDS.time(kind="summarization", model=f"{model_name}/{backend}"):
+			return load_summarization_pipeline(model_name, backend)
+
+	return get_registry().get(("summarization", model_name, backend), load)
 
 
 def _chunk_text(text: str, max_chars: int = 1500) -> Iterable[str]:
@@ -40,6 +48,11 @@ def summarize_text(text: str, *, model_name: str = DEFAULT_MODEL) -> str:
 	if not text or len(text.strip()) < 80:
 		return text.strip()
 
+	with STAGE_SECONDS.time(stage="summarization"):
+		return _summarize(text, model_name)
+
+
+def _summarize(text: str, model_name: str) -> str:
 	try:
 		pipe = _get_pipeline(model_name)
 	except Exception as exc:  # pragma: no cover
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import json
 import os
+import time
 import wave
 from functools import lru_cache
 from pathlib import Path
 
 from vosk import KaldiRecognizer, Model
 
+from .metrics import AUDIO_SECONDS, MODEL_LOAD_SECONDS, STAGE_SECONDS, TRANSCRIPTION_RTF
+
 # Path to Vosk model
 MODEL_PATH = Path(
     os.environ.get("VOSK_MODEL_PATH", "models/vosk-model-small-en-us-0.15")
@@ -29,7 +33,8 @@ def _ensure_model_path() -> Path:
 @lru_cache(maxsize=1)
 def _load_model() -> Model:
     model_path = _ensure_model_path()
-    return Model(str(model_path))
+    with MODEL_LOAD_SECONDS.time(kind="vosk", model=model_path.name):
+        return Model(str(model_path))
 
 
 def transcribe_audio(file_path: str | Path) -> str:
@@ -37,6 +42,18 @@ def transcribe_audio(file_path: str | Path) -> str:
     Transcribe a local audio file (.wav only) using a local Vosk model.
     Render-compatible version (no ffmpeg/pydub).
     """
+    transcript, _ = transcribe_audio_with_words(file_path)
+    return transcript
+
+
+def transcribe_audio_with_words(file_path: str | Path) -> tuple[str, list[dict]]:
+    """
+    Transcribe a local .wav file and also return Vosk's word timings.
+
+    Returns:
+        (transcript, words) where each word is a dict with "word", "start",
+        "end" (seconds) and "conf"
+    """
 
     source_path = Path(file_path)
     if not source_path.exists():
@@ -50,46 +67,58 @@ def transcribe_audio(file_path: str | Path) -> str:
 
     # Read WAV directly
     with wave.open(str(source_path), "rb") as wf:
-        # Must be 16kHz mono PCM 16-bit
-        if (
-            wf.getnchannels() != 1
-            or wf.getframerate() != 16000
-            or wf.getsampwidth() != 2
-        ):
-            raise TranscriptionError(
-                "WAV file must be 16-bit PCM, mono, 16kHz."
-            )
-
-        return _run_recognizer(model, wf)
-
-
-def _run_recognizer(model: Model, wf: wave.Wave_read) -> str:
+        with STAGE_SECONDS.time(stage="wav_validation"):
+            # Must be 16kHz mono PCM 16-bit
+            if (
+                wf.getnchannels() != 1
+                or wf.getframerate() != 16000
+                or wf.getsampwidth() != 2
+            ):
+                raise TranscriptionError(
+                    "WAV file must be 16-bit PCM, mono, 16kHz."
+                )
+            audio_seconds = wf.getnframes() / wf.getframerate()
+
+        start = time.perf_counter()
+        result = _run_recognizer(model, wf)
+        elapsed = time.perf_counter() - start
+
+    STAGE_SECONDS.observe(elapsed, stage="vosk_decode")
+    AUDIO_SECONDS.inc(audio_seconds)
+    if audio_seconds > 0:
+        TRANSCRIPTION_RTF.observe(elapsed / audio_seconds)
+    return result
+
+
+def _run_recognizer(model: Model, wf: wave.Wave_read) -> tuple[str, list[dict]]:
     rec = KaldiRecognizer(model, wf.getframerate())
     rec.SetWords(True)
 
     transcript_parts = []
+    words: list[dict] = []
 
     while True:
         data = wf.readframes(4000)
         if len(data) == 0:
             break
         if rec.AcceptWaveform(data):
-            text = _extract_text(rec.Result())
+            text, result_words = _parse_result(rec.Result())
             if text:
                 transcript_parts.append(text)
+                words.extend(result_words)
 
-    final_text = _extract_text(rec.FinalResult())
+    final_text, final_words = _parse_result(rec.FinalResult())
     if final_text:
         transcript_parts.append(final_text)
+        words.extend(final_words)
 
-    return " ".join(part.strip() for part in transcript_parts if part.strip()).strip()
-
+    transcript = " ".join(part.strip() for part in transcript_parts if part.strip()).strip()
+    return transcript, words
 
-def _extract_text(result: str) -> str:
-    import json
 
+def _parse_result(result: str) -> tuple[str, list[dict]]:
     try:
         data = json.loads(result)
-        return data.get("text", "")
+        return data.get("text", ""), data.get("result", [])
     except json.JSONDecodeError:
-        return ""
+        return "", []
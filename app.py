@@ -1,8 +1,13 @@
+from contextlib import asynccontextmanager
+
 from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 
+from auth.database import close_database, init_database
 from auth.routes import router as auth_router
 from auth.routes import get_current_user
+from ai.metrics import CONTENT_TYPE, render_metrics
 from ai.routes import router as ai_router
 
 
@@ -30,7 +35,14 @@ def test_backend():
 @app.get("/api/health")
 def health():
     return {"status": "ok", "message": "Backend is connected successfully ✅"}
-app = FastAPI(title="Smart Meeting Minutes API", version="1.0.0")
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+	await init_database()
+	yield
+	close_database()
+
+
+app = FastAPI(title="Smart Meeting Minutes API", version="1.0.0", lifespan=lifespan)
 
 app.add_middleware(
 	CORSMiddleware,
@@ -49,6 +61,12 @@ def root() -> dict[str, str]:
 	return {"status": "ok", "message": "Smart Meeting Minutes API"}
 
 
+@app.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+	# Prometheus text format: stage latency histograms, throughput, caches, queues
+	return Response(render_metrics(), media_type=CONTENT_TYPE)
+
+
 @app.get("/test")
 def test_backend() -> dict[str, str]:
 	return {"message": "Backend is running"}
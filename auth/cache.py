@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, TypeVar
+
+
+AUTH_CACHE_TTL_SECONDS = float(os.getenv("AUTH_CACHE_TTL_SECONDS", "60"))
+AUTH_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_CACHE_MAX_ENTRIES", "10000"))
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLCache(Generic[V]):
+	"""Thread-safe LRU cache whose entries also expire after a time-to-live."""
+
+	def __init__(self, max_entries: int = AUTH_CACHE_MAX_ENTRIES, ttl: float = AUTH_CACHE_TTL_SECONDS) -> None:
+		self.max_entries = max_entries
+		self.ttl = ttl
+		self.hits = 0
+		self.misses = 0
+		self._data: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+		self._lock = threading.Lock()
+
+	def get(self, key: Hashable, default: Any = None) -> V | Any:
+		now = time.monotonic()
+		with self._lock:
+			entry = self._data.get(key, _MISSING)
+			if entry is _MISSING or entry[0] <= now:
+				if entry is not _MISSING:
+					del self._data[key]
+				self.misses += 1
+				return default
+			self._data.move_to_end(key)
+			self.hits += 1
+			return entry[1]
+
+	def set(self, key: Hashable, value: V, ttl: float | None = None) -> None:
+		ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+		if ttl <= 0:
+			return
+		with self._lock:
+			self._data[key] = (time.monotonic() + ttl, value)
+			self._data.move_to_end(key)
+			while len(self._data) > self.max_entries:
+				self._data.popitem(last=False)
+
+	def pop(self, key: Hashable) -> None:
+		with self._lock:
+			self._data.pop(key, None)
+
+	def clear(self) -> None:
+		with self._lock:
+			self._data.clear()
+
+	def stats(self) -> dict[str, int | float]:
+		with self._lock:
+			lookups = self.hits + self.misses
+			return {
+				"entries": len(self._data),
+				"hits": self.hits,
+				"misses": self.misses,
+				"hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+			}
+
+
+# Verified token -> user id, expiring no later than the token itself
+token_cache: TTLCache[str] = TTLCache()
+# User ids confirmed to exist in the users collection
+user_cache: TTLCache[bool] = TTLCache()
+
+
+def invalidate_user(user_id: str) -> None:
+	"""
+	Forget that a user exists, e.g. after deleting it.
+
+	Cached tokens of the user stay verified, but every request re-checks the
+	user cache, so the next one hits the database and gets a 401.
+	"""
+	user_cache.pop(user_id)
+
+
+def cache_stats() -> dict[str, dict[str, int | float]]:
+	return {"tokens": token_cache.stats(), "users": user_cache.stats()}
@@ -1,14 +1,77 @@
+from __future__ import annotations
+
 import os
-from pymongo import MongoClient
 
-# Get MONGO_URI from environment (Render or local .env)
-MONGO_URI = os.getenv("MONGO_URI")
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection, AsyncIOMotorDatabase
 
-# Connect to Atlas
-client = MongoClient(MONGO_URI)
+# Get MONGO_URI from environment (Render or local .env).
+# "mongomock://" selects an in-memory stand-in (pip install mongomock-motor) for tests.
+MONGO_URI = os.getenv("MONGO_URI")
 
 # Database name (you choose)
-db = client["meeting_app"]
+MONGO_DB_NAME = os.getenv("MONGO_DB_NAME", "meeting_app")
+
+# Connection pool
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", "50"))
+MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", "0"))
+MONGO_MAX_IDLE_TIME_MS = int(os.getenv("MONGO_MAX_IDLE_TIME_MS", "300000"))
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "5000"))
+
+IN_MEMORY_URI = "mongomock://"
+
+_client: AsyncIOMotorClient | None = None
+
+
+def get_client() -> AsyncIOMotorClient:
+	"""Shared client, created on first use inside the running event loop."""
+	global _client
+	if _client is None:
+		if MONGO_URI == IN_MEMORY_URI:
+			from mongomock_motor import AsyncMongoMockClient
+
+			_client = AsyncMongoMockClient()
+		else:
+			_client = AsyncIOMotorClient(
+				MONGO_URI,
+				maxPoolSize=MONGO_MAX_POOL_SIZE,
+				minPoolSize=MONGO_MIN_POOL_SIZE,
+				maxIdleTimeMS=MONGO_MAX_IDLE_TIME_MS,
+				serverSelectionTimeoutMS=MONGO_SERVER_SELECTION_TIMEOUT_MS,
+			)
+	return _client
+
+
+def get_database() -> AsyncIOMotorDatabase:
+	return get_client()[MONGO_DB_NAME]
+
+
+def get_users_collection() -> AsyncIOMotorCollection:
+	return get_database()["users"]
+
+
+def get_meetings_collection() -> AsyncIOMotorCollection:
+	return get_database()["meetings"]
+
+
+def get_postings_collection() -> AsyncIOMotorCollection:
+	return get_database()["postings"]
+
+
+def get_search_stats_collection() -> AsyncIOMotorCollection:
+	return get_database()["search_stats"]
+
+
+async def init_database() -> None:
+	"""Create indexes; safe to run on every startup."""
+	await get_users_collection().create_index("email", unique=True, name="email_unique")
+	# Per-user history, newest first (ObjectIds are time ordered)
+	await get_meetings_collection().create_index([("user_id", 1), ("_id", -1)], name="user_history")
+	# Transcript search: one postings document per (user, term, meeting)
+	await get_postings_collection().create_index([("user_id", 1), ("term", 1)], name="user_term")
+
 
-# Collections
-users_collection = db["users"]
+def close_database() -> None:
+	global _client
+	if _client is not None:
+		_client.close()
+		_client = None
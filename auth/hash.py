@@ -1,12 +1,30 @@
 from __future__ import annotations
 
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
 import bcrypt
 
 
-def hash_password(password: str) -> str:
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+BCRYPT_WORKERS = int(os.getenv("BCRYPT_WORKERS", str(min(4, os.cpu_count() or 1))))
+# Requests allowed to wait for a bcrypt worker before new ones are rejected
+BCRYPT_MAX_QUEUE = int(os.getenv("BCRYPT_MAX_QUEUE", "64"))
+
+T = TypeVar("T")
+
+
+class HashingBusyError(RuntimeError):
+	"""Raised when too many password hashes are already queued."""
+
+
+def hash_password(password: str, rounds: int = BCRYPT_ROUNDS) -> str:
 	if not password:
 		raise ValueError("Password cannot be empty.")
-	return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+	return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=rounds)).decode("utf-8")
 
 
 def verify_password(password: str, hashed_password: str) -> bool:
@@ -16,3 +34,77 @@ def verify_password(password: str, hashed_password: str) -> bool:
 		return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
 	except ValueError:
 		return False
+
+
+class PasswordHasher:
+	"""
+	Runs bcrypt on its own bounded thread pool.
+
+	bcrypt releases the GIL, so a few dedicated threads keep password work
+	off the event loop and out of the shared request threadpool. At most
+	workers + max_queue calls are admitted at once; beyond that calls fail
+	fast with HashingBusyError instead of piling up.
+	"""
+
+	def __init__(
+		self,
+		workers: int = BCRYPT_WORKERS,
+		max_queue: int = BCRYPT_MAX_QUEUE,
+		rounds: int = BCRYPT_ROUNDS,
+	) -> None:
+		self.workers = workers
+		self.max_queue = max_queue
+		self.rounds = rounds
+		self.rejected = 0
+		self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+		self._slots = threading.BoundedSemaphore(workers + max_queue)
+		self._in_flight = 0
+		self._lock = threading.Lock()
+
+	def _release(self, _future: object) -> None:
+		with self._lock:
+			self._in_flight -= 1
+		self._slots.release()
+
+	async def _run(self, fn: Callable[..., T], *args: object) -> T:
+		if not self._slots.acquire(blocking=False):
+			with self._lock:
+				self.rejected += 1
+			raise HashingBusyError("Too many login attempts in progress. Please retry shortly.")
+		with self._lock:
+			self._in_flight += 1
+		future = self._executor.submit(fn, *args)
+		# Released when the hash finishes, even if the request was cancelled
+		future.add_done_callback(self._release)
+		return await asyncio.wrap_future(future)
+
+	async def hash(self, password: str) -> str:
+		return await self._run(hash_password, password, self.rounds)
+
+	async def verify(self, password: str, hashed_password: str) -> bool:
+		return await self._run(verify_password, password, hashed_password)
+
+	def stats(self) -> dict[str, int]:
+		with self._lock:
+			return {
+				"workers": self.workers,
+				"max_queue": self.max_queue,
+				"rounds": self.rounds,
+				"in_flight": self._in_flight,
+				"rejected": self.rejected,
+			}
+
+	def shutdown(self) -> None:
+		self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_default_hasher: PasswordHasher | None = None
+_default_lock = threading.Lock()
+
+
+def get_password_hasher() -> PasswordHasher:
+	global _default_hasher
+	with _default_lock:
+		if _default_hasher is None:
+			_default_hasher = PasswordHasher()
+		return _default_hasher
@@ -1,22 +1,45 @@
 from __future__ import annotations
 
+import time
+from typing import Any
+
 from bson import ObjectId
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from pymongo.collection import Collection
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo.errors import DuplicateKeyError
+
+from ai.meetings import delete_user_data
 
-from .database import users_collection
-from .hash import hash_password, verify_password
+from .cache import cache_stats, invalidate_user, token_cache, user_cache
+from .database import (
+	get_meetings_collection,
+	get_postings_collection,
+	get_search_stats_collection,
+	get_users_collection,
+)
+from .hash import HashingBusyError, get_password_hasher
 from .models import User, UserLogin
-from .token import create_token, decode_token
+from .token import create_token, decode_token_with_expiry
 
 router = APIRouter(prefix="", tags=["auth"])
 
 bearer_scheme = HTTPBearer(auto_error=False)
 
 
-def get_users_collection() -> Collection:
-	return users_collection
+def _busy(exc: HashingBusyError) -> HTTPException:
+	return HTTPException(
+		status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+		detail=str(exc),
+		headers={"Retry-After": "1"},
+	)
+
+
+def _user_exists() -> HTTPException:
+	return HTTPException(
+		status_code=status.HTTP_400_BAD_REQUEST,
+		detail="User already exists. Please log in instead.",
+	)
 
 
 def _extract_token(credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme)) -> str:
@@ -29,19 +52,31 @@ def _extract_token(credentials: HTTPAuthorizationCredentials | None = Depends(be
 	return token
 
 
-def get_current_user(token: str = Depends(_extract_token)) -> str:
-	try:
-		user_id = decode_token(token)
-	except ValueError as exc:
-		raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(exc)) from exc
+async def get_current_user(
+	token: str = Depends(_extract_token),
+	collection: AsyncIOMotorCollection = Depends(get_users_collection),
+) -> str:
+	# Verified tokens and known users are cached, so polling endpoints skip
+	# both the JWT signature check and the database round trip
+	user_id = token_cache.get(token)
+	if user_id is None:
+		try:
+			user_id, expires_at = decode_token_with_expiry(token)
+		except ValueError as exc:
+			raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(exc)) from exc
+
+		if not ObjectId.is_valid(user_id):
+			raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid user id in token.")
 
-	if not ObjectId.is_valid(user_id):
-		raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid user id in token.")
+		user_id = str(ObjectId(user_id))
+		token_cache.set(token, user_id, ttl=expires_at - time.time())
 
-	user = users_collection.find_one({"_id": ObjectId(user_id)})
-	if not user:
-		raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found or deleted.")
-	return str(user["_id"])
+	if not user_cache.get(user_id):
+		user = await collection.find_one({"_id": ObjectId(user_id)}, {"_id": 1})
+		if not user:
+			raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found or deleted.")
+		user_cache.set(user_id, True)
+	return user_id
 
 
 @router.post(
@@ -49,16 +84,24 @@ def get_current_user(token: str = Depends(_extract_token)) -> str:
 	summary="Create a new account",
 	status_code=status.HTTP_201_CREATED,
 )
-def register(user: User, collection: Collection = Depends(get_users_collection)) -> dict[str, str]:
+async def register(
+	user: User,
+	collection: AsyncIOMotorCollection = Depends(get_users_collection),
+) -> dict[str, str]:
 	email = user.email.lower()
-	if collection.find_one({"email": email}):
-		raise HTTPException(
-			status_code=status.HTTP_400_BAD_REQUEST,
-			detail="User already exists. Please log in instead.",
-		)
+	# Cheap indexed pre-check so known emails skip the bcrypt work
+	if await collection.find_one({"email": email}, {"_id": 1}):
+		raise _user_exists()
 
-	hashed_password = hash_password(user.password)
-	result = collection.insert_one({"email": email, "password": hashed_password})
+	try:
+		hashed_password = await get_password_hasher().hash(user.password)
+	except HashingBusyError as exc:
+		raise _busy(exc) from exc
+	try:
+		result = await collection.insert_one({"email": email, "password": hashed_password})
+	except DuplicateKeyError as exc:
+		# Lost a race with a concurrent registration; the unique index decides
+		raise _user_exists() from exc
 	return {
 		"message": "User registered successfully",
 		"user_id": str(result.inserted_id),
@@ -82,10 +125,17 @@ def register(user: User, collection: Collection = Depends(get_users_collection))
 		},
 	},
 )
-def login(credentials: UserLogin, collection: Collection = Depends(get_users_collection)) -> dict[str, str]:
+async def login(
+	credentials: UserLogin,
+	collection: AsyncIOMotorCollection = Depends(get_users_collection),
+) -> dict[str, str]:
 	email = credentials.email.lower()
-	user = collection.find_one({"email": email})
-	if not user or not verify_password(credentials.password, user.get("password", "")):
+	user = await collection.find_one({"email": email}, {"password": 1})
+	try:
+		valid = bool(user) and await get_password_hasher().verify(credentials.password, user.get("password", ""))
+	except HashingBusyError as exc:
+		raise _busy(exc) from exc
+	if not valid:
 		raise HTTPException(
 			status_code=status.HTTP_401_UNAUTHORIZED,
 			detail="Invalid email or password. Please try again.",
@@ -103,3 +153,23 @@ def profile(current_user: str = Depends(get_current_user)) -> dict[str, str]:
 @router.get("/test-protected", summary="Verify auth works", tags=["auth"])
 def auth_test_protected(current_user: str = Depends(get_current_user)) -> dict[str, str]:
 	return {"message": "You are authorized", "user_id": current_user}
+
+
+@router.delete("/profile", summary="Delete your account and all its meetings")
+async def delete_profile(
+	current_user: str = Depends(get_current_user),
+	collection: AsyncIOMotorCollection = Depends(get_users_collection),
+	meetings: AsyncIOMotorCollection = Depends(get_meetings_collection),
+	postings: AsyncIOMotorCollection = Depends(get_postings_collection),
+	search_stats: AsyncIOMotorCollection = Depends(get_search_stats_collection),
+) -> dict[str, Any]:
+	# The account goes first so its token stops working before the data does
+	await collection.delete_one({"_id": ObjectId(current_user)})
+	invalidate_user(current_user)
+	deleted = await delete_user_data(meetings, postings, search_stats, current_user)
+	return {"message": "Account deleted", "user_id": current_user, "deleted": deleted}
+
+
+@router.get("/cache-stats", summary="Auth lookup cache hit rates")
+def auth_cache_stats(_: str = Depends(get_current_user)) -> dict[str, dict[str, int | float]]:
+	return cache_stats()
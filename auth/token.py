@@ -20,12 +20,17 @@ def create_token(user_id: str, expires_delta: timedelta | None = None) -> str:
 	return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
 
 
-def decode_token(token: str) -> str:
+def decode_token_with_expiry(token: str) -> tuple[str, float]:
+	"""Return the user id and the expiry (Unix time) of a valid token."""
 	try:
 		payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
 		user_id: str | None = payload.get("sub")
 		if not user_id:
 			raise JWTError("Token missing subject")
-		return user_id
+		return user_id, float(payload.get("exp", 0))
 	except JWTError as exc:
 		raise ValueError("Invalid or expired token") from exc
+
+
+def decode_token(token: str) -> str:
+	return decode_token_with_expiry(token)[0]
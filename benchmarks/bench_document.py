@@ -0,0 +1,91 @@
+"""
+Benchmark shared Document analysis against per-extractor re-analysis.
+
+Runs action items, highlights, topics and the CLI highlight report on a
+synthetic 100k-word transcript, once with each extractor analyzing the raw
+string itself and once with a single shared Document.
+
+Usage:
+    python -m benchmarks.bench_document [--words 100000] [--repeats 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+
+from src.transcripter.action_items import extract_action_items
+from src.transcripter.cli import _extract_highlights as extract_highlight_report
+from src.transcripter.document import Document
+from src.transcripter.highlights import extract_highlights
+from src.transcripter.topics import extract_topics
+
+
+SENTENCES = [
+    "We decided to raise the marketing budget by 10% next quarter.",
+    "Revenue growth was significant in the enterprise segment this month.",
+    "John will finish the churn report before Friday.",
+    "Let's move on to the next item on the agenda.",
+    "The final decision is to hire two more support engineers.",
+    "Pricing is important for our main market in Europe.",
+    "Um yeah so I think that covers it for the infrastructure side.",
+    "Marketing should deliver the new campaign by March!",
+    "Our forecast looks good and the deal pipeline is strong.",
+    "We need to complete the database migration before the freeze.",
+    "The board announced $5 million in new funding.",
+    "Customers asked about retention discounts on annual contracts.",
+]
+
+
+def make_transcript(words: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    parts: list[str] = []
+    count = 0
+    while count < words:
+        sentence = rng.choice(SENTENCES)
+        parts.append(sentence)
+        count += len(sentence.split())
+    return " ".join(parts)
+
+
+def run_separate(transcript: str) -> None:
+    extract_action_items(transcript)
+    extract_highlights(transcript)
+    extract_topics(transcript)
+    extract_highlight_report(transcript)
+
+
+def run_shared(transcript: str) -> None:
+    doc = Document.from_text(transcript)
+    extract_action_items(doc)
+    extract_highlights(doc)
+    extract_topics(doc)
+    extract_highlight_report(doc)
+
+
+def _time(fn, transcript: str, repeats: int) -> list[float]:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(transcript)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--words", type=int, default=100_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    transcript = make_transcript(args.words)
+    print(f"transcript: {len(transcript.split())} words, {len(transcript)} chars")
+    for name, fn in (("separate", run_separate), ("shared Document", run_shared)):
+        timings = _time(fn, transcript, args.repeats)
+        print(f"{name:<16} median {statistics.median(timings) * 1000:8.1f} ms  min {min(timings) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark login throughput of the bcrypt executor.
+
+Fires a burst of concurrent password verifications through PasswordHasher
+for each worker count and reports logins/s, latency percentiles, rejected
+requests and the worst event-loop stall observed meanwhile (a ticker
+coroutine that should keep running every millisecond).
+
+Usage:
+    python -m benchmarks.bench_login [--rounds 12] [--workers 1 2 4] [--logins 64] [--max-queue 64]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import bcrypt
+
+from auth.hash import HashingBusyError, PasswordHasher
+
+
+async def _ticker(stop: asyncio.Event, lags: list[float]) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append(time.perf_counter() - start - 0.001)
+
+
+async def _login(hasher: PasswordHasher, password: str, hashed: str, latencies: list[float]) -> bool:
+    start = time.perf_counter()
+    try:
+        ok = await hasher.verify(password, hashed)
+    except HashingBusyError:
+        return False
+    latencies.append(time.perf_counter() - start)
+    return ok
+
+
+async def run(workers: int, max_queue: int, rounds: int, logins: int, hashed: str) -> None:
+    hasher = PasswordHasher(workers=workers, max_queue=max_queue, rounds=rounds)
+    latencies: list[float] = []
+    lags: list[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(stop, lags))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_login(hasher, "SuperSecret123", hashed, latencies) for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await ticker
+    hasher.shutdown()
+
+    latencies.sort()
+    p95 = latencies[int(0.95 * (len(latencies) - 1))] if latencies else 0.0
+    print(
+        f"workers {workers:>2}  {len(latencies) / elapsed:7.1f} logins/s  "
+        f"p50 {statistics.median(latencies) * 1000 if latencies else 0:7.1f} ms  p95 {p95 * 1000:7.1f} ms  "
+        f"rejected {hasher.rejected:>3}  max loop stall {max(lags, default=0) * 1000:5.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--logins", type=int, default=64, help="Concurrent logins per burst")
+    parser.add_argument("--max-queue", type=int, default=64)
+    args = parser.parse_args()
+
+    hashed = bcrypt.hashpw(b"SuperSecret123", bcrypt.gensalt(rounds=args.rounds)).decode("utf-8")
+    print(f"bcrypt cost {args.rounds}, {args.logins} concurrent logins, queue limit {args.max_queue}")
+    for workers in args.workers:
+        asyncio.run(run(workers, args.max_queue, args.rounds, args.logins, hashed))
+
+
+if __name__ == "__main__":
+    main()
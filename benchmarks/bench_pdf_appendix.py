@@ -0,0 +1,99 @@
+"""
+Benchmark PDF export with a full-transcript appendix.
+
+Renders a synthetic transcript (one timestamped line per utterance) once
+with the appendix flowables generated lazily from the line iterator and
+once with the whole story materialized as a list up front, and reports
+pages per second and peak traced memory for each.
+
+Usage:
+    python -m benchmarks.bench_pdf_appendix [--minutes 180] [--repeats 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import statistics
+import tempfile
+import time
+import tracemalloc
+from itertools import chain
+from typing import Iterator
+
+from reportlab.lib.pagesizes import letter
+from reportlab.platypus import SimpleDocTemplate
+
+from src.transcripter.pdf_export import _appendix_flowables, _build_story, write_pdf
+
+
+SUMMARY = "The team reviewed the quarterly roadmap and agreed on the release plan."
+ACTION_ITEMS = ["- John will finish the churn report before Friday", "- Marketing should deliver the campaign by March"]
+HIGHLIGHTS = ["- We decided to raise the marketing budget by 10% next quarter"]
+TOPICS = ["Roadmap", "Budget", "Release"]
+
+UTTERANCES = [
+    "okay so let's get started with the roadmap review for this quarter",
+    "we decided to raise the marketing budget by ten percent next quarter",
+    "john will finish the churn report before friday and share it with everyone",
+    "the database migration needs more testing before the freeze",
+    "customers asked about retention discounts on annual contracts",
+    "let's move on to the next item on the agenda",
+]
+
+
+def transcript_lines(minutes: int) -> Iterator[str]:
+    """Roughly 12 utterances per minute, like a busy meeting."""
+    for index in range(minutes * 12):
+        seconds = index * 5
+        yield f"[{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}] {UTTERANCES[index % len(UTTERANCES)]}"
+
+
+def render_lazy(path: str, minutes: int) -> None:
+    write_pdf(SUMMARY, ACTION_ITEMS, HIGHLIGHTS, TOPICS, path, transcript=transcript_lines(minutes))
+
+
+def render_eager(path: str, minutes: int) -> None:
+    story = list(chain(
+        _build_story(SUMMARY, ACTION_ITEMS, HIGHLIGHTS, TOPICS),
+        _appendix_flowables(transcript_lines(minutes)),
+    ))
+    SimpleDocTemplate(path, pagesize=letter).build(story)
+
+
+def count_pages(path: str) -> int:
+    with open(path, "rb") as handle:
+        return len(re.findall(rb"/Type /Page\b", handle.read()))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--minutes", type=int, default=180)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "report.pdf")
+        for name, fn in (("lazy appendix", render_lazy), ("eager story", render_eager)):
+            timings = []
+            for _ in range(args.repeats):
+                start = time.perf_counter()
+                fn(path, args.minutes)
+                timings.append(time.perf_counter() - start)
+            pages = count_pages(path)
+
+            tracemalloc.start()
+            fn(path, args.minutes)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            median = statistics.median(timings)
+            print(
+                f"{name:<14} {pages} pages  median {median:6.2f} s  "
+                f"{pages / median:7.1f} pages/s  peak {peak / 1024 / 1024:7.1f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Compare summarization backends on latency, peak memory and output similarity.
+
+Each backend runs in its own subprocess so peak RSS is measured in isolation.
+Outputs are compared word-by-word against the fp32 PyTorch baseline.
+
+Usage:
+    python -m benchmarks.bench_summarize_backends [transcript.txt] \
+        --model t5-small --backends pytorch quantized onnx --repeats 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+
+SAMPLE_TEXT = (
+    "Good morning everyone, thanks for joining the quarterly planning meeting. "
+    "Revenue grew twelve percent last quarter, mostly from the enterprise segment. "
+    "We decided to move the pricing update to next month so sales has time to prepare. "
+    "Maria will own the customer churn analysis and share results by Friday. "
+    "The infrastructure team needs to finish the database migration before the holiday freeze. "
+    "We agreed that hiring two more support engineers is the top priority for the budget. "
+    "Marketing is going to run a pilot campaign in the European market in March. "
+    "Finally, we discussed the retention numbers, which are stable at ninety one percent. "
+) * 6
+
+
+def _run_worker(model: str, backend: str, text: str, repeats: int) -> dict:
+    from src.transcripter.backends import load_summarization_pipeline
+    from src.transcripter.summarize import _chunk_text
+
+    start = time.perf_counter()
+    pipe = load_summarization_pipeline(model, backend)
+    load_s = time.perf_counter() - start
+
+    chunks = _chunk_text(text)
+    latencies: list[float] = []
+    outputs: list[str] = []
+    for _ in range(repeats):
+        outputs = []
+        for chunk in chunks:
+            t0 = time.perf_counter()
+            out = pipe(chunk, max_length=140, min_length=30, no_repeat_ngram_size=3, do_sample=False)
+            latencies.append(time.perf_counter() - t0)
+            outputs.append(out[0]["summary_text"])
+
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mb = peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+    return {
+        "backend": backend,
+        "load_s": load_s,
+        "chunks": len(chunks),
+        "latency_mean_s": statistics.mean(latencies),
+        "latency_p50_s": statistics.median(latencies),
+        "peak_rss_mb": peak_mb,
+        "summary": " ".join(outputs),
+    }
+
+
+def _similarity(a: str, b: str) -> float:
+    return difflib.SequenceMatcher(None, a.split(), b.split()).ratio()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("transcript", nargs="?", help="Transcript .txt to summarize (default: built-in sample)")
+    parser.add_argument("--model", default="sshleifer/distilbart-cnn-12-6")
+    parser.add_argument("--backends", nargs="+", default=["pytorch", "quantized", "onnx"])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    text = Path(args.transcript).read_text(encoding="utf-8") if args.transcript else SAMPLE_TEXT
+
+    if args.worker:
+        print(json.dumps(_run_worker(args.model, args.worker, text, args.repeats)))
+        return
+
+    results: list[dict] = []
+    for backend in args.backends:
+        cmd = [sys.executable, "-m", "benchmarks.bench_summarize_backends", "--worker", backend,
+               "--model", args.model, "--repeats", str(args.repeats)]
+        if args.transcript:
+            cmd.insert(3, args.transcript)
+        proc = subprocess.run(cmd, capture_output=True, text=True)
+        if proc.returncode != 0:
+            print(f"{backend}: failed\n{proc.stderr.strip().splitlines()[-1] if proc.stderr else ''}")
+            continue
+        results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+    if not results:
+        return
+    baseline = next((r for r in results if r["backend"] == "pytorch"), results[0])
+
+    print(f"model={args.model} chunks={baseline['chunks']} repeats={args.repeats}")
+    print(f"{'backend':<10} {'load s':>8} {'mean s':>8} {'p50 s':>8} {'peak MB':>9} {'similarity':>11}")
+    for r in results:
+        print(
+            f"{r['backend']:<10} {r['load_s']:>8.2f} {r['latency_mean_s']:>8.3f} {r['latency_p50_s']:>8.3f} "
+            f"{r['peak_rss_mb']:>9.0f} {_similarity(baseline['summary'], r['summary']):>11.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Inference Backends Module
+
+Loads summarization pipelines on CPU with a selectable backend:
+- "pytorch":   default fp32 PyTorch weights
+- "quantized": int8 dynamic-quantized PyTorch (nn.Linear layers)
+- "onnx":      exported ONNX Runtime graph (requires optimum[onnxruntime])
+
+Quantized and exported models are cached on disk so the conversion cost
+is only paid once per model and library version.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+from typing import Optional
+
+from transformers import pipeline
+
+from .summary_cache import DEFAULT_CACHE_DIR
+
+
+BACKENDS = ("pytorch", "quantized", "onnx")
+DEFAULT_BACKEND = os.environ.get("TRANSCRIPTER_BACKEND", "pytorch")
+MODEL_CACHE_DIR = Path(os.environ.get("TRANSCRIPTER_MODEL_CACHE_DIR", DEFAULT_CACHE_DIR / "models"))
+
+
+def _slug(model_name: str) -> str:
+	return re.sub(r"[^A-Za-z0-9_.-]+", "--", model_name)
+
+
+def _load_pytorch(model_name: str):
+	return pipeline(
+		"summarization",
+		model=model_name,
+		tokenizer=model_name,
+		device=-1,
+	)
+
+
+def _load_quantized(model_name: str, cache_dir: Path):
+	import torch
+	import transformers
+	from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+
+	tokenizer = AutoTokenizer.from_pretrained(model_name)
+	# Pickled modules are only loadable by the versions that wrote them
+	versions = f"torch{torch.__version__}-tf{transformers.__version__}"
+	path = cache_dir / "quantized" / f"{_slug(model_name)}-{_slug(versions)}.pt"
+
+	if path.exists():
+		model = torch.load(path, weights_only=False)
+	else:
+		model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
+		model.eval()
+		model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+		path.parent.mkdir(parents=True, exist_ok=True)
+		tmp_path = path.with_suffix(".tmp")
+		torch.save(model, tmp_path)
+		os.replace(tmp_path, path)
+
+	return pipeline("summarization", model=model, tokenizer=tokenizer, device=-1)
+
+
+def _load_onnx(model_name: str, cache_dir: Path):
+	try:
+		from optimum.onnxruntime import ORTModelForSeq2SeqLM
+	except ImportError as exc:
+		raise ImportError(
+			"optimum with onnxruntime is required for the onnx backend. "
+			"Install it with: pip install optimum[onnxruntime]"
+		) from exc
+	from transformers import AutoTokenizer
+
+	path = cache_dir / "onnx" / _slug(model_name)
+	if (path / "config.json").exists():
+		model = ORTModelForSeq2SeqLM.from_pretrained(path)
+		tokenizer = AutoTokenizer.from_pretrained(path)
+	else:
+		model = ORTModelForSeq2SeqLM.from_pretrained(model_name, export=True)
+		tokenizer = AutoTokenizer.from_pretrained(model_name)
+		model.save_pretrained(path)
+		tokenizer.save_pretrained(path)
+
+	return pipeline("summarization", model=model, tokenizer=tokenizer, device=-1)
+
+
+def load_summarization_pipeline(
+	model_name: str,
+	backend: str = DEFAULT_BACKEND,
+	cache_dir: Optional[str | Path] = None,
+):
+	"""
+	Load a CPU summarization pipeline for the requested backend.
+
+	Args:
+		model_name: Hugging Face model identifier
+		backend: One of BACKENDS
+		cache_dir: Where quantized/exported models are stored
+			(defaults to TRANSCRIPTER_MODEL_CACHE_DIR)
+
+	Returns:
+		transformers summarization pipeline
+	"""
+	if backend not in BACKENDS:
+		raise ValueError(f"Unsupported backend: {backend}. Supported: {list(BACKENDS)}")
+	cache_path = Path(cache_dir) if cache_dir is not None else MODEL_CACHE_DIR
+
+	if backend == "quantized":
+		return _load_quantized(model_name, cache_path)
+	if backend == "onnx":
+		return _load_onnx(model_name, cache_path)
+	return _load_pytorch(model_name)
@@ -0,0 +1,289 @@
+"""
+Bulk Backfill Module
+
+Re-runs process_transcript over many stored transcripts, e.g. after the
+extraction rules change. Items are dispatched in chunks to a process pool
+with a bounded number of chunks in flight, so memory stays flat however
+many transcripts there are. Results are streamed to a JSONL file in input
+order, one line per transcript.
+
+Directories are searched for the CLI's `<name>_transcript.txt` files only,
+so its summary, highlights, important-sentence and translation outputs in
+the same folder are not re-processed as transcripts.
+
+Example:
+	python -m src.transcripter.backfill outputs/ --out backfill.jsonl --skip-summary
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+
+from .idf_index import get_default_index
+from .summarize import SummarizationConfig, process_transcript
+
+
+# Transcripts written by the CLI; its other outputs share the directory
+DEFAULT_PATTERN = "*_transcript.txt"
+
+# A transcript is either its text or a path to a .txt file holding it
+BackfillItem = Union[str, "os.PathLike[str]"]
+
+
+@dataclass
+class BackfillReport:
+	"""Throughput summary of a backfill run."""
+	items: int = 0
+	errors: int = 0
+	words: int = 0
+	seconds: float = 0.0
+
+	@property
+	def items_per_second(self) -> float:
+		return self.items / self.seconds if self.seconds else 0.0
+
+	@property
+	def words_per_second(self) -> float:
+		return self.words / self.seconds if self.seconds else 0.0
+
+	def as_dict(self) -> Dict[str, Any]:
+		return {
+			**asdict(self),
+			"items_per_second": round(self.items_per_second, 2),
+			"words_per_second": round(self.words_per_second, 1),
+		}
+
+
+def _init_worker() -> None:
+	# Each process already works on its own item; keep torch and the
+	# tokenizers from spawning a thread per core in every worker
+	os.environ.setdefault("OMP_NUM_THREADS", "1")
+	os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+	try:
+		import torch
+		torch.set_num_threads(1)
+	except ImportError:
+		pass
+
+
+def _process_item(
+	item_id: Union[int, str],
+	item: BackfillItem,
+	config: Optional[SummarizationConfig],
+	skip_summary: bool,
+) -> Dict[str, Any]:
+	try:
+		if isinstance(item, str):
+			transcript = item
+		else:
+			transcript = Path(item).read_text(encoding="utf-8")
+		result = process_transcript(transcript, config, include_summary=not skip_summary)
+		return {"id": item_id, "words": len(transcript.split()), **result}
+	except Exception as exc:
+		return {"id": item_id, "error": f"{type(exc).__name__}: {exc}"}
+
+
+def _process_chunk(
+	chunk: List[Tuple[Union[int, str], BackfillItem]],
+	config: Optional[SummarizationConfig],
+	skip_summary: bool,
+) -> List[Dict[str, Any]]:
+	results = [_process_item(item_id, item, config, skip_summary) for item_id, item in chunk]
+	if config is not None and config.corpus_topics and config.update_topic_index:
+		# Merge this chunk's documents into the shared IDF index; workers are
+		# torn down without running atexit handlers
+		get_default_index().flush()
+	return results
+
+
+def _chunks(items: Iterable[BackfillItem], chunksize: int) -> Iterator[List[Tuple[Union[int, str], BackfillItem]]]:
+	"""Group items into (id, item) chunks; paths are identified by path, texts by position."""
+	numbered = (
+		(index if isinstance(item, str) else os.fspath(item), item)
+		for index, item in enumerate(items)
+	)
+	while True:
+		chunk = list(islice(numbered, chunksize))
+		if not chunk:
+			return
+		yield chunk
+
+
+def iter_backfill(
+	items: Iterable[BackfillItem],
+	config: Optional[SummarizationConfig] = None,
+	skip_summary: bool = False,
+	workers: Optional[int] = None,
+	chunksize: int = 16,
+	max_pending: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+	"""
+	Process transcripts in a process pool and yield results in input order.
+
+	Args:
+		items: Transcript texts (str) or paths (Path / os.PathLike) to .txt files
+		config: Summarization configuration used by every worker
+		skip_summary: Run only the rule-based extractors
+		workers: Worker processes (default: CPU count). Each loads its own
+			summarization model unless skip_summary is set.
+		chunksize: Transcripts sent to a worker per task
+		max_pending: Chunks in flight at once (default: 2 per worker); bounds
+			memory when items is a long lazy iterable
+
+	Yields:
+		One dict per item: id, words and the process_transcript keys, or
+		id and error if the item failed
+	"""
+	workers = workers or os.cpu_count() or 1
+	max_pending = max_pending or 2 * workers
+	chunks = _chunks(items, chunksize)
+
+	with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+		pending: Deque[Future] = deque()
+		for chunk in islice(chunks, max_pending):
+			pending.append(pool.submit(_process_chunk, chunk, config, skip_summary))
+		while pending:
+			results = pending.popleft().result()
+			# Refill before yielding so workers stay busy while results are written
+			for chunk in islice(chunks, 1):
+				pending.append(pool.submit(_process_chunk, chunk, config, skip_summary))
+			yield from results
+
+
+def backfill(
+	items: Iterable[BackfillItem],
+	output: Union[str, Path, TextIO],
+	config: Optional[SummarizationConfig] = None,
+	skip_summary: bool = False,
+	workers: Optional[int] = None,
+	chunksize: int = 16,
+	show_progress: bool = True,
+) -> BackfillReport:
+	"""
+	Re-process many transcripts and stream the results to a JSONL file.
+
+	Args:
+		items: Transcript texts (str) or paths (Path / os.PathLike) to .txt files
+		output: JSONL file path or open text handle
+		config: Summarization configuration used by every worker
+		skip_summary: Run only the rule-based extractors
+		workers: Worker processes (default: CPU count)
+		chunksize: Transcripts sent to a worker per task
+		show_progress: Print throughput while running
+
+	Returns:
+		BackfillReport with item, error and word counts and elapsed time
+	"""
+	report = BackfillReport()
+	start = time.perf_counter()
+	handle = open(output, "w", encoding="utf-8") if isinstance(output, (str, Path)) else output
+	try:
+		for result in iter_backfill(items, config, skip_summary, workers, chunksize):
+			handle.write(json.dumps(result, ensure_ascii=False) + "\n")
+			report.items += 1
+			report.words += result.get("words", 0)
+			if "error" in result:
+				report.errors += 1
+			if show_progress and report.items % (chunksize * 10) == 0:
+				elapsed = time.perf_counter() - start
+				print(
+					f"  {report.items} transcripts, {report.items / elapsed:.1f}/s, {report.errors} errors",
+					file=sys.stderr,
+				)
+	finally:
+		if handle is not output:
+			handle.close()
+		else:
+			handle.flush()
+	report.seconds = time.perf_counter() - start
+	return report
+
+
+def _expand_paths(inputs: Iterable[str], pattern: str) -> Iterator[Path]:
+	for name in inputs:
+		path = Path(name)
+		if path.is_dir():
+			yield from sorted(path.rglob(pattern))
+		else:
+			yield path
+
+
+def build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(
+		description="Re-run summary and extraction over stored transcripts, writing JSONL.",
+	)
+	parser.add_argument("inputs", nargs="+", help="Transcript .txt files or directories to search")
+	parser.add_argument("--out", required=True, help="Output JSONL path")
+	parser.add_argument(
+		"--pattern",
+		default=DEFAULT_PATTERN,
+		help=f"File pattern inside directories (default: {DEFAULT_PATTERN}, the CLI's transcripts)",
+	)
+	parser.add_argument("--skip-summary", action="store_true", help="Only run the rule-based extractors")
+	parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+	parser.add_argument("--chunksize", type=int, default=16, help="Transcripts per worker task")
+	parser.add_argument(
+		"--summary-mode",
+		type=str,
+		choices=["abstractive", "extractive", "auto"],
+		default="abstractive",
+		help="abstractive (transformer), extractive (TextRank, milliseconds) or auto",
+	)
+	parser.add_argument(
+		"--backend",
+		type=str,
+		choices=["pytorch", "quantized", "onnx"],
+		default=None,
+		help="Summarization inference backend (default: TRANSCRIPTER_BACKEND or pytorch)",
+	)
+	parser.add_argument(
+		"--corpus-topics",
+		action="store_true",
+		help="Score topics with TF-IDF against the corpus IDF index instead of word counts",
+	)
+	parser.add_argument(
+		"--update-topic-index",
+		action="store_true",
+		help="With --corpus-topics: add each transcript to the corpus IDF index",
+	)
+	return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+	args = build_parser().parse_args(argv)
+	config = SummarizationConfig(
+		mode=args.summary_mode,
+		corpus_topics=args.corpus_topics,
+		update_topic_index=args.update_topic_index,
+	)
+	if args.backend:
+		config.backend = args.backend
+
+	report = backfill(
+		_expand_paths(args.inputs, args.pattern),
+		args.out,
+		config=config,
+		skip_summary=args.skip_summary,
+		workers=args.workers,
+		chunksize=args.chunksize,
+	)
+	print(
+		f"Processed {report.items} transcripts ({report.errors} errors, {report.words} words) "
+		f"in {report.seconds:.1f}s: {report.items_per_second:.1f} transcripts/s, "
+		f"{report.words_per_second:.0f} words/s"
+	)
+	print(f"Results written to {args.out}")
+
+
+if __name__ == "__main__":
+	main()
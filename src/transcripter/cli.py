@@ -5,33 +5,13 @@ import re
 from pathlib import Path
 
 from .audio import convert_to_wav_mono_16k
+from .document import Document, as_document
+from .keywords import CATEGORY_STEM_MATCHER, HIGHLIGHT_CATEGORIES, SIGNAL
 from .stt import transcribe_wav, transcribe_wav_streaming
+from .transcript_store import FILE_SUFFIX, write_transcript
 
-# Organized keyword categories for better structure
-HIGHLIGHT_CATEGORIES: dict[str, list[str]] = {
-	"Financial Metrics": [
-		"revenue", "profit", "cost", "margin", "roi", "budget", "pricing", "price",
-		"invoice", "mrr", "arr", "funding",
-	],
-	"Growth & Business": [
-		"growth", "market", "sales", "expansion", "deal", "contract", "pipeline",
-	],
-	"Customer & Users": [
-		"customers", "users", "churn", "retention",
-	],
-	"Planning & Forecasting": [
-		"forecast",
-	],
-	"Operations & Team": [
-		"hiring", "headcount",
-	],
-}
-
-# Flatten all keywords for pattern matching
-HIGHLIGHT_KEYWORDS = [kw for keywords in HIGHLIGHT_CATEGORIES.values() for kw in keywords]
-_HIGHLIGHT_PATTERN = re.compile(
-	rf"(?i)\b(?:{'|'.join(re.escape(kw) for kw in HIGHLIGHT_KEYWORDS)})\b"
-)
+def _has_highlight_keyword(hits: dict[str, int]) -> bool:
+	return any(category in hits for category in HIGHLIGHT_CATEGORIES)
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -92,40 +72,61 @@ def build_parser() -> argparse.ArgumentParser:
 		action="store_true",
 		help="Translate Hindi transcript to English (only works with --language hi)",
 	)
+	parser.add_argument(
+		"--backend",
+		type=str,
+		choices=["pytorch", "quantized", "onnx"],
+		default=None,
+		help="Summarization inference backend (default: TRANSCRIPTER_BACKEND or pytorch)",
+	)
+	parser.add_argument(
+		"--summary-mode",
+		type=str,
+		choices=["abstractive", "extractive", "auto"],
+		default="abstractive",
+		help="abstractive (transformer), extractive (TextRank, milliseconds) or auto",
+	)
+	parser.add_argument(
+		"--time-budget",
+		type=float,
+		default=None,
+		help="With --summary-mode auto: seconds allowed for abstractive summarization "
+		"before falling back to extractive",
+	)
+	parser.add_argument(
+		"--no-cache",
+		action="store_true",
+		help="Do not read or write the on-disk summary cache",
+	)
 	return parser
 
 
-def _extract_highlights(transcript: str) -> str:
+def _extract_highlights(transcript: str | Document) -> str:
 	"""
 	Extract and structure highlights from transcript with full context.
 	Captures important topics, decisions, and statements with surrounding context.
 	"""
-	if not transcript:
+	if not transcript or (isinstance(transcript, Document) and not transcript.text):
 		return ""
 
-	transcript = re.sub(r'\s+', ' ', transcript).strip()
-	sentences = [s.strip() for s in re.split(r"(?<=[.!?])\s+", transcript) if s.strip()]
-
-	importance_indicators = [
-		r'\b(?:decided|decision|agreed|agreement|approved|approval|announced|announcement)\b',
-		r'\b(?:will|going to|plan to|need to|must|should)\b',
-		r'\b(?:important|critical|key|major|significant|priority)\b',
-		r'\b(?:deadline|due date|target|goal|objective)\b',
-		r'\b\d+%|\$\d+|\d+\s*(?:million|billion|thousand|k|m|b)\b',
-		r'\b(?:next week|next month|next quarter|by|before|after)\b',
-	]
-	importance_pattern = re.compile('|'.join(importance_indicators), re.IGNORECASE)
+	doc = as_document(transcript)
+	sentences = doc.sentences
 
 	categorized: dict[str, list[str]] = {cat: [] for cat in HIGHLIGHT_CATEGORIES.keys()}
 	seen_highlights = set()
 
+	# One keyword scan gives business categories and importance signals per sentence
+	hits = doc.category_hits()
+	keyword_hits = [_has_highlight_keyword(h) for h in hits]
+	importance_hits = [SIGNAL in h for h in hits]
+	category_hits = doc.category_hits(CATEGORY_STEM_MATCHER)
+
 	for i, sentence in enumerate(sentences):
 		if len(sentence) < 10:
 			continue
 
-		sentence_lower = sentence.lower()
-		has_keyword = _HIGHLIGHT_PATTERN.search(sentence)
-		has_importance = importance_pattern.search(sentence)
+		has_keyword = keyword_hits[i]
+		has_importance = importance_hits[i]
 
 		if not (has_keyword or has_importance):
 			continue
@@ -135,8 +136,8 @@ def _extract_highlights(transcript: str) -> str:
 			prev_sentence = sentences[i - 1].strip()
 			if (
 				len(prev_sentence) < 100
-				or _HIGHLIGHT_PATTERN.search(prev_sentence)
-				or importance_pattern.search(prev_sentence)
+				or keyword_hits[i - 1]
+				or importance_hits[i - 1]
 			):
 				context_parts.append(prev_sentence)
 
@@ -146,8 +147,8 @@ def _extract_highlights(transcript: str) -> str:
 			next_sentence = sentences[i + 1].strip()
 			if (
 				len(next_sentence) < 100
-				or _HIGHLIGHT_PATTERN.search(next_sentence)
-				or importance_pattern.search(next_sentence)
+				or keyword_hits[i + 1]
+				or importance_hits[i + 1]
 			):
 				context_parts.append(next_sentence)
 
@@ -162,8 +163,8 @@ def _extract_highlights(transcript: str) -> str:
 		seen_highlights.add(highlight_key)
 
 		category_found = False
-		for category, keywords in HIGHLIGHT_CATEGORIES.items():
-			if any(kw.lower() in sentence_lower for kw in keywords):
+		for category in HIGHLIGHT_CATEGORIES:
+			if category in category_hits[i]:
 				if not highlight_text.endswith(('.', '!', '?')):
 					highlight_text += '.'
 				categorized[category].append(highlight_text)
@@ -209,9 +210,9 @@ def _extract_highlights(transcript: str) -> str:
 	return "\n".join(output_lines)
 
 
-def _extract_important_sentences(transcript: str) -> list[str]:
-	sentences = [s.strip() for s in re.split(r"(?<=[.!?])\s+", transcript) if s.strip()]
-	return [s for s in sentences if _HIGHLIGHT_PATTERN.search(s)]
+def _extract_important_sentences(transcript: str | Document) -> list[str]:
+	doc = as_document(transcript)
+	return [s for s, hits in zip(doc.sentences, doc.category_hits()) if _has_highlight_keyword(hits)]
 
 
 def _save_text(path: Path, content: str) -> None:
@@ -227,6 +228,9 @@ def main() -> None:
 	outdir = Path(args.outdir)
 	outdir.mkdir(parents=True, exist_ok=True)
 
+	translated = None
+	pipelined_translation = args.translate and args.language == "hi" and args.streaming
+
 	if args.reuse_transcript:
 		transcript = input_path.read_text(encoding="utf-8")
 		basename = input_path.stem.replace("_transcript", "")
@@ -235,34 +239,87 @@ def main() -> None:
 		basename = input_path.stem
 
 		transcript_output_path = outdir / f"{basename}_transcript.txt"
+		# Vosk word timings, collected per segment as decoding finalizes it
+		words: list[dict] = []
+
+		def collect_words(_text: str, segment_words: list[dict]) -> None:
+			words.extend(segment_words)
 
 		if args.streaming:
 			lang_name = "Hindi" if args.language == "hi" else "English"
 			print(f"Starting efficient streaming transcription ({lang_name})...")
 			output_target = None if args.important_only else transcript_output_path
-			transcript = transcribe_wav_streaming(
-				wav_path,
-				output_file=output_target,
-				show_progress=not args.no_progress,
-				include_timestamps=args.timestamps,
-				language=args.language,
-			)
+			if pipelined_translation:
+				from .pipeline import transcribe_and_translate
+
+				print("Translating segments to English while decoding...")
+				translated_path = outdir / f"{basename}_transcript_en.txt"
+				transcript, translated = transcribe_and_translate(
+					wav_path,
+					output_file=output_target,
+					translated_output_file=translated_path,
+					show_progress=not args.no_progress,
+					include_timestamps=args.timestamps,
+					language=args.language,
+					on_segment=collect_words,
+				)
+				print(f"Wrote: {translated_path}")
+			else:
+				transcript = transcribe_wav_streaming(
+					wav_path,
+					output_file=output_target,
+					show_progress=not args.no_progress,
+					include_timestamps=args.timestamps,
+					language=args.language,
+					on_segment=collect_words,
+				)
 			if output_target is None and not args.important_only:
 				_save_text(transcript_output_path, transcript)
 		else:
-			transcript = transcribe_wav(wav_path, language=args.language)
+			transcript = transcribe_wav(wav_path, language=args.language, on_segment=collect_words)
 			if not args.important_only:
 				_save_text(transcript_output_path, transcript)
 
+		if not args.important_only:
+			store_path = write_transcript(outdir / f"{basename}_transcript{FILE_SUFFIX}", words, transcript)
+			print(f"Wrote: {store_path}")
+
 		if wav_path.exists():
 			wav_path.unlink()
 
-	if args.translate:
+	if translated is not None:
+		transcript = translated
+	elif args.translate:
 		if args.language != "hi":
 			print("Warning: --translate only works with --language hi. Skipping translation.")
 		else:
 			print("Translating Hindi transcript to English...")
 			from .translate import translate_hindi_to_english
 
-				녕하세요
+			transcript = translate_hindi_to_english(transcript)
+			_save_text(outdir / f"{basename}_transcript_en.txt", transcript)
+
+	doc = Document.from_text(transcript)
+	if args.important_only:
+		important = _extract_important_sentences(doc)
+		_save_text(outdir / f"{basename}_important.txt", "\n".join(important))
+
+	_save_text(outdir / f"{basename}_highlights.txt", _extract_highlights(doc))
+
+	if not args.skip_summary:
+		from .summarize import SummarizationConfig, summarize_text
+
+		print("Summarizing transcript...")
+		config = SummarizationConfig(
+			mode=args.summary_mode,
+			time_budget_s=args.time_budget,
+			use_cache=not args.no_cache,
+		)
+		if args.backend:
+			config.backend = args.backend
+		summary = summarize_text(transcript, config)
+		_save_text(outdir / f"{basename}_summary.txt", summary)
+
 
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,101 @@
+"""
+Document Analysis Module
+
+Builds a single analysis of a transcript (normalized text, sentences,
+offsets, tokens and per-sentence keyword hits) that every rule-based
+extractor consumes, instead of each one re-normalizing, re-splitting and
+re-lowercasing the same text.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple, Union
+
+from .keywords import MATCHER, KeywordMatcher
+
+
+_WHITESPACE = re.compile(r'\s+')
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+_NON_WORD = re.compile(r'[^\w\s]')
+_LEADING_PUNCT = re.compile(r'^[^\w]+')
+_TRAILING_PUNCT = re.compile(r'[^\w]+$')
+
+
+@dataclass
+class Document:
+    """
+    Pre-analyzed transcript shared by the extractors.
+
+    Attributes:
+        text: Whitespace-normalized transcript
+        sentences: Sentences split on . ! ? followed by whitespace
+        offsets: (start, end) character span of each sentence in text
+        sentences_lower: Lowercased sentences
+        tokens: Lowercased word tokens of each sentence (punctuation removed)
+    """
+
+    text: str
+    sentences: List[str]
+    offsets: List[Tuple[int, int]]
+    sentences_lower: List[str]
+    tokens: List[List[str]]
+    _hits: Dict[KeywordMatcher, List[Dict[str, int]]] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_text(cls, transcript: str) -> "Document":
+        text = _WHITESPACE.sub(' ', transcript or '').strip()
+
+        sentences: List[str] = []
+        offsets: List[Tuple[int, int]] = []
+        start = 0
+        # Normalized text has single spaces, so a sentence never needs stripping
+        for match in _SENTENCE_END.finditer(text):
+            sentences.append(text[start:match.start()])
+            offsets.append((start, match.start()))
+            start = match.end()
+        if start < len(text):
+            sentences.append(text[start:])
+            offsets.append((start, len(text)))
+
+        sentences_lower = [s.lower() for s in sentences]
+        tokens = [_NON_WORD.sub(' ', s).split() for s in sentences_lower]
+        return cls(text, sentences, offsets, sentences_lower, tokens)
+
+    @property
+    def words(self) -> List[str]:
+        """All lowercased word tokens in order."""
+        return [token for sentence_tokens in self.tokens for token in sentence_tokens]
+
+    def category_hits(self, matcher: KeywordMatcher = MATCHER) -> List[Dict[str, int]]:
+        """
+        Keyword category hit counts for each sentence.
+
+        Computed with one scan of the text and cached per matcher, so all
+        extractors share the same pass.
+        """
+        hits = self._hits.get(matcher)
+        if hits is None:
+            hits = matcher.sentence_hits(self.text, self.offsets)
+            self._hits[matcher] = hits
+        return hits
+
+
+def clean_sentence(sentence: str) -> str:
+    """Strip surrounding punctuation and capitalize a sentence for bullet output."""
+    cleaned = sentence.strip()
+    
+    # Remove leading/trailing punctuation issues
+    cleaned = _LEADING_PUNCT.sub('', cleaned)
+    cleaned = _TRAILING_PUNCT.sub('', cleaned)
+    
+    # Ensure proper capitalization
+    if cleaned and not cleaned[0].isupper():
+        cleaned = cleaned[0].upper() + cleaned[1:] if len(cleaned) > 1 else cleaned.upper()
+    return cleaned
+
+
+def as_document(transcript: Union[str, Document]) -> Document:
+    """Return transcript as a Document, analyzing it if it is a plain string."""
+    if isinstance(transcript, Document):
+        return transcript
+    return Document.from_text(transcript)
@@ -0,0 +1,120 @@
+"""
+Extractive Summarization Module
+
+Ranks transcript sentences over a sparse TF-IDF matrix and returns the
+top-ranked ones in their original order. Runs in milliseconds on CPU, so
+it is used when abstractive summarization does not fit a latency budget.
+
+Methods:
+- "textrank": PageRank over the cosine-similarity graph of sentences
+- "centroid": cosine similarity to the document's TF-IDF centroid
+"""
+
+from __future__ import annotations
+
+import re
+from typing import List
+
+import numpy as np
+from scipy import sparse
+
+from .topics import STOPWORDS
+
+
+EXTRACTIVE_METHODS = ("textrank", "centroid")
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+_TOKEN = re.compile(r"[^\W\d_]{3,}")
+
+
+def split_sentences(text: str, max_words: int = 30) -> List[str]:
+	"""
+	Split text into sentences, windowing unpunctuated runs (raw STT output)
+	into pseudo-sentences of at most max_words words.
+	"""
+	sentences: list[str] = []
+	for sentence in _SENTENCE_SPLIT.split(text.strip()):
+		words = sentence.split()
+		for i in range(0, len(words), max_words):
+			sentences.append(" ".join(words[i:i + max_words]))
+	return sentences
+
+
+def _tfidf_matrix(sentences: List[str]) -> sparse.csr_matrix:
+	vocab: dict[str, int] = {}
+	rows: list[int] = []
+	cols: list[int] = []
+	for row, sentence in enumerate(sentences):
+		for token in _TOKEN.findall(sentence.lower()):
+			if token in STOPWORDS:
+				continue
+			rows.append(row)
+			cols.append(vocab.setdefault(token, len(vocab)))
+
+	shape = (len(sentences), max(len(vocab), 1))
+	# Duplicate (row, col) pairs are summed into term counts
+	tf = sparse.csr_matrix((np.ones(len(rows), dtype=np.float32), (rows, cols)), shape=shape)
+	tf.sum_duplicates()
+
+	df = np.bincount(tf.indices, minlength=shape[1])
+	idf = np.log((1 + shape[0]) / (1 + df)).astype(np.float32) + 1.0
+	tfidf = tf.multiply(idf).tocsr()
+
+	norms = np.sqrt(np.asarray(tfidf.multiply(tfidf).sum(axis=1)).ravel())
+	norms[norms == 0] = 1.0
+	return sparse.diags(1.0 / norms).dot(tfidf).tocsr()
+
+
+def _textrank_scores(matrix: sparse.csr_matrix, damping: float = 0.85, iterations: int = 50) -> np.ndarray:
+	n = matrix.shape[0]
+	similarity = matrix.dot(matrix.T).tocsr()
+	similarity.setdiag(0)
+	similarity.eliminate_zeros()
+
+	out_weight = np.asarray(similarity.sum(axis=1)).ravel()
+	dangling = out_weight == 0
+	out_weight[dangling] = 1.0
+	transition = sparse.diags(1.0 / out_weight).dot(similarity).T.tocsr()
+
+	scores = np.full(n, 1.0 / n)
+	for _ in range(iterations):
+		# Sentences with no similar neighbours spread their rank uniformly
+		updated = (1 - damping) / n + damping * (transition.dot(scores) + scores[dangling].sum() / n)
+		if np.abs(updated - scores).sum() < 1e-6:
+			return updated
+		scores = updated
+	return scores
+
+
+def _centroid_scores(matrix: sparse.csr_matrix) -> np.ndarray:
+	centroid = np.asarray(matrix.mean(axis=0)).ravel()
+	return matrix.dot(centroid)
+
+
+def extractive_summary(text: str, num_sentences: int = 5, method: str = "textrank") -> str:
+	"""
+	Build an extractive summary from the highest-ranked sentences.
+
+	Args:
+		text: Input text to summarize
+		num_sentences: Number of sentences to keep
+		method: "textrank" or "centroid"
+
+	Returns:
+		Selected sentences joined in their original order
+	"""
+	if method not in EXTRACTIVE_METHODS:
+		raise ValueError(f"Unsupported extractive method: {method}. Supported: {list(EXTRACTIVE_METHODS)}")
+	if not text or not text.strip():
+		return ""
+
+	# Repeated sentences would otherwise share a rank and crowd the summary
+	sentences = list(dict.fromkeys(split_sentences(text)))
+	if len(sentences) <= num_sentences:
+		return " ".join(sentences)
+
+	matrix = _tfidf_matrix(sentences)
+	scores = _textrank_scores(matrix) if method == "textrank" else _centroid_scores(matrix)
+
+	top = np.argpartition(-scores, num_sentences - 1)[:num_sentences]
+	return " ".join(sentences[i] for i in np.sort(top))
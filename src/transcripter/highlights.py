@@ -2,101 +2,130 @@
 Highlights Extraction Module
 
 Extracts 5-7 meaningful sentences from transcript based on keyword scoring.
+Sentences are scored as a sentence-by-feature matrix times a tunable
+weight vector.
 Lightweight and optimized for 8GB RAM systems.
 """
 
-import re
-from typing import List
+from dataclasses import astuple, dataclass
+from typing import Dict, List, Optional, Sequence, Union
 
+import numpy as np
 
-def extract_highlights(transcript: str, max_highlights: int = 7) -> List[str]:
+from .document import Document, as_document, clean_sentence
+from .keywords import IMPORTANCE, NUMERIC
+
+
+@dataclass(frozen=True)
+class HighlightWeights:
     """
-    Extract meaningful highlights from transcript.
-    
-    Selects sentences based on importance keywords and returns
-    them as a bullet points list.
-    
-    Args:
-        transcript: The full transcript text
-        max_highlights: Maximum number of highlights to return (default: 7)
-        
-    Returns:
-        List of highlight sentences formatted as "- [highlight]"
+    Weights of the sentence features, in feature-matrix column order.
+
+    The defaults reproduce the classic score: importance keyword count,
+    doubled for medium-length (50-200 char) sentences.
     """
-    if not transcript or not transcript.strip():
-        return []
-    
-    # Clean transcript
-    transcript = re.sub(r'\s+', ' ', transcript).strip()
-    
-    # Split into sentences
-    sentences = [s.strip() for s in re.split(r"(?<=[.!?])\s+", transcript) if s.strip()]
-    
-    # Importance keywords for scoring
-    importance_keywords = [
-        r'\bdiscussed\b',
-        r'\bdecided\b',
-        r'\bimportant\b',
-        r'\bkey point\b',
-        r'\bsummary\b',
-        r'\bdecision\b',
-        r'\bagreed\b',
-        r'\bapproval\b',
-        r'\bannounced\b',
-        r'\bconclusion\b',
-        r'\bfinal\b',
-        r'\bmain\b',
-        r'\bprimary\b',
-        r'\bcritical\b',
-        r'\bsignificant\b',
-        r'\bmajor\b',
-    ]
-    
-    # Combine patterns
-    importance_pattern = re.compile('|'.join(importance_keywords), re.IGNORECASE)
-    
-    # Score sentences
-    scored_sentences = []
-    for sentence in sentences:
-        # Skip very short or very long sentences
-        if len(sentence) < 20 or len(sentence) > 300:
-            continue
-        
-        # Calculate score based on keyword matches
-        matches = len(importance_pattern.findall(sentence))
-        if matches > 0:
-            # Bonus for sentence length (prefer medium-length sentences)
-            length_score = 1.0 if 50 <= len(sentence) <= 200 else 0.5
-            total_score = matches * length_score
-            scored_sentences.append((total_score, sentence))
+    importance: float = 0.5
+    importance_mid_length: float = 0.5
+    mid_length: float = 0.0
+    numeric: float = 0.0
+    # 1.0 for the first sentence falling linearly to 0.0 for the last
+    position: float = 0.0
+
+
+DEFAULT_WEIGHTS = HighlightWeights()
+
+# Sentences outside this length range are never highlight candidates
+_MIN_CANDIDATE_CHARS = 20
+_MAX_CANDIDATE_CHARS = 300
+_MID_LENGTH = (50, 200)
+
+
+def sentence_features(sentences: Sequence[str], hits: Sequence[Dict[str, int]]) -> np.ndarray:
+    """
+    Build the sentence-by-feature matrix for highlight scoring.
+
+    Columns follow HighlightWeights: importance count, importance count of
+    medium-length sentences, medium-length flag, numeric/money mentions and
+    position.
+    """
+    count = len(sentences)
+    lengths = np.fromiter(map(len, sentences), dtype=np.int64, count=count)
+    importance = np.fromiter((h.get(IMPORTANCE, 0) for h in hits), dtype=np.float64, count=count)
+    numeric = np.fromiter((h.get(NUMERIC, 0) for h in hits), dtype=np.float64, count=count)
+    mid_length = ((lengths >= _MID_LENGTH[0]) & (lengths <= _MID_LENGTH[1])).astype(np.float64)
+    position = 1.0 - np.arange(count) / (count - 1) if count > 1 else np.ones(count)
+    return np.column_stack([importance, importance * mid_length, mid_length, numeric, position])
+
+
+def score_sentences(doc: Document, weights: HighlightWeights = DEFAULT_WEIGHTS) -> np.ndarray:
+    """Highlight score of every sentence in a document; 0 for non-candidates."""
+    if not doc.sentences:
+        return np.zeros(0)
+    features = sentence_features(doc.sentences, doc.category_hits())
+    scores = features @ np.asarray(astuple(weights), dtype=np.float64)
     
-    # Sort by score (descending) and take top N
-    scored_sentences.sort(key=lambda x: x[0], reverse=True)
-    top_sentences = [s[1] for s in scored_sentences[:max_highlights]]
+    # Skip very short or very long sentences
+    lengths = np.fromiter(map(len, doc.sentences), dtype=np.int64, count=len(doc.sentences))
+    scores[(lengths < _MIN_CANDIDATE_CHARS) | (lengths > _MAX_CANDIDATE_CHARS)] = 0.0
+    return scores
+
+
+def highlight_score(sentence: str, hits: Dict[str, int], weights: HighlightWeights = DEFAULT_WEIGHTS) -> float:
+    """
+    Score a single sentence; 0 if it is not a candidate.
     
-    # If we don't have enough, add some random meaningful sentences
-    if len(top_sentences) < max_highlights:
-        remaining = [s for s in sentences if s not in top_sentences and 30 <= len(s) <= 250]
-        needed = max_highlights - len(top_sentences)
-        top_sentences.extend(remaining[:needed])
+    Used by the streaming extractor, which cannot know a sentence's
+    position in the final transcript, so the position feature is ignored.
+    """
+    # Skip very short or very long sentences
+    if len(sentence) < _MIN_CANDIDATE_CHARS or len(sentence) > _MAX_CANDIDATE_CHARS:
+        return 0.0
     
-    # Format as bullet points
+    # Bonus for sentence length (prefer medium-length sentences)
+    mid_length = 1.0 if _MID_LENGTH[0] <= len(sentence) <= _MID_LENGTH[1] else 0.0
+    importance = hits.get(IMPORTANCE, 0)
+    return (
+        weights.importance * importance
+        + weights.importance_mid_length * importance * mid_length
+        + weights.mid_length * mid_length
+        + weights.numeric * hits.get(NUMERIC, 0)
+    )
+
+
+def top_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k highest positive scores, best first.
+
+    Uses argpartition, so it is linear in the number of sentences; ties keep
+    the earlier sentence, as a stable sort would.
+    """
+    candidates = np.flatnonzero(scores > 0)
+    if k <= 0 or not len(candidates):
+        return candidates[:0]
+    candidate_scores = scores[candidates]
+    if len(candidates) > k:
+        kth = candidate_scores[np.argpartition(-candidate_scores, k - 1)[k - 1]]
+        above = candidates[candidate_scores > kth]
+        tied = candidates[candidate_scores == kth][:k - len(above)]
+        candidates = np.concatenate([above, tied])
+    return candidates[np.lexsort((candidates, -scores[candidates]))]
+
+
+def is_fallback_sentence(sentence: str) -> bool:
+    """Check if a sentence may fill remaining highlight slots."""
+    return 30 <= len(sentence) <= 250
+
+
+def format_highlights(top_sentences: List[str]) -> List[str]:
+    """Clean, deduplicate and format selected sentences as bullet points."""
     highlights = []
     seen = set()
     for sentence in top_sentences:
         # Clean up
-        cleaned = sentence.strip()
+        cleaned = clean_sentence(sentence)
         if not cleaned:
             continue
         
-        # Remove leading/trailing punctuation issues
-        cleaned = re.sub(r'^[^\w]+', '', cleaned)
-        cleaned = re.sub(r'[^\w]+$', '', cleaned)
-        
-        # Ensure proper capitalization
-        if cleaned and not cleaned[0].isupper():
-            cleaned = cleaned[0].upper() + cleaned[1:] if len(cleaned) > 1 else cleaned.upper()
-        
         # Skip duplicates
         item_key = cleaned.lower()[:50]
         if item_key in seen:
@@ -107,3 +136,46 @@ def extract_highlights(transcript: str, max_highlights: int = 7) -> List[str]:
     
     return highlights
 
+
+def extract_highlights(
+    transcript: Union[str, Document],
+    max_highlights: int = 7,
+    weights: Optional[HighlightWeights] = None,
+) -> List[str]:
+    """
+    Extract meaningful highlights from transcript.
+    
+    Scores every sentence with one product of its feature matrix and the
+    weights, keeps the best with argpartition and returns them as a
+    bullet points list.
+    
+    Args:
+        transcript: The full transcript text, or a pre-built Document
+        max_highlights: Maximum number of highlights to return (default: 7)
+        weights: Feature weights (default: DEFAULT_WEIGHTS)
+        
+    Returns:
+        List of highlight sentences formatted as "- [highlight]"
+    """
+    doc = as_document(transcript)
+    if not doc.sentences:
+        return []
+    sentences = doc.sentences
+    
+    # Score sentences and take top N
+    scores = score_sentences(doc, weights or DEFAULT_WEIGHTS)
+    top_sentences = [sentences[i] for i in top_indices(scores, max_highlights)]
+    
+    # If we don't have enough, add some other meaningful sentences in order
+    if len(top_sentences) < max_highlights:
+        chosen = set(top_sentences)
+        needed = max_highlights - len(top_sentences)
+        for sentence in sentences:
+            if sentence not in chosen and is_fallback_sentence(sentence):
+                top_sentences.append(sentence)
+                needed -= 1
+                if not needed:
+                    break
+    
+    # Format as bullet points
+    return format_highlights(top_sentences)
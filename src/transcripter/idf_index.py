@@ -0,0 +1,320 @@
+"""
+Corpus IDF Index Module
+
+Persistent, incrementally updated document-frequency index over every
+processed meeting. Unigram and bigram terms are hashed into a fixed number
+of buckets, so memory stays bounded however large the corpus grows, and
+adding a meeting is a single increment of the buckets it touches. Scoring a
+transcript is one sparse TF x IDF product over its own terms; nothing is
+refitted.
+
+The index is stored as a small .npz file next to the summary cache. Saves
+are batched, and each save merges this process's new documents into
+whatever is on disk under a file lock. Backfill workers and API processes
+can therefore share one index without overwriting each other's counts.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import os
+import tempfile
+import threading
+import time
+import zlib
+from collections import Counter, OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: saves still merge, without the cross-process lock
+    fcntl = None
+
+from .document import Document, as_document
+from .summary_cache import DEFAULT_CACHE_DIR
+from .topics import topic_words
+
+
+DEFAULT_INDEX_PATH = Path(
+    os.environ.get("TRANSCRIPTER_IDF_INDEX", DEFAULT_CACHE_DIR / "idf_index.npz")
+)
+# 2**18 uint32 buckets = 1 MiB of document frequencies
+DEFAULT_N_FEATURES = 1 << 18
+# Digests of recently indexed transcripts, so re-processing a meeting does not
+# count it twice
+DEFAULT_MAX_SEEN = 50000
+# Autosave once this many documents are pending, or when the oldest pending
+# document is this many seconds old
+DEFAULT_SAVE_EVERY = int(os.environ.get("TRANSCRIPTER_IDF_SAVE_EVERY", "32"))
+DEFAULT_SAVE_INTERVAL = float(os.environ.get("TRANSCRIPTER_IDF_SAVE_INTERVAL", "30"))
+
+
+def document_terms(doc: Document) -> List[str]:
+    """
+    Topic terms of a document: filtered unigrams plus bigrams of adjacent
+    filtered words within a sentence.
+    """
+    terms: List[str] = []
+    for sentence_tokens in doc.tokens:
+        words = topic_words(sentence_tokens)
+        terms.extend(words)
+        terms.extend(f"{first} {second}" for first, second in zip(words, words[1:]))
+    return terms
+
+
+class IDFIndex:
+    """
+    Hashed document-frequency table shared by all processed meetings.
+
+    Terms are mapped to buckets with crc32, so the table never grows and
+    unseen terms need no vocabulary entry. Safe to share across threads and,
+    through merge-on-save, across processes.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path, None] = None,
+        n_features: int = DEFAULT_N_FEATURES,
+        max_seen: int = DEFAULT_MAX_SEEN,
+        autosave: bool = True,
+        save_every: int = DEFAULT_SAVE_EVERY,
+        save_interval: float = DEFAULT_SAVE_INTERVAL,
+    ) -> None:
+        if n_features <= 0 or n_features & (n_features - 1):
+            raise ValueError("n_features must be a power of two")
+        self.path = Path(path) if path is not None else None
+        self.n_features = n_features
+        self.max_seen = max_seen
+        self.autosave = autosave and self.path is not None
+        self.save_every = save_every
+        self.save_interval = save_interval
+        self.df = np.zeros(n_features, dtype=np.uint32)
+        self.n_docs = 0
+        self._seen: "OrderedDict[int, None]" = OrderedDict()
+        # Documents added since the last save: (digest, buckets)
+        self._pending: List[Tuple[int, np.ndarray]] = []
+        self._pending_since = 0.0
+        self._lock = threading.Lock()
+        if self.path is not None and self.path.exists():
+            self._load()
+
+    def _bucket(self, term: str) -> int:
+        return zlib.crc32(term.encode("utf-8")) & (self.n_features - 1)
+
+    def _vectorize(self, terms: List[str]) -> Tuple[np.ndarray, np.ndarray, Dict[int, str]]:
+        """Sparse term-count vector (bucket indices, counts) and a display term per bucket."""
+        counts: Dict[int, int] = {}
+        names: Dict[int, str] = {}
+        best: Dict[int, int] = {}
+        for term, count in Counter(terms).items():
+            bucket = self._bucket(term)
+            counts[bucket] = counts.get(bucket, 0) + count
+            # On a collision inside one transcript show the more frequent term
+            if count > best.get(bucket, 0):
+                best[bucket] = count
+                names[bucket] = term
+        indices = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+        values = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+        return indices, values, names
+
+    @staticmethod
+    def _digest(doc: Document) -> int:
+        return int.from_bytes(hashlib.blake2b(doc.text.encode("utf-8"), digest_size=8).digest(), "little")
+
+    def add_document(self, transcript: Union[str, Document]) -> bool:
+        """
+        Count a transcript's terms into the corpus frequencies.
+
+        Returns:
+            False if the same transcript was already indexed (nothing changes)
+        """
+        doc = as_document(transcript)
+        digest = self._digest(doc)
+        indices, _, _ = self._vectorize(document_terms(doc))
+        with self._lock:
+            if digest in self._seen:
+                self._seen.move_to_end(digest)
+                return False
+            self._remember(digest)
+            # Buckets are unique, so plain fancy-index increment is exact
+            self.df[indices] += 1
+            self.n_docs += 1
+            if self.path is not None:
+                if not self._pending:
+                    self._pending_since = time.monotonic()
+                self._pending.append((digest, indices))
+                if self.autosave and (
+                    len(self._pending) >= self.save_every
+                    or time.monotonic() - self._pending_since >= self.save_interval
+                ):
+                    self._save_locked()
+        return True
+
+    def _remember(self, digest: int) -> None:
+        self._seen[digest] = None
+        self._seen.move_to_end(digest)
+        while len(self._seen) > self.max_seen:
+            self._seen.popitem(last=False)
+
+    @staticmethod
+    def _tf(counts: np.ndarray) -> np.ndarray:
+        # Sublinear term frequency, so filler repeated all meeting long cannot
+        # outweigh rarer, meeting-specific terms on count alone
+        return 1.0 + np.log(counts)
+
+    def idf(self, indices: np.ndarray) -> np.ndarray:
+        """Smoothed inverse document frequency of the given buckets."""
+        with self._lock:
+            n_docs = self.n_docs
+            df = self.df[indices].astype(np.float64)
+        return np.log((1.0 + n_docs) / (1.0 + df)) + 1.0
+
+    def score_terms(self, transcript: Union[str, Document]) -> Dict[str, float]:
+        """TF-IDF weight of every term in a transcript against the corpus."""
+        doc = as_document(transcript)
+        indices, counts, names = self._vectorize(document_terms(doc))
+        if not len(indices):
+            return {}
+        scores = self._tf(counts) * self.idf(indices)
+        return {names[int(bucket)]: float(score) for bucket, score in zip(indices, scores)}
+
+    def top_terms(self, transcript: Union[str, Document], top_n: int = 5) -> List[Tuple[str, float]]:
+        """The top_n highest TF-IDF terms of a transcript, best first."""
+        doc = as_document(transcript)
+        indices, counts, names = self._vectorize(document_terms(doc))
+        if not len(indices) or top_n <= 0:
+            return []
+        scores = self._tf(counts) * self.idf(indices)
+        if len(scores) > top_n:
+            candidates = np.argpartition(-scores, top_n - 1)[:top_n]
+        else:
+            candidates = np.arange(len(scores))
+        order = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(names[int(indices[i])], float(scores[i])) for i in order]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "documents": self.n_docs,
+                "n_features": self.n_features,
+                "buckets_used": int(np.count_nonzero(self.df)),
+                "bytes": int(self.df.nbytes),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self.df[:] = 0
+            self.n_docs = 0
+            self._seen.clear()
+            self._pending.clear()
+            if self.autosave:
+                with self._file_lock():
+                    self._write_locked()
+
+    @property
+    def pending(self) -> int:
+        """Documents added since the last save."""
+        with self._lock:
+            return len(self._pending)
+
+    def save(self) -> None:
+        """
+        Merge pending documents into the index on disk and reload the result.
+
+        The file is re-read under an exclusive lock, pending documents that
+        no other process has indexed meanwhile are added to it, and the
+        merged table is written back atomically.
+        """
+        if self.path is None:
+            raise ValueError("IDFIndex has no path to save to")
+        with self._lock:
+            self._save_locked()
+
+    def flush(self) -> None:
+        """Save if any documents are pending (no-op for in-memory indexes)."""
+        if self.path is not None and self.pending:
+            self.save()
+
+    def _file_lock(self):
+        return _FileLock(self.path.with_name(self.path.name + ".lock"))
+
+    def _save_locked(self) -> None:
+        with self._file_lock():
+            if self.path.exists():
+                # Start from what is on disk; it includes other processes' documents
+                self._load()
+            for digest, indices in self._pending:
+                if digest in self._seen:
+                    continue
+                self._remember(digest)
+                self.df[indices] += 1
+                self.n_docs += 1
+            self._pending.clear()
+            self._write_locked()
+
+    def _write_locked(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".npz.tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                np.savez(
+                    handle,
+                    df=self.df,
+                    n_docs=np.array(self.n_docs, dtype=np.int64),
+                    seen=np.fromiter(self._seen.keys(), dtype=np.uint64, count=len(self._seen)),
+                )
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    def _load(self) -> None:
+        with np.load(self.path) as data:
+            df = data["df"]
+            if df.shape != self.df.shape:
+                raise ValueError(
+                    f"{self.path} was built with {df.shape[0]} features, not {self.n_features}"
+                )
+            self.df = df.astype(np.uint32)
+            self.n_docs = int(data["n_docs"])
+            self._seen = OrderedDict((int(digest), None) for digest in data["seen"][-self.max_seen:])
+
+
+class _FileLock:
+    """Exclusive advisory lock on a side file, held while the index is merged."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._handle = None
+
+    def __enter__(self) -> "_FileLock":
+        if fcntl is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = open(self.path, "a+b")
+            fcntl.flock(self._handle.fileno(), fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._handle is not None:
+            fcntl.flock(self._handle.fileno(), fcntl.LOCK_UN)
+            self._handle.close()
+            self._handle = None
+
+
+_default_index: Optional[IDFIndex] = None
+_default_lock = threading.Lock()
+
+
+def get_default_index() -> IDFIndex:
+    """Return the process-wide IDF index, loading it from disk on first use."""
+    global _default_index
+    with _default_lock:
+        if _default_index is None:
+            _default_index = IDFIndex(DEFAULT_INDEX_PATH)
+            # Pending documents are merged in when the process exits normally
+            atexit.register(_default_index.flush)
+        return _default_index
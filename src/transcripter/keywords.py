@@ -0,0 +1,174 @@
+"""
+Keyword Matching Module
+
+One precompiled multi-pattern matcher shared by all rule-based extractors.
+Every keyword of every category is folded into a single trie-shaped regex
+(common prefixes are factored out, so the engine walks it like an
+Aho-Corasick automaton), and a single scan of the transcript reports which
+categories hit each sentence.
+"""
+
+import re
+from bisect import bisect_right
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+
+# Action-oriented phrases (action items)
+ACTION_KEYWORDS = [
+    "will", "should", "need to", "have to", "required", "assigned",
+    "responsible", "deadline", "task", "going to", "must", "plan to",
+    "promised", "commit", "action", "deliver", "complete", "finish",
+    "do", "implement",
+]
+
+# Importance phrases (highlights scoring)
+IMPORTANCE_KEYWORDS = [
+    "discussed", "decided", "important", "key point", "summary", "decision",
+    "agreed", "approval", "announced", "conclusion", "final", "main",
+    "primary", "critical", "significant", "major",
+]
+
+# Decision, commitment and timing signals (CLI highlight report)
+SIGNAL_KEYWORDS = [
+    "decided", "decision", "agreed", "agreement", "approved", "approval",
+    "announced", "announcement",
+    "will", "going to", "plan to", "need to", "must", "should",
+    "important", "critical", "key", "major", "significant", "priority",
+    "deadline", "due date", "target", "goal", "objective",
+    "next week", "next month", "next quarter", "by", "before", "after",
+]
+# Numbers and money amounts (CLI highlight report and highlight scoring)
+SIGNAL_PATTERNS = [
+    r"\b\d+%|\$\d+|\d+\s*(?:million|billion|thousand|k|m|b)\b",
+]
+
+# Business topic categories (CLI highlight report), in priority order
+HIGHLIGHT_CATEGORIES: Dict[str, List[str]] = {
+    "Financial Metrics": [
+        "revenue", "profit", "cost", "margin", "roi", "budget", "pricing", "price",
+        "invoice", "mrr", "arr", "funding",
+    ],
+    "Growth & Business": [
+        "growth", "market", "sales", "expansion", "deal", "contract", "pipeline",
+    ],
+    "Customer & Users": [
+        "customers", "users", "churn", "retention",
+    ],
+    "Planning & Forecasting": [
+        "forecast",
+    ],
+    "Operations & Team": [
+        "hiring", "headcount",
+    ],
+}
+
+ACTION = "action"
+IMPORTANCE = "importance"
+SIGNAL = "signal"
+NUMERIC = "numeric"
+
+
+def _trie_regex(phrases: Iterable[str]) -> str:
+    """Render phrases as one regex with shared prefixes factored out."""
+    trie: dict = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def render(node: dict) -> str:
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # A phrase may end here: make the longer continuations optional (greedy,
+        # so the longest phrase wins and backtracking falls back to the shorter)
+        return f"(?:{body})?" if "" in node else body
+
+    return render(trie)
+
+
+class KeywordMatcher:
+    """
+    Precompiled matcher mapping keyword phrases and regex patterns to categories.
+
+    A phrase that contains another keyword as whole words (e.g. "key point"
+    contains "key") reports the categories of both, so sentence-level hits
+    match what separate per-category regexes would find. With
+    word_boundary=False keywords also match inside longer words
+    ("market" in "marketing").
+    """
+
+    def __init__(
+        self,
+        categories: Mapping[str, Iterable[str]],
+        patterns: Optional[Mapping[str, Iterable[str]]] = None,
+        word_boundary: bool = True,
+    ) -> None:
+        phrase_categories: Dict[str, set] = {}
+        for category, phrases in categories.items():
+            for phrase in phrases:
+                phrase_categories.setdefault(phrase.lower(), set()).add(category)
+
+        self._phrases: Dict[str, FrozenSet[str]] = {}
+        for phrase in phrase_categories:
+            found = set()
+            for other, other_categories in phrase_categories.items():
+                if re.search(rf"\b{re.escape(other)}\b", phrase) if word_boundary else other in phrase:
+                    found |= other_categories
+            self._phrases[phrase] = frozenset(found)
+
+        boundary = r"\b" if word_boundary else ""
+        parts = [f"{boundary}{_trie_regex(self._phrases)}{boundary}"] if self._phrases else []
+        # A regex listed under several categories is matched once and reports all of them
+        regex_categories: Dict[str, set] = {}
+        for category, regexes in (patterns or {}).items():
+            for regex in regexes:
+                regex_categories.setdefault(regex, set()).add(category)
+        self._pattern_categories: Dict[str, FrozenSet[str]] = {}
+        for regex, pattern_categories in regex_categories.items():
+            group = f"p{len(self._pattern_categories)}"
+            self._pattern_categories[group] = frozenset(pattern_categories)
+            parts.append(f"(?P<{group}>{regex})")
+        self.regex = re.compile("|".join(parts), re.IGNORECASE)
+
+    def scan(self, text: str) -> Iterator[Tuple[int, FrozenSet[str]]]:
+        """Yield (match start, categories) for every keyword hit in text."""
+        for match in self.regex.finditer(text):
+            group = match.lastgroup
+            if group is not None:
+                yield match.start(), self._pattern_categories[group]
+            else:
+                yield match.start(), self._phrases[match.group().lower()]
+
+    def sentence_hits(self, text: str, offsets: Sequence[Tuple[int, int]]) -> List[Dict[str, int]]:
+        """
+        Count category hits per sentence with one scan over text.
+
+        Args:
+            text: Full text the sentence offsets refer to
+            offsets: (start, end) span of each sentence
+
+        Returns:
+            One {category: count} dict per sentence
+        """
+        starts = [start for start, _ in offsets]
+        hits: List[Dict[str, int]] = [{} for _ in offsets]
+        for position, categories in self.scan(text):
+            index = bisect_right(starts, position) - 1
+            if index < 0 or position >= offsets[index][1]:
+                continue
+            counts = hits[index]
+            for category in categories:
+                counts[category] = counts.get(category, 0) + 1
+        return hits
+
+
+MATCHER = KeywordMatcher(
+    {ACTION: ACTION_KEYWORDS, IMPORTANCE: IMPORTANCE_KEYWORDS, SIGNAL: SIGNAL_KEYWORDS, **HIGHLIGHT_CATEGORIES},
+    {SIGNAL: SIGNAL_PATTERNS, NUMERIC: SIGNAL_PATTERNS},
+)
+
+# Business categories matched anywhere inside words, used to file CLI highlights
+CATEGORY_STEM_MATCHER = KeywordMatcher(HIGHLIGHT_CATEGORIES, word_boundary=False)
@@ -0,0 +1,249 @@
+"""
+PDF Render Cache Module
+
+Renders meeting reports in a separate process pool so reportlab's CPU work
+never blocks the API event loop or its worker threads. Finished PDFs are
+cached on disk under a hash of the report content (including any
+transcript appendix) and the template version, so repeated downloads of
+the same report are served straight from the file. Concurrent requests
+for the same report share one render.
+
+Reports are handed out as open files, so a PDF evicted by another request
+while it is being sent is still read to the end.
+"""
+
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional
+from uuid import uuid4
+
+from .pdf_export import TEMPLATE_VERSION, write_pdf
+from .summary_cache import DEFAULT_CACHE_DIR
+
+
+DEFAULT_PDF_CACHE_DIR = Path(os.environ.get("TRANSCRIPTER_PDF_CACHE_DIR", DEFAULT_CACHE_DIR / "pdf"))
+DEFAULT_PDF_CACHE_BYTES = int(os.environ.get("TRANSCRIPTER_PDF_CACHE_MB", "256")) * 1024 * 1024
+DEFAULT_PDF_WORKERS = int(os.environ.get("TRANSCRIPTER_PDF_WORKERS", "2"))
+CHUNK_BYTES = 64 * 1024
+# Renders of one report before giving up when other requests keep evicting it
+MAX_RENDER_ATTEMPTS = 3
+
+
+def report_key(
+    summary: str,
+    action_items: List[str],
+    highlights: List[str],
+    topics: List[str],
+    transcript: Optional[str] = None,
+    template_version: str = TEMPLATE_VERSION,
+) -> str:
+    """Content hash identifying a rendered report."""
+    blob = json.dumps(
+        [template_version, summary, action_items, highlights, topics, transcript],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _render_to_file(
+    path: str,
+    summary: str,
+    action_items: List[str],
+    highlights: List[str],
+    topics: List[str],
+    transcript: Optional[str],
+) -> None:
+    # Runs in a worker process
+    write_pdf(summary, action_items, highlights, topics, path, transcript)
+
+
+class PdfRenderCache:
+    """
+    Process-pool PDF renderer with an on-disk, size-bounded cache.
+
+    The least recently served PDFs (by file mtime) are removed once the
+    cache directory grows past max_bytes.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_bytes: int = DEFAULT_PDF_CACHE_BYTES,
+        workers: int = DEFAULT_PDF_WORKERS,
+    ) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_PDF_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.workers = workers
+        self.hits = 0
+        self.misses = 0
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        self._inflight: Dict[str, "asyncio.Future"] = {}
+
+    def path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pdf"
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                # The API process is multithreaded by now; a forked child could
+                # inherit a lock another thread held. Spawned workers start
+                # clean and only import pdf_export.
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
+
+    def _open_cached(self, path: Path) -> Optional[BinaryIO]:
+        try:
+            handle = open(path, "rb")
+        except FileNotFoundError:
+            return None
+        try:
+            # Mark as recently used for eviction
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return handle
+
+    async def get_or_render(
+        self,
+        summary: str,
+        action_items: List[str],
+        highlights: List[str],
+        topics: List[str],
+        transcript: Optional[str] = None,
+    ) -> BinaryIO:
+        """
+        Open the rendered report, rendering it in the pool on a cache miss.
+
+        The file is opened before it is returned, so evicting it afterwards
+        does not affect the caller. The caller closes it (see iter_file).
+
+        Args:
+            summary: Meeting summary text
+            action_items: List of action items
+            highlights: List of highlights
+            topics: List of topics/keywords
+            transcript: Optional full transcript for the appendix
+
+        Returns:
+            The cached PDF file, opened for binary reading
+        """
+        key = report_key(summary, action_items, highlights, topics, transcript)
+        path = self.path_for(key)
+        handle = self._open_cached(path)
+        if handle is not None:
+            self.hits += 1
+            return handle
+
+        for _ in range(MAX_RENDER_ATTEMPTS):
+            task = self._inflight.get(key)
+            if task is None:
+                self.misses += 1
+                task = asyncio.ensure_future(
+                    self._render(key, path, summary, action_items, highlights, topics, transcript)
+                )
+                self._inflight[key] = task
+                task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            # A cancelled request must not cancel the render others are waiting on
+            await asyncio.shield(task)
+            handle = self._open_cached(path)
+            if handle is not None:
+                return handle
+            # Evicted by another request's render before we opened it
+        raise FileNotFoundError(f"Rendered report {path} was evicted before it could be served")
+
+    async def _render(
+        self,
+        key: str,
+        path: Path,
+        summary: str,
+        action_items: List[str],
+        highlights: List[str],
+        topics: List[str],
+        transcript: Optional[str],
+    ) -> Path:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.stem}.{uuid4().hex}.tmp")
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(
+                self._get_pool(), _render_to_file, str(tmp_path),
+                summary, action_items, highlights, topics, transcript,
+            )
+            os.replace(tmp_path, path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        await loop.run_in_executor(None, self._evict, key)
+        return path
+
+    def _evict(self, keep: str) -> None:
+        """Remove the least recently served PDFs, never the one for key keep."""
+        keep_name = self.path_for(keep).name
+        entries = []
+        total = 0
+        for entry in os.scandir(self.cache_dir):
+            if not entry.name.endswith(".pdf"):
+                continue
+            if entry.name == keep_name:
+                # Counted, so the others still make room for it, but kept even
+                # when it alone is larger than max_bytes
+                total += entry.stat().st_size
+                continue
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+        if total <= self.max_bytes:
+            return
+        for _, size, file_path in sorted(entries):
+            try:
+                os.unlink(file_path)
+            except OSError:
+                # Already evicted elsewhere, or still open on a platform
+                # that refuses to delete open files
+                continue
+            total -= size
+            if total <= self.max_bytes:
+                return
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "rendering": len(self._inflight)}
+
+    def shutdown(self) -> None:
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+
+def iter_file(handle: BinaryIO, chunk_size: int = CHUNK_BYTES) -> Iterator[bytes]:
+    """Read an open file in chunks, closing it when done."""
+    with handle:
+        while True:
+            chunk = handle.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+_default_renderer: Optional[PdfRenderCache] = None
+_default_lock = threading.Lock()
+
+
+def get_pdf_renderer() -> PdfRenderCache:
+    """Return the process-wide PDF renderer, creating it on first use."""
+    global _default_renderer
+    with _default_lock:
+        if _default_renderer is None:
+            _default_renderer = PdfRenderCache()
+        return _default_renderer
@@ -3,86 +3,97 @@ PDF Export Module
 
 Generates structured PDF reports from meeting summaries.
 Uses reportlab for PDF generation (lightweight alternative to fpdf).
+Paragraph styles are built once per process, and reports can be written
+straight to a file or any binary stream.
+
+An optional appendix holds the full transcript. Its paragraphs are created
+lazily from a line iterator while reportlab lays out pages, so peak
+memory grows much more slowly with meeting length than building the whole
+story up front (it is not bounded: the transcript itself, and what
+reportlab keeps per page, still scale with it).
 """
 
-from typing import List, Optional
+from collections import deque
+from functools import lru_cache
+from io import BytesIO
+from itertools import chain, islice
 from pathlib import Path
+from typing import Any, BinaryIO, Deque, Dict, Iterable, Iterator, List, Optional, Union
+from xml.sax.saxutils import escape
 
 
-def export_to_pdf(
+PdfOutput = Union[str, Path, BinaryIO]
+# Transcript text, or an iterable of lines (e.g. an open transcript file)
+TranscriptSource = Union[str, Iterable[str]]
+
+# Appendix paragraphs are split at word boundaries past this many characters,
+# so one unpunctuated Vosk line never becomes a single huge flowable
+APPENDIX_PARAGRAPH_CHARS = 1500
+
+# Bump whenever the report layout or styles change, so cached PDFs are re-rendered
+TEMPLATE_VERSION = "2"
+
+
+@lru_cache(maxsize=None)
+def _get_styles() -> Dict[str, Any]:
+    """Report paragraph styles, built on first use and shared by every export."""
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.enums import TA_CENTER
+    
+    styles = getSampleStyleSheet()
+    return {
+        "title": ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            textColor='#1f77b4',
+            spaceAfter=30,
+            alignment=TA_CENTER
+        ),
+        "heading": ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'],
+            fontSize=16,
+            textColor='#2c3e50',
+            spaceAfter=12,
+            spaceBefore=20
+        ),
+        "normal": styles['Normal'],
+        "bullet": ParagraphStyle(
+            'Bullet',
+            parent=styles['Normal'],
+            leftIndent=20,
+            spaceAfter=8
+        ),
+        "transcript": ParagraphStyle(
+            'Transcript',
+            parent=styles['Normal'],
+            fontSize=9,
+            leading=12,
+            spaceAfter=4
+        ),
+    }
+
+
+def _build_story(
     summary: str,
     action_items: List[str],
     highlights: List[str],
     topics: List[str],
-    output_path: Optional[str] = None
-) -> bytes:
-    """
-    Export meeting summary to PDF.
+) -> list:
+    """Flowables for the report sections."""
+    from reportlab.lib.units import inch
+    from reportlab.platypus import Paragraph, Spacer
     
-    Creates a structured PDF with sections for:
-    - Summary
-    - Action Items
-    - Highlights
-    - Topics
-    
-    Args:
-        summary: Meeting summary text
-        action_items: List of action items
-        highlights: List of highlights
-        topics: List of topics/keywords
-        output_path: Optional path to save PDF file. If None, returns bytes.
-        
-    Returns:
-        PDF file as bytes (if output_path is None)
-    """
-    try:
-        from reportlab.lib.pagesizes import letter
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.units import inch
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-        from reportlab.lib.enums import TA_LEFT, TA_CENTER
-        from io import BytesIO
-    except ImportError:
-        # Fallback to fpdf if reportlab is not available
-        return _export_to_pdf_fpdf(summary, action_items, highlights, topics, output_path)
-    
-    # Create buffer or file
-    if output_path:
-        doc = SimpleDocTemplate(output_path, pagesize=letter)
-        buffer = None
-    else:
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=letter)
+    styles = _get_styles()
+    title_style = styles["title"]
+    heading_style = styles["heading"]
+    normal_style = styles["normal"]
+    bullet_style = styles["bullet"]
     
     # Container for PDF content
     story = []
     
-    # Styles
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor='#1f77b4',
-        spaceAfter=30,
-        alignment=TA_CENTER
-    )
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=16,
-        textColor='#2c3e50',
-        spaceAfter=12,
-        spaceBefore=20
-    )
-    normal_style = styles['Normal']
-    bullet_style = ParagraphStyle(
-        'Bullet',
-        parent=styles['Normal'],
-        leftIndent=20,
-        spaceAfter=8
-    )
-    
     # Title
     story.append(Paragraph("Meeting Summary", title_style))
     story.append(Spacer(1, 0.3 * inch))
@@ -94,7 +105,8 @@ def export_to_pdf(
         summary_paragraphs = summary.split('\n')
         for para in summary_paragraphs:
             if para.strip():
-                story.append(Paragraph(para.strip(), normal_style))
+                # Report fields are plain text, not Paragraph markup
+                story.append(Paragraph(escape(para.strip()), normal_style))
                 story.append(Spacer(1, 0.1 * inch))
         story.append(Spacer(1, 0.2 * inch))
     
@@ -104,7 +116,7 @@ def export_to_pdf(
         for item in action_items:
             # Remove leading "- " if present
             clean_item = item.lstrip("- ").strip()
-            story.append(Paragraph(f"• {clean_item}", bullet_style))
+            story.append(Paragraph(f"• {escape(clean_item)}", bullet_style))
         story.append(Spacer(1, 0.2 * inch))
     
     # Highlights Section
@@ -113,30 +125,181 @@ def export_to_pdf(
         for highlight in highlights:
             # Remove leading "- " if present
             clean_highlight = highlight.lstrip("- ").strip()
-            story.append(Paragraph(f"• {clean_highlight}", bullet_style))
+            story.append(Paragraph(f"• {escape(clean_highlight)}", bullet_style))
         story.append(Spacer(1, 0.2 * inch))
     
     # Topics Section
     if topics:
         story.append(Paragraph("Topics", heading_style))
         topics_text = ", ".join(topics)
-        story.append(Paragraph(topics_text, normal_style))
+        story.append(Paragraph(escape(topics_text), normal_style))
         story.append(Spacer(1, 0.2 * inch))
     
-    # Build PDF
+    return story
+
+
+def _transcript_lines(transcript: TranscriptSource) -> Iterator[str]:
+    """Non-empty transcript lines, with overlong lines split at word boundaries."""
+    lines = transcript.splitlines() if isinstance(transcript, str) else transcript
+    for line in lines:
+        line = line.strip()
+        while len(line) > APPENDIX_PARAGRAPH_CHARS:
+            cut = line.rfind(' ', 0, APPENDIX_PARAGRAPH_CHARS)
+            if cut <= 0:
+                cut = APPENDIX_PARAGRAPH_CHARS
+            yield line[:cut]
+            line = line[cut:].lstrip()
+        if line:
+            yield line
+
+
+def _appendix_flowables(transcript: TranscriptSource) -> Iterator[Any]:
+    """Lazily yield the transcript appendix, one paragraph per line."""
+    from reportlab.platypus import PageBreak, Paragraph
+    
+    styles = _get_styles()
+    yield PageBreak()
+    yield Paragraph("Appendix: Full Transcript", styles["heading"])
+    transcript_style = styles["transcript"]
+    for line in _transcript_lines(transcript):
+        # Transcripts are plain text, not Paragraph markup
+        yield Paragraph(escape(line), transcript_style)
+
+
+class _LazyStory:
+    """
+    List-like flowable story that pulls items from an iterator on demand.
+    
+    reportlab's build loop only ever looks at, removes from and pushes back
+    onto the front of the story, so a deque plus a small lookahead stands in
+    for the full list. len() counts only the buffered lookahead; it is
+    non-zero exactly while flowables remain.
+    """
+    
+    def __init__(self, flowables: Iterable[Any], lookahead: int = 32) -> None:
+        self._buffer: Deque[Any] = deque()
+        self._source = iter(flowables)
+        self._lookahead = lookahead
+    
+    def _fill(self, count: int) -> None:
+        missing = count - len(self._buffer)
+        if missing > 0:
+            self._buffer.extend(islice(self._source, missing))
+    
+    def __len__(self) -> int:
+        self._fill(self._lookahead)
+        return len(self._buffer)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            self._fill(index.stop if index.stop is not None else self._lookahead)
+            return list(self._buffer)[index]
+        self._fill(index + 1)
+        return self._buffer[index]
+    
+    def __delitem__(self, index) -> None:
+        if isinstance(index, slice):
+            if index.start not in (None, 0) or index.step not in (None, 1):
+                raise IndexError("_LazyStory only removes from the front")
+            for _ in range(index.stop):
+                self._buffer.popleft()
+        elif index == 0:
+            self._buffer.popleft()
+        else:
+            del self._buffer[index]
+    
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice) and index.start in (None, 0) and index.stop == 0:
+            self._buffer.extendleft(reversed(list(value)))
+        elif isinstance(index, slice):
+            raise IndexError("_LazyStory only inserts at the front")
+        else:
+            self._buffer[index] = value
+    
+    def insert(self, index: int, value: Any) -> None:
+        self._buffer.insert(index, value)
+
+
+def write_pdf(
+    summary: str,
+    action_items: List[str],
+    highlights: List[str],
+    topics: List[str],
+    output: PdfOutput,
+    transcript: Optional[TranscriptSource] = None,
+) -> None:
+    """
+    Render the meeting report into a file path or writable binary stream.
+    
+    Args:
+        summary: Meeting summary text
+        action_items: List of action items
+        highlights: List of highlights
+        topics: List of topics/keywords
+        output: Path to write, or a binary file object (e.g. a temporary file
+            that is then streamed to a client)
+        transcript: Optional full transcript (text or an iterable of lines,
+            such as an open file) appended after the report. Lines are read
+            and laid out one page at a time.
+    """
+    try:
+        from reportlab.lib.pagesizes import letter
+        from reportlab.platypus import SimpleDocTemplate
+    except ImportError:
+        # Fallback to fpdf if reportlab is not available
+        if isinstance(output, (str, Path)):
+            _export_to_pdf_fpdf(summary, action_items, highlights, topics, str(output), transcript)
+        else:
+            output.write(_export_to_pdf_fpdf(summary, action_items, highlights, topics, transcript=transcript))
+        return
+    
+    target = str(output) if isinstance(output, Path) else output
+    doc = SimpleDocTemplate(target, pagesize=letter)
+    story = _build_story(summary, action_items, highlights, topics)
+    if transcript is not None:
+        story = _LazyStory(chain(story, _appendix_flowables(transcript)))
     doc.build(story)
+
+
+def export_to_pdf(
+    summary: str,
+    action_items: List[str],
+    highlights: List[str],
+    topics: List[str],
+    output_path: Optional[str] = None,
+    transcript: Optional[TranscriptSource] = None,
+) -> bytes:
+    """
+    Export meeting summary to PDF.
     
-    # Return bytes if buffer was used
-    if buffer:
-        buffer.seek(0)
-        return buffer.getvalue()
+    Creates a structured PDF with sections for:
+    - Summary
+    - Action Items
+    - Highlights
+    - Topics
+    - Full transcript appendix (optional)
     
-    # If file was saved, read and return bytes
+    Args:
+        summary: Meeting summary text
+        action_items: List of action items
+        highlights: List of highlights
+        topics: List of topics/keywords
+        output_path: Optional path to save PDF file. If None, returns bytes.
+        transcript: Optional full transcript text or iterable of lines to
+            append after the report
+        
+    Returns:
+        PDF file as bytes (also when it was saved to output_path). Use
+        write_pdf to write a file without reading it back.
+    """
     if output_path:
+        write_pdf(summary, action_items, highlights, topics, output_path, transcript)
         with open(output_path, 'rb') as f:
             return f.read()
     
-    return b''
+    buffer = BytesIO()
+    write_pdf(summary, action_items, highlights, topics, buffer, transcript)
+    return buffer.getvalue()
 
 
 def _export_to_pdf_fpdf(
@@ -144,7 +307,8 @@ def _export_to_pdf_fpdf(
     action_items: List[str],
     highlights: List[str],
     topics: List[str],
-    output_path: Optional[str] = None
+    output_path: Optional[str] = None,
+    transcript: Optional[TranscriptSource] = None,
 ) -> bytes:
     """
     Fallback PDF export using fpdf (lighter weight than reportlab).
@@ -154,7 +318,6 @@ def _export_to_pdf_fpdf(
             from fpdf import FPDF
         except ImportError:
             from fpdf2 import FPDF
-        from io import BytesIO
     except ImportError:
         raise ImportError(
             "Either reportlab or fpdf2 is required for PDF export. "
@@ -228,6 +391,19 @@ def _export_to_pdf_fpdf(
         topics_text = ", ".join(topics)
         pdf.multi_cell(0, 7, topics_text)
     
+    # Transcript appendix
+    if transcript is not None:
+        pdf.add_page()
+        pdf.set_font("Arial", "B", 14)
+        pdf.set_text_color(44, 62, 80)
+        pdf.cell(0, 10, "Appendix: Full Transcript", ln=True)
+        pdf.ln(5)
+        pdf.set_font("Arial", "", 9)
+        pdf.set_text_color(0, 0, 0)
+        for line in _transcript_lines(transcript):
+            pdf.multi_cell(0, 5, line)
+            pdf.ln(1)
+    
     # Output
     if output_path:
         pdf.output(output_path)
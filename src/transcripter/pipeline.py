@@ -0,0 +1,138 @@
+"""
+Overlapped STT -> Translation Pipeline
+
+Runs Hindi translation concurrently with Vosk decoding. Each segment that
+transcribe_wav_streaming finalizes is put on a bounded queue, and a worker
+thread translates whatever has accumulated in one batch. The English text
+is ready shortly after decoding ends instead of a full pass later.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple
+
+from .stt import transcribe_wav_streaming
+from .translate import HindiTranslator, get_translator
+
+
+_DONE = object()
+
+
+def _translation_worker(
+	segments: "queue.Queue",
+	translator: HindiTranslator,
+	translated: List[str],
+	output: Optional[TextIO],
+	errors: List[BaseException],
+) -> None:
+	finished = False
+	try:
+		# Load the model while the first segments are still being decoded
+		translator.pipe
+		while not finished:
+			batch = [segments.get()]
+			# Drain whatever else is already queued so it is translated in one batch
+			while True:
+				try:
+					batch.append(segments.get_nowait())
+				except queue.Empty:
+					break
+			if _DONE in batch:
+				finished = True
+				batch = batch[:batch.index(_DONE)]
+			if not batch:
+				continue
+
+			for text in translator.translate_sentences(batch):
+				if not text:
+					continue
+				translated.append(text)
+				if output is not None:
+					output.write(f"{text}\n")
+					output.flush()
+	except BaseException as exc:
+		errors.append(exc)
+		# Keep draining so the decoder never blocks on a full queue
+		if not finished:
+			while segments.get() is not _DONE:
+				pass
+
+
+def transcribe_and_translate(
+	path_wav: str | Path,
+	output_file: Optional[Path | TextIO] = None,
+	translated_output_file: Optional[Path] = None,
+	model=None,
+	show_progress: bool = True,
+	include_timestamps: bool = False,
+	language: str = "hi",
+	translator: Optional[HindiTranslator] = None,
+	queue_size: int = 64,
+	on_segment: Optional[Callable[[str, List[Dict[str, Any]]], None]] = None,
+) -> Tuple[str, str]:
+	"""
+	Transcribe a Hindi WAV file and translate it to English concurrently.
+
+	Args:
+		path_wav: Path to mono 16kHz WAV file
+		output_file: Optional file path or handle for the Hindi transcript
+		translated_output_file: Optional path the English text is streamed to
+		model: Optional pre-loaded Vosk model
+		show_progress: Whether to display transcription progress
+		include_timestamps: Whether to include timestamps in the Hindi output
+		language: Vosk language code of the audio
+		translator: Optional translator (defaults to the shared one)
+		queue_size: Maximum segments waiting for translation; decoding blocks
+			when the translator falls this far behind
+		on_segment: Optional callback also receiving each Hindi segment and
+			its Vosk word timings, as in transcribe_wav_streaming
+
+	Returns:
+		Tuple of (Hindi transcript, English translation)
+	"""
+	if translator is None:
+		translator = get_translator()
+
+	segments: "queue.Queue" = queue.Queue(maxsize=queue_size)
+	translated: list[str] = []
+	errors: list[BaseException] = []
+
+	out_handle = None
+	if translated_output_file is not None:
+		out_handle = open(translated_output_file, 'w', encoding='utf-8', buffering=8192)
+
+	worker = threading.Thread(
+		target=_translation_worker,
+		args=(segments, translator, translated, out_handle, errors),
+		name="translation-worker",
+		daemon=True,
+	)
+	worker.start()
+
+	def handle_segment(text: str, words: List[Dict[str, Any]]) -> None:
+		segments.put(text)
+		if on_segment is not None:
+			on_segment(text, words)
+
+	try:
+		transcript = transcribe_wav_streaming(
+			path_wav,
+			output_file=output_file,
+			model=model,
+			show_progress=show_progress,
+			include_timestamps=include_timestamps,
+			language=language,
+			on_segment=handle_segment,
+		)
+	finally:
+		segments.put(_DONE)
+		worker.join()
+		if out_handle is not None:
+			out_handle.close()
+
+	if errors:
+		raise errors[0]
+	return transcript, " ".join(translated).strip()
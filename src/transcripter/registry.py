@@ -0,0 +1,201 @@
+"""
+Model Registry Module
+
+Process-wide registry for loaded transformers pipelines. Every pipeline
+(summarizers in ai/ and src/transcripter, the translator) is loaded through
+it, so their combined memory is accounted for in one place and the least
+recently used models are evicted once a configurable budget is exceeded.
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+
+DEFAULT_BUDGET_BYTES = int(os.environ.get("TRANSCRIPTER_MODEL_MEMORY_MB", "3072")) * 1024 * 1024
+
+
+@dataclass
+class _Entry:
+	model: Any
+	size_bytes: int
+	load_seconds: float
+	last_used: float
+
+
+def _rss_bytes() -> Optional[int]:
+	try:
+		with open("/proc/self/statm", "r") as f:
+			return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+	except (OSError, ValueError, IndexError):
+		return None
+
+
+def _tensor_bytes(value: Any) -> int:
+	if hasattr(value, "numel") and hasattr(value, "element_size"):
+		return value.numel() * value.element_size()
+	if isinstance(value, (tuple, list)):
+		return sum(_tensor_bytes(v) for v in value)
+	return 0
+
+
+def estimate_model_bytes(model: Any) -> int:
+	"""
+	Estimate the resident size of a loaded pipeline or model.
+
+	PyTorch modules are measured from their state dict (which also covers
+	dynamic-quantized packed weights); ONNX Runtime models from the size of
+	their exported graph files. Returns 0 when nothing can be measured.
+	"""
+	inner = getattr(model, "model", model)
+	state_dict = getattr(inner, "state_dict", None)
+	if callable(state_dict):
+		try:
+			return sum(_tensor_bytes(v) for v in state_dict().values())
+		except Exception:
+			pass
+
+	save_dir = getattr(inner, "model_save_dir", None)
+	if save_dir is not None and Path(save_dir).is_dir():
+		return sum(p.stat().st_size for p in Path(save_dir).glob("*.onnx*"))
+	return 0
+
+
+class ModelRegistry:
+	"""
+	LRU registry of loaded models bounded by an estimated memory budget.
+
+	Models are looked up by key and loaded on first use via a loader
+	callable. Loads of different keys run concurrently; concurrent requests
+	for the same key share a single load.
+	"""
+
+	def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES) -> None:
+		self.budget_bytes = budget_bytes
+		self.hits = 0
+		self.misses = 0
+		self.evictions = 0
+		self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+		# Sizes of models seen before, so they can be made room for before reloading
+		self._known_sizes: Dict[Hashable, int] = {}
+		self._key_locks: Dict[Hashable, threading.Lock] = {}
+		self._lock = threading.Lock()
+
+	def get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+		"""Return the model for key, loading (and evicting others) if needed."""
+		with self._lock:
+			entry = self._touch(key)
+			if entry is not None:
+				self.hits += 1
+				return entry.model
+			key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+		with key_lock:
+			with self._lock:
+				entry = self._touch(key)
+				if entry is not None:
+					self.hits += 1
+					return entry.model
+				self.misses += 1
+				evicted = self._evict_for(self._known_sizes.get(key, 0), keep=key)
+			# Free the evicted models before loading, outside the registry lock
+			if evicted:
+				gc.collect()
+
+			rss_before = _rss_bytes()
+			start = time.perf_counter()
+			model = loader()
+			load_seconds = time.perf_counter() - start
+
+			size = estimate_model_bytes(model)
+			if not size and rss_before is not None:
+				size = max((_rss_bytes() or rss_before) - rss_before, 0)
+
+			with self._lock:
+				self._entries[key] = _Entry(model, size, load_seconds, time.time())
+				self._known_sizes[key] = size
+				evicted = self._evict_for(0, keep=key)
+			if evicted:
+				gc.collect()
+			return model
+
+	def _touch(self, key: Hashable) -> Optional[_Entry]:
+		entry = self._entries.get(key)
+		if entry is not None:
+			entry.last_used = time.time()
+			self._entries.move_to_end(key)
+		return entry
+
+	def _evict_for(self, incoming_bytes: int, keep: Hashable) -> bool:
+		"""
+		Drop least recently used models until incoming_bytes fit. Called with
+		self._lock held; returns whether anything was dropped so the caller
+		can collect garbage after releasing it.
+		"""
+		evicted = False
+		for key in list(self._entries):
+			if self.total_bytes() + incoming_bytes <= self.budget_bytes:
+				break
+			if key == keep:
+				continue
+			del self._entries[key]
+			self.evictions += 1
+			evicted = True
+		return evicted
+
+	def evict(self, key: Hashable) -> bool:
+		"""Drop a model from the registry. Returns True if it was loaded."""
+		with self._lock:
+			entry = self._entries.pop(key, None)
+		if entry is None:
+			return False
+		self.evictions += 1
+		gc.collect()
+		return True
+
+	def clear(self) -> None:
+		with self._lock:
+			self._entries.clear()
+		gc.collect()
+
+	def total_bytes(self) -> int:
+		return sum(e.size_bytes for e in self._entries.values())
+
+	def loaded(self) -> List[Dict[str, Any]]:
+		"""Describe loaded models, least recently used first."""
+		with self._lock:
+			return [
+				{
+					"key": list(key) if isinstance(key, tuple) else key,
+					"bytes": entry.size_bytes,
+					"load_seconds": round(entry.load_seconds, 3),
+					"last_used": entry.last_used,
+				}
+				for key, entry in self._entries.items()
+			]
+
+	def stats(self) -> Dict[str, int]:
+		with self._lock:
+			return {
+				"models": len(self._entries),
+				"bytes": self.total_bytes(),
+				"budget_bytes": self.budget_bytes,
+				"hits": self.hits,
+				"misses": self.misses,
+				"evictions": self.evictions,
+			}
+
+
+_registry = ModelRegistry()
+
+
+def get_registry() -> ModelRegistry:
+	"""Return the process-wide model registry."""
+	return _registry
@@ -0,0 +1,179 @@
+"""
+Transcript Search Index Module
+
+Turns Vosk word timings into inverted-index postings (term -> word offsets
+and start times in milliseconds) and ranks meetings for a query with BM25.
+Storage is left to the caller: postings are produced once per meeting as it
+is transcribed, so the index grows incrementally and searching never
+rescans transcript text.
+"""
+
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Sequence
+
+from .topics import STOPWORDS
+
+
+_TERM = re.compile(r"[^\w']+")
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+
+def normalize_term(word: str) -> str:
+    """Lowercase a word and strip punctuation ("Churn," -> "churn")."""
+    return _TERM.sub("", word.lower()).strip("'")
+
+
+def query_terms(query: str) -> List[str]:
+    """Distinct searchable terms of a query, in order; stopwords are not indexed, so they are dropped."""
+    terms = (normalize_term(w) for w in query.split())
+    return list(dict.fromkeys(t for t in terms if t and t not in STOPWORDS))
+
+
+@dataclass
+class Postings:
+    """Occurrences of one term in one meeting."""
+    offsets: List[int] = field(default_factory=list)
+    # Start time of each occurrence in ms, or -1 when no timing is known
+    times_ms: List[int] = field(default_factory=list)
+
+
+def build_postings(words: Sequence[Mapping[str, Any]]) -> Dict[str, Postings]:
+    """
+    Postings for every non-stopword term of a meeting from Vosk word results.
+
+    Stopwords are never searched for (see query_terms), so they are skipped
+    rather than stored; offsets still count every word.
+
+    Args:
+        words: Word dicts with "word" and optionally "start" (seconds), as
+            emitted by KaldiRecognizer with SetWords(True)
+
+    Returns:
+        Mapping of term to its Postings, offsets in transcript word order
+    """
+    postings: Dict[str, Postings] = {}
+    for offset, item in enumerate(words):
+        term = normalize_term(str(item.get("word", "")))
+        if not term or term in STOPWORDS:
+            continue
+        start = item.get("start")
+        entry = postings.get(term)
+        if entry is None:
+            entry = postings[term] = Postings()
+        entry.offsets.append(offset)
+        entry.times_ms.append(int(round(float(start) * 1000)) if start is not None else -1)
+    return postings
+
+
+def words_from_text(transcript: str) -> List[Dict[str, Any]]:
+    """Untimed word list for transcripts that have no Vosk timings."""
+    return [{"word": word} for word in transcript.split()]
+
+
+def bm25(tf: int, df: int, n_docs: int, doc_len: int, avg_doc_len: float) -> float:
+    """BM25 weight of one term in one meeting."""
+    idf = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+    norm = K1 * (1.0 - B + B * doc_len / avg_doc_len) if avg_doc_len > 0 else K1
+    return idf * tf * (K1 + 1.0) / (tf + norm)
+
+
+@dataclass
+class SearchHit:
+    """A ranked meeting with the positions where the query terms occur."""
+    meeting_id: str
+    score: float
+    hits: List[Dict[str, Any]]
+
+
+def rank_meetings(
+    term_postings: Mapping[str, Mapping[str, Any]],
+    n_docs: int,
+    avg_doc_len: float,
+    doc_lens: Mapping[str, int],
+    limit: int = 20,
+    hits_per_meeting: int = 10,
+) -> List[SearchHit]:
+    """
+    Rank meetings by summed BM25 over the query terms.
+
+    Args:
+        term_postings: term -> {meeting_id: posting}, where a posting has
+            "tf", "offsets" and "times_ms" (offsets may be truncated; tf is
+            the full count)
+        n_docs: Meetings in the searched collection
+        avg_doc_len: Average meeting length in words
+        doc_lens: Length in words of each meeting that has postings
+        limit: Meetings to return
+        hits_per_meeting: Occurrences returned per meeting, earliest first
+
+    Returns:
+        Best meetings first, each with its occurrence list
+    """
+    scores: Dict[str, float] = {}
+    occurrences: Dict[str, List[Dict[str, Any]]] = {}
+    for term, by_meeting in term_postings.items():
+        df = len(by_meeting)
+        for meeting_id, posting in by_meeting.items():
+            scores[meeting_id] = scores.get(meeting_id, 0.0) + bm25(
+                posting["tf"], df, n_docs, doc_lens.get(meeting_id, 0), avg_doc_len
+            )
+            occurrences.setdefault(meeting_id, []).extend(
+                {"term": term, "offset": offset, "start_ms": start_ms if start_ms >= 0 else None}
+                for offset, start_ms in zip(posting["offsets"], posting["times_ms"])
+            )
+
+    ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+    return [
+        SearchHit(
+            meeting_id=meeting_id,
+            score=round(score, 4),
+            hits=sorted(occurrences[meeting_id], key=lambda hit: hit["offset"])[:hits_per_meeting],
+        )
+        for meeting_id, score in ranked
+    ]
+
+
+class InvertedIndex:
+    """
+    In-memory index over meetings, for the CLI and tests.
+
+    The API keeps the same postings in MongoDB instead.
+    """
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Dict[str, Postings]] = {}
+        self._doc_lens: Dict[str, int] = {}
+
+    def add_meeting(self, meeting_id: str, words: Sequence[Mapping[str, Any]]) -> None:
+        if meeting_id in self._doc_lens:
+            self.remove_meeting(meeting_id)
+        for term, postings in build_postings(words).items():
+            self._postings.setdefault(term, {})[meeting_id] = postings
+        self._doc_lens[meeting_id] = len(words)
+
+    def remove_meeting(self, meeting_id: str) -> None:
+        self._doc_lens.pop(meeting_id, None)
+        for term in list(self._postings):
+            by_meeting = self._postings[term]
+            by_meeting.pop(meeting_id, None)
+            if not by_meeting:
+                del self._postings[term]
+
+    def search(self, query: str, limit: int = 20, hits_per_meeting: int = 10) -> List[SearchHit]:
+        n_docs = len(self._doc_lens)
+        if not n_docs:
+            return []
+        term_postings = {
+            term: {
+                meeting_id: {"tf": len(p.offsets), "offsets": p.offsets, "times_ms": p.times_ms}
+                for meeting_id, p in self._postings.get(term, {}).items()
+            }
+            for term in query_terms(query)
+        }
+        avg_doc_len = sum(self._doc_lens.values()) / n_docs
+        return rank_meetings(term_postings, n_docs, avg_doc_len, self._doc_lens, limit, hits_per_meeting)
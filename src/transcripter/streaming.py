@@ -0,0 +1,144 @@
+"""
+Streaming Extraction Module
+
+Incremental versions of the action item, highlight and topic extractors.
+They keep small running state (a dedup set, a bounded top-k heap and a
+word Counter) and accept transcript segments as transcribe_wav_streaming
+finalizes them, so results are ready the moment decoding ends or can be
+shown live during a meeting.
+
+Each segment is split into sentences on its own. Vosk segments carry no
+punctuation, so an unpunctuated segment acts as one sentence.
+
+Example:
+    extractors = StreamingExtractors()
+    transcribe_wav_streaming(wav, on_segment=extractors.feed)
+    results = extractors.results()
+"""
+
+import heapq
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from .action_items import MAX_ACTION_ITEMS, is_action_sentence
+from .document import Document, clean_sentence
+from .highlights import format_highlights, highlight_score, is_fallback_sentence
+from .topics import topic_words
+
+
+class StreamingActionItems:
+    """Action items collected in order, deduplicated by a seen-key set."""
+
+    def __init__(self, limit: int = MAX_ACTION_ITEMS) -> None:
+        self.limit = limit
+        self._items: List[str] = []
+        self._seen: set = set()
+
+    def feed(self, doc: Document) -> None:
+        if len(self._items) >= self.limit:
+            return
+        for sentence, hits in zip(doc.sentences, doc.category_hits()):
+            if not is_action_sentence(sentence, hits):
+                continue
+            cleaned = clean_sentence(sentence)
+            item_key = cleaned.lower()[:50]
+            if item_key in self._seen:
+                continue
+            self._seen.add(item_key)
+            self._items.append(f"- {cleaned}")
+            if len(self._items) >= self.limit:
+                return
+
+    def results(self) -> List[str]:
+        return list(self._items)
+
+
+class StreamingHighlights:
+    """
+    Top-k highlight sentences kept in a bounded min-heap.
+
+    Ties keep the earlier sentence, matching extract_highlights' stable sort.
+    A bounded list of early fallback sentences fills any remaining slots.
+    """
+
+    def __init__(self, max_highlights: int = 7) -> None:
+        self.max_highlights = max_highlights
+        self._heap: List[tuple] = []
+        self._fallback: Dict[str, None] = {}
+        self._index = 0
+
+    def feed(self, doc: Document) -> None:
+        for sentence, hits in zip(doc.sentences, doc.category_hits()):
+            index = self._index
+            self._index += 1
+
+            score = highlight_score(sentence, hits)
+            if score > 0:
+                # Smallest score (then latest sentence) sits at the root
+                entry = (score, -index, sentence)
+                if len(self._heap) < self.max_highlights:
+                    heapq.heappush(self._heap, entry)
+                elif entry > self._heap[0]:
+                    heapq.heapreplace(self._heap, entry)
+
+            # Enough distinct candidates to fill every slot even if all of
+            # them also end up among the top sentences
+            if is_fallback_sentence(sentence) and len(self._fallback) < 2 * self.max_highlights:
+                self._fallback.setdefault(sentence)
+
+    def results(self) -> List[str]:
+        top_sentences = [sentence for _, _, sentence in sorted(self._heap, reverse=True)]
+        if len(top_sentences) < self.max_highlights:
+            chosen = set(top_sentences)
+            remaining = [s for s in self._fallback if s not in chosen]
+            top_sentences.extend(remaining[:self.max_highlights - len(top_sentences)])
+        return format_highlights(top_sentences)
+
+
+class StreamingTopics:
+    """Running word Counter for topic extraction."""
+
+    def __init__(self, top_n: int = 5) -> None:
+        self.top_n = top_n
+        self._counts: Counter = Counter()
+
+    def feed(self, doc: Document) -> None:
+        self._counts.update(topic_words(doc.words))
+
+    def results(self) -> List[str]:
+        return [word.capitalize() for word, count in self._counts.most_common(self.top_n) if count > 0]
+
+
+class StreamingExtractors:
+    """
+    Runs all streaming extractors over incoming segments.
+
+    feed() matches the on_segment callback of transcribe_wav_streaming and
+    may be called from the decoding thread while results() is read elsewhere.
+    """
+
+    def __init__(self, max_highlights: int = 7, top_n: int = 5) -> None:
+        self.action_items = StreamingActionItems()
+        self.highlights = StreamingHighlights(max_highlights)
+        self.topics = StreamingTopics(top_n)
+        self._lock = threading.Lock()
+
+    def feed(self, text: str, words: Optional[List[Dict[str, Any]]] = None) -> None:
+        """Analyze one finalized segment (word timings are accepted but unused)."""
+        doc = Document.from_text(text)
+        if not doc.sentences:
+            return
+        with self._lock:
+            self.action_items.feed(doc)
+            self.highlights.feed(doc)
+            self.topics.feed(doc)
+
+    def results(self) -> Dict[str, List[str]]:
+        """Current action items, highlights and topics."""
+        with self._lock:
+            return {
+                "action_items": self.action_items.results(),
+                "highlights": self.highlights.results(),
+                "topics": self.topics.results(),
+            }
@@ -5,7 +5,7 @@ import os
 import sys
 import time
 from pathlib import Path
-from typing import Optional, TextIO
+from typing import Any, Callable, Dict, List, Optional, TextIO
 
 import requests
 from vosk import KaldiRecognizer, Model
@@ -103,7 +103,12 @@ def load_vosk_model(models_dir: str | Path = "models", language: str = "en") ->
 	return Model(str(model_dir))
 
 
-def transcribe_wav(path_wav: str | Path, model: Optional[Model] = None, language: str = "en") -> str:
+def transcribe_wav(
+	path_wav: str | Path,
+	model: Optional[Model] = None,
+	language: str = "en",
+	on_segment: Optional[Callable[[str, List[Dict[str, Any]]], None]] = None,
+) -> str:
 	"""
 	Transcribe a mono 16kHz WAV file using Vosk.
 	Returns the transcript string.
@@ -112,6 +117,8 @@ def transcribe_wav(path_wav: str | Path, model: Optional[Model] = None, language
 		path_wav: Path to WAV file
 		model: Optional pre-loaded Vosk model
 		language: Language code ('en' for English, 'hi' for Hindi)
+		on_segment: Optional callback receiving each finalized segment's text and
+			its Vosk word timings (list of {"word", "start", "end", "conf"})
 	
 	Note: For better efficiency with long files, use transcribe_wav_streaming() instead.
 	"""
@@ -138,10 +145,14 @@ def transcribe_wav(path_wav: str | Path, model: Optional[Model] = None, language
 			res = json.loads(rec.Result())
 			if 'text' in res:
 				results.append(res['text'])
+				if on_segment is not None and res['text'].strip():
+					on_segment(res['text'].strip(), res.get('result', []))
 	# Final bits
 	final_res = json.loads(rec.FinalResult())
 	if 'text' in final_res:
 		results.append(final_res['text'])
+		if on_segment is not None and final_res['text'].strip():
+			on_segment(final_res['text'].strip(), final_res.get('result', []))
 
 	transcript = ' '.join(s.strip() for s in results if s.strip())
 	return transcript.strip()
@@ -155,11 +166,14 @@ def transcribe_wav_streaming(
 	include_timestamps: bool = False,
 	chunk_size_bytes: int = 8000,  # ~0.5s chunks for better throughput
 	language: str = "en",
+	on_segment: Optional[Callable[[str, List[Dict[str, Any]]], None]] = None,
 ) -> str:
 	"""
 	Efficiently transcribe a WAV file with streaming output and progress tracking.
 	
 	This function writes transcript incrementally to avoid memory issues with long files.
+	Each finalized segment can also be handed to on_segment as soon as Vosk emits it,
+	so downstream stages (translation, extraction) can run while decoding continues.
 	
 	Args:
 		path_wav: Path to mono 16kHz WAV file
@@ -170,6 +184,8 @@ def transcribe_wav_streaming(
 		include_timestamps: Whether to include timestamps in output
 		chunk_size_bytes: Audio chunk size in bytes (larger = faster but less frequent updates)
 		language: Language code ('en' for English, 'hi' for Hindi)
+		on_segment: Optional callback receiving each finalized segment's text and
+			its Vosk word timings (list of {"word", "start", "end", "conf"})
 	
 	Returns:
 		Full transcript string
@@ -218,6 +234,8 @@ def transcribe_wav_streaming(
 				if 'text' in res and res['text'].strip():
 					text = res['text'].strip()
 					results.append(text)
+					if on_segment is not None:
+						on_segment(text, res.get('result', []))
 					
 					# Write immediately to file if streaming
 					if file_handle is not None:
@@ -258,6 +276,8 @@ def transcribe_wav_streaming(
 		if 'text' in final_res and final_res['text'].strip():
 			text = final_res['text'].strip()
 			results.append(text)
+			if on_segment is not None:
+				on_segment(text, final_res.get('result', []))
 			if file_handle is not None:
 				if include_timestamps:
 					# Approximate final timestamp
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from functools import lru_cache
-from typing import Optional, Dict, List, Any
+import threading
+import time
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Callable, Optional, Dict, List, Any
 
-from transformers import pipeline
+from .backends import DEFAULT_BACKEND, load_summarization_pipeline
+from .extractive import extractive_summary
+from .registry import get_registry
+from .summary_cache import SummaryCache, get_default_cache, make_key
 
 
 DEFAULT_MODEL = "sshleifer/distilbart-cnn-12-6"
@@ -20,29 +26,225 @@ class SummarizationConfig:
 	min_length: int = 30
 	no_repeat_ngram_size: int = 3
 	do_sample: bool = False
+	backend: str = DEFAULT_BACKEND  # "pytorch", "quantized" or "onnx"
+	# "abstractive", "extractive", or "auto" (abstractive only if the remaining
+	# model work is expected to finish within time_budget_s seconds)
+	mode: str = "abstractive"
+	time_budget_s: Optional[float] = None
+	extractive_sentences: int = 5
+	extractive_method: str = "textrank"
+	use_cache: bool = True
+	# Topics from frequency counts by default; corpus_topics scores them with
+	# TF-IDF against the shared IDF index, which update_topic_index also grows
+	corpus_topics: bool = False
+	update_topic_index: bool = False
 
 
-def _load_pipeline(model_name: str):
-	return pipeline(
-		"summarization",
-		model=model_name,
-		tokenizer=model_name,
-		device=-1,
+SUMMARIZATION_MODES = ("abstractive", "extractive", "auto")
+
+# Config fields that do not change the abstractive text and so stay out of cache keys
+_UNCACHED_FIELDS = {
+	"use_cache",
+	"mode",
+	"time_budget_s",
+	"extractive_sentences",
+	"extractive_method",
+	"corpus_topics",
+	"update_topic_index",
+}
+
+# Prior for seconds per model call on CPU, refined by observed latencies
+_DEFAULT_CALL_SECONDS = 2.0
+_call_seconds: Dict[tuple, float] = {}
+# Updated from the summary executor threads and the caller's thread
+_call_seconds_lock = threading.Lock()
+
+
+class _BudgetExceeded(Exception):
+	"""Raised internally when the next model call would overrun the deadline."""
+
+# Chunks are cut on content-defined word boundaries once they pass this fraction
+# of max_chars, so an edit only shifts the chunks around it instead of every
+# chunk after it.
+_CHUNK_MIN_FRACTION = 0.75
+_BOUNDARY_MASK = 0x1F
+
+# process_transcript runs the summarizer here while the extractors run on the
+# caller's thread; one pipeline call already uses every core via torch threads
+_SUMMARY_WORKERS = 2
+_summary_executor: Optional[ThreadPoolExecutor] = None
+_summary_executor_lock = threading.Lock()
+
+
+def _load_pipeline(model_name: str, backend: str = DEFAULT_BACKEND):
+	return load_summarization_pipeline(model_name, backend)
+
+
+def _get_pipeline(model_name: str, backend: str = DEFAULT_BACKEND):
+	return get_registry().get(
+		("summarization", model_name, backend),
+		lambda: _load_pipeline(model_name, backend),
+	)
+
+
+def _cache_params(config: SummarizationConfig) -> Dict[str, Any]:
+	return {k: v for k, v in asdict(config).items() if k not in _UNCACHED_FIELDS}
+
+
+def _is_boundary(word: str) -> bool:
+	if word[-1] in ".!?":
+		return True
+	return (zlib.crc32(word.lower().encode("utf-8")) & _BOUNDARY_MASK) == 0
+
+
+class _ChunkBuilder:
+	"""
+	Accumulates words into chunks of at most max_chars.
+
+	Cut points depend only on the words around them, so identical regions
+	of two transcripts produce identical chunks (and identical cache keys),
+	whether the text arrives at once or segment by segment.
+	"""
+
+	def __init__(self, max_chars: int = 3000) -> None:
+		self.max_chars = max_chars
+		self.min_chars = int(max_chars * _CHUNK_MIN_FRACTION)
+		self._words: list[str] = []
+		self._size = 0
+
+	def add(self, word: str) -> List[str]:
+		"""Add a word, returning the chunks it completed (zero, one or two)."""
+		done: list[str] = []
+		if self._words and self._size + len(word) > self.max_chars:
+			done.append(self._take())
+		self._words.append(word)
+		self._size += len(word) + 1
+		if self._size >= self.min_chars and _is_boundary(word):
+			done.append(self._take())
+		return done
+
+	def flush(self) -> Optional[str]:
+		"""Return the pending partial chunk, if any."""
+		return self._take() if self._words else None
+
+	def pending_text(self) -> str:
+		return " ".join(self._words)
+
+	def _take(self) -> str:
+		chunk = " ".join(self._words)
+		self._words, self._size = [], 0
+		return chunk
+
+
+def _chunk_text(text: str, max_chars: int = 3000) -> List[str]:
+	"""Split text into content-defined chunks of at most max_chars on word boundaries."""
+	builder = _ChunkBuilder(max_chars)
+	chunks: list[str] = []
+	for word in text.split():
+		chunks.extend(builder.add(word))
+	last = builder.flush()
+	if last:
+		chunks.append(last)
+	return chunks
+
+
+def _estimate_call_seconds(config: SummarizationConfig) -> float:
+	with _call_seconds_lock:
+		return _call_seconds.get((config.model_name, config.backend), _DEFAULT_CALL_SECONDS)
+
+
+def _check_deadline(config: SummarizationConfig, deadline: Optional[float]) -> None:
+	if deadline is not None and time.monotonic() + _estimate_call_seconds(config) > deadline:
+		raise _BudgetExceeded()
+
+
+def _run_pipe(pipe, text: str, config: SummarizationConfig, **kwargs) -> str:
+	start = time.monotonic()
+	out = pipe(text, **kwargs)
+	elapsed = time.monotonic() - start
+	key = (config.model_name, config.backend)
+	# Exponential moving average so one slow call does not dominate
+	with _call_seconds_lock:
+		_call_seconds[key] = elapsed if key not in _call_seconds else 0.7 * _call_seconds[key] + 0.3 * elapsed
+	if out and isinstance(out, list) and 'summary_text' in out[0]:
+		return out[0]['summary_text']
+	return ""
+
+
+def _summarize_chunk(
+	get_pipe: Callable[[], Any],
+	chunk: str,
+	config: SummarizationConfig,
+	cache: Optional[SummaryCache],
+	deadline: Optional[float] = None,
+) -> str:
+	key = make_key("chunk", chunk, _cache_params(config)) if cache is not None else None
+	if key is not None:
+		cached = cache.get(key)
+		if cached is not None:
+			return cached
+
+	_check_deadline(config, deadline)
+	pipe = get_pipe()
+	_check_deadline(config, deadline)
+	summary = _run_pipe(
+		pipe,
+		chunk,
+		config,
+		max_length=config.max_length,
+		min_length=config.min_length,
+		no_repeat_ngram_size=config.no_repeat_ngram_size,
+		do_sample=config.do_sample,
 	)
+	if key is not None and summary:
+		cache.set(key, summary)
+	return summary
 
 
-@lru_cache(maxsize=2)
-def _get_pipeline(model_name: str):
-	return _load_pipeline(model_name)
+def _reduce_summaries(
+	get_pipe: Callable[[], Any],
+	summaries: List[str],
+	config: SummarizationConfig,
+	cache: Optional[SummaryCache],
+	deadline: Optional[float] = None,
+) -> str:
+	if len(summaries) == 1:
+		return summaries[0]
 
+	joined = "\n".join(summaries)
+	key = make_key("reduce", joined, _cache_params(config)) if cache is not None else None
+	if key is not None:
+		cached = cache.get(key)
+		if cached is not None:
+			return cached
 
-def summarize_text(text: str, config: Optional[SummarizationConfig] = None) -> str:
+	_check_deadline(config, deadline)
+	pipe = get_pipe()
+	_check_deadline(config, deadline)
+	summary = _run_pipe(pipe, joined, config, max_length=160, min_length=40)
+	if key is not None and summary:
+		cache.set(key, summary)
+	return summary or summaries[0]
+
+
+def summarize_text(
+	text: str,
+	config: Optional[SummarizationConfig] = None,
+	cache: Optional[SummaryCache] = None,
+) -> str:
 	"""
 	Generate summary from text (original function for backward compatibility).
 	
+	Chunk and reduce summaries are looked up in the summary cache first, and
+	the model is only loaded if at least one of them is missing. In "auto"
+	mode the abstractive pass is abandoned for an extractive summary as soon
+	as the next model call is expected to overrun config.time_budget_s.
+	
 	Args:
 		text: Input text to summarize
 		config: Optional summarization configuration
+		cache: Optional summary cache (defaults to the shared on-disk cache
+			when config.use_cache is set)
 		
 	Returns:
 		Summary text string
@@ -51,42 +253,209 @@ def summarize_text(text: str, config: Optional[SummarizationConfig] = None) -> s
 		return ""
 	if config is None:
 		config = SummarizationConfig()
+	if config.mode not in SUMMARIZATION_MODES:
+		raise ValueError(f"Unsupported summarization mode: {config.mode}. Supported: {list(SUMMARIZATION_MODES)}")
 
-	pipe = _get_pipeline(config.model_name)
+	if config.mode == "extractive":
+		return extractive_summary(text, config.extractive_sentences, config.extractive_method)
 
-	max_chars = 3000
-	chunks: list[str] = []
-	cur = 0
-	while cur < len(text):
-		chunks.append(text[cur:cur + max_chars])
-		cur += max_chars
-
-	summaries: list[str] = []
-	for chunk in chunks:
-		out = pipe(
-			chunk,
-			max_length=config.max_length,
-			min_length=config.min_length,
-			no_repeat_ngram_size=config.no_repeat_ngram_size,
-			do_sample=config.do_sample,
-		)
-		if out and isinstance(out, list) and 'summary_text' in out[0]:
-			summaries.append(out[0]['summary_text'])
-
-	if len(summaries) > 1:
-		joined = "\n".join(summaries)
-		out2 = pipe(joined, max_length=160, min_length=40)
-		if out2 and isinstance(out2, list) and 'summary_text' in out2[0]:
-			return out2[0]['summary_text']
-
-	return summaries[0] if summaries else ""
-
-
-def process_transcript(transcript: str, config: Optional[SummarizationConfig] = None) -> Dict[str, Any]:
+	if cache is None and config.use_cache:
+		cache = get_default_cache()
+
+	chunks = _chunk_text(text)
+	deadline = None
+	if config.mode == "auto" and config.time_budget_s is not None:
+		deadline = time.monotonic() + config.time_budget_s
+		params = _cache_params(config)
+		pending = sum(1 for c in chunks if cache is None or not cache.contains(make_key("chunk", c, params)))
+		if pending and len(chunks) > 1:
+			pending += 1  # the reduce pass over new chunk summaries
+		if pending * _estimate_call_seconds(config) > config.time_budget_s:
+			return extractive_summary(text, config.extractive_sentences, config.extractive_method)
+
+	def get_pipe():
+		return _get_pipeline(config.model_name, config.backend)
+
+	try:
+		summaries: list[str] = []
+		for chunk in chunks:
+			summary = _summarize_chunk(get_pipe, chunk, config, cache, deadline)
+			if summary:
+				summaries.append(summary)
+
+		if not summaries:
+			return ""
+		return _reduce_summaries(get_pipe, summaries, config, cache, deadline)
+	except _BudgetExceeded:
+		return extractive_summary(text, config.extractive_sentences, config.extractive_method)
+
+
+class IncrementalSummarizer:
+	"""
+	Rolling summary that is updated as transcript segments arrive.
+
+	Incoming words are cut into the same content-defined chunks as
+	summarize_text. Only a newly completed chunk is summarized; every
+	fan_in chunk summaries are folded into one group summary, and the
+	top-level summary is re-reduced over the group summaries plus the
+	current group. Each update therefore costs one chunk summary and at
+	most two short reduce passes, however long the meeting runs.
+
+	add_segment only cuts the words into chunks; the summarization runs on
+	the shared summary executor, one update at a time and in order, so it
+	can be called straight from a decoder callback without stalling it.
+	
+	Example:
+		summarizer = IncrementalSummarizer()
+		transcribe_wav_streaming(wav, on_segment=lambda text, words: summarizer.add_segment(text))
+		final = summarizer.finish()
+	"""
+
+	def __init__(
+		self,
+		config: Optional[SummarizationConfig] = None,
+		cache: Optional[SummaryCache] = None,
+		max_chars: int = 3000,
+		fan_in: int = 8,
+	) -> None:
+		self.config = config or SummarizationConfig()
+		if cache is None and self.config.use_cache:
+			cache = get_default_cache()
+		self.cache = cache
+		self.fan_in = fan_in
+		self._builder = _ChunkBuilder(max_chars)
+		self._group_summaries: list[str] = []
+		self._current_group: list[str] = []
+		self._summary = ""
+		self._lock = threading.Lock()
+		# Completed chunks waiting for the background worker
+		self._pending: list[str] = []
+		self._pending_lock = threading.Lock()
+		self._draining = False
+		self._worker: Optional[Future] = None
+		self._error: Optional[BaseException] = None
+
+	@property
+	def summary(self) -> str:
+		"""Latest rolling summary (empty until the first chunk completes)."""
+		return self._summary
+
+	def _get_pipe(self):
+		return _get_pipeline(self.config.model_name, self.config.backend)
+
+	def _summarize(self, text: str) -> str:
+		if self.config.mode == "extractive":
+			return extractive_summary(text, self.config.extractive_sentences, self.config.extractive_method)
+		return _summarize_chunk(self._get_pipe, text, self.config, self.cache)
+
+	def _reduce(self, summaries: List[str]) -> str:
+		if self.config.mode == "extractive":
+			return extractive_summary(
+				"\n".join(summaries), self.config.extractive_sentences, self.config.extractive_method
+			)
+		return _reduce_summaries(self._get_pipe, summaries, self.config, self.cache)
+
+	def _add_chunk(self, chunk: str) -> None:
+		summary = self._summarize(chunk)
+		if not summary:
+			return
+		self._current_group.append(summary)
+		if len(self._current_group) >= self.fan_in:
+			self._group_summaries.append(self._reduce(self._current_group))
+			self._current_group = []
+
+	def _refresh(self) -> None:
+		parts = self._group_summaries + self._current_group
+		self._summary = self._reduce(parts) if parts else ""
+
+	def _drain(self) -> None:
+		try:
+			while True:
+				with self._pending_lock:
+					chunks, self._pending = self._pending, []
+					if not chunks:
+						self._draining = False
+						return
+				with self._lock:
+					for chunk in chunks:
+						self._add_chunk(chunk)
+					self._refresh()
+		except BaseException as exc:
+			with self._pending_lock:
+				self._draining = False
+				if self._error is None:
+					self._error = exc
+
+	def add_segment(self, text: str) -> bool:
+		"""
+		Feed a finalized transcript segment.
+
+		Returns immediately; completed chunks are summarized in the background.
+
+		Returns:
+			True if a chunk completed and a rolling summary update was scheduled
+		"""
+		with self._pending_lock:
+			completed: list[str] = []
+			for word in text.split():
+				completed.extend(self._builder.add(word))
+			self._pending.extend(completed)
+			if completed and not self._draining:
+				self._draining = True
+				self._worker = _get_summary_executor().submit(self._drain)
+			return bool(completed)
+
+	def finish(self) -> str:
+		"""
+		Summarize the trailing partial chunk and return the final summary.
+
+		Waits for the background updates; re-raises the first error one of
+		them hit.
+		"""
+		with self._pending_lock:
+			last = self._builder.flush()
+			if last:
+				self._pending.append(last)
+			worker = self._worker
+		if worker is not None:
+			worker.result()
+		# Whatever the worker did not pick up is summarized here
+		self._drain()
+		if self._error is not None:
+			raise self._error
+		with self._lock:
+			return self._summary
+
+
+def _get_summary_executor() -> ThreadPoolExecutor:
+	"""Shared worker pool that runs summarization off the caller's thread."""
+	global _summary_executor
+	with _summary_executor_lock:
+		if _summary_executor is None:
+			_summary_executor = ThreadPoolExecutor(max_workers=_SUMMARY_WORKERS, thread_name_prefix="summarize")
+		return _summary_executor
+
+
+def _timed(timings: Dict[str, float], stage: str, fn: Callable[..., Any], *args: Any) -> Any:
+	start = time.perf_counter()
+	try:
+		return fn(*args)
+	finally:
+		timings[stage] = time.perf_counter() - start
+
+
+def process_transcript(
+	transcript: str,
+	config: Optional[SummarizationConfig] = None,
+	include_summary: bool = True,
+) -> Dict[str, Any]:
 	"""
 	Process transcript and return structured output with all features.
 	
-	This function generates:
+	The summary is generated on a worker thread while the transcript is
+	analyzed once into a Document and the rule-based extractors run on the
+	calling thread, so the end-to-end latency is roughly that of the
+	summarizer alone. This function generates:
 	- Summary
 	- Action Items
 	- Highlights
@@ -95,29 +464,48 @@ def process_transcript(transcript: str, config: Optional[SummarizationConfig] =
 	Args:
 		transcript: The full transcript text
 		config: Optional summarization configuration
+		include_summary: Set False to run only the rule-based extractors
+			(summary is then None)
 		
 	Returns:
-		Dictionary with keys: summary, action_items, highlights, topics
+		Dictionary with keys: summary, action_items, highlights, topics and
+		timings (seconds spent in each stage, plus the wall-clock total)
 	"""
 	from .action_items import extract_action_items
+	from .document import Document
 	from .highlights import extract_highlights as extract_highlights_func
-	from .topics import extract_topics
+	from .topics import extract_topics, extract_topics_tfidf
+	
+	start = time.perf_counter()
+	timings: Dict[str, float] = {}
 	
-	# Generate summary
-	summary = summarize_text(transcript, config)
+	# Model work starts first so it overlaps everything below
+	summary_future = None
+	if include_summary:
+		summary_future = _get_summary_executor().submit(_timed, timings, "summary", summarize_text, transcript, config)
+	
+	# Split, normalize and tokenize once for all extractors
+	doc = _timed(timings, "document", Document.from_text, transcript)
 	
 	# Extract action items
-	action_items = extract_action_items(transcript)
+	action_items = _timed(timings, "action_items", extract_action_items, doc)
 	
 	# Extract highlights
-	highlights = extract_highlights_func(transcript)
+	highlights = _timed(timings, "highlights", extract_highlights_func, doc)
 	
 	# Extract topics
-	topics = extract_topics(transcript)
+	if config is not None and config.corpus_topics:
+		topics = _timed(timings, "topics", extract_topics_tfidf, doc, 5, None, config.update_topic_index)
+	else:
+		topics = _timed(timings, "topics", extract_topics, doc)
+	
+	summary = summary_future.result() if summary_future is not None else None
+	timings["total"] = time.perf_counter() - start
 	
 	return {
 		"summary": summary,
 		"action_items": action_items,
 		"highlights": highlights,
-		"topics": topics
+		"topics": topics,
+		"timings": timings,
 	}
@@ -0,0 +1,151 @@
+"""
+Summary Cache Module
+
+Disk-backed LRU cache for chunk-level and reduce-level summaries.
+Entries are keyed by a hash of the input text, the model name and the
+summarization config, so re-running the same transcript (or one with only
+a few edited chunks) skips the transformer for everything already seen.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+DEFAULT_CACHE_DIR = Path(
+	os.environ.get("TRANSCRIPTER_CACHE_DIR", Path.home() / ".cache" / "transcripter")
+)
+DEFAULT_MAX_BYTES = int(os.environ.get("TRANSCRIPTER_SUMMARY_CACHE_MB", "64")) * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 20000
+
+
+def make_key(kind: str, text: str, params: Dict[str, Any]) -> str:
+	"""
+	Build a stable cache key for a piece of text and its summarization params.
+
+	Args:
+		kind: Entry kind ("chunk" or "reduce"), so both levels never collide
+		text: Text that is being summarized
+		params: Model name and config fields that affect the output
+
+	Returns:
+		Hex digest string
+	"""
+	text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+	param_blob = json.dumps(params, sort_keys=True, separators=(",", ":"))
+	return hashlib.sha256(f"{kind}\0{text_hash}\0{param_blob}".encode("utf-8")).hexdigest()
+
+
+class SummaryCache:
+	"""
+	SQLite-backed LRU cache of summary strings.
+
+	The cache is bounded by total stored bytes and entry count; the least
+	recently used entries are evicted first. Safe to share across threads.
+	"""
+
+	def __init__(
+		self,
+		path: str | Path | None = None,
+		max_bytes: int = DEFAULT_MAX_BYTES,
+		max_entries: int = DEFAULT_MAX_ENTRIES,
+	) -> None:
+		if path is None:
+			path = DEFAULT_CACHE_DIR / "summaries.sqlite3"
+		self.path = Path(path)
+		self.max_bytes = max_bytes
+		self.max_entries = max_entries
+		self.hits = 0
+		self.misses = 0
+		self._lock = threading.Lock()
+
+		self.path.parent.mkdir(parents=True, exist_ok=True)
+		self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+		self._conn.execute("PRAGMA journal_mode=WAL")
+		self._conn.execute(
+			"CREATE TABLE IF NOT EXISTS summaries ("
+			" key TEXT PRIMARY KEY,"
+			" value TEXT NOT NULL,"
+			" size INTEGER NOT NULL,"
+			" accessed REAL NOT NULL)"
+		)
+		self._conn.execute("CREATE INDEX IF NOT EXISTS idx_accessed ON summaries (accessed)")
+		self._conn.commit()
+
+	def get(self, key: str) -> Optional[str]:
+		with self._lock:
+			row = self._conn.execute("SELECT value FROM summaries WHERE key = ?", (key,)).fetchone()
+			if row is None:
+				self.misses += 1
+				return None
+			self._conn.execute("UPDATE summaries SET accessed = ? WHERE key = ?", (time.time(), key))
+			self._conn.commit()
+			self.hits += 1
+			return row[0]
+
+	def contains(self, key: str) -> bool:
+		"""Check for a key without touching LRU order or hit statistics."""
+		with self._lock:
+			return self._conn.execute("SELECT 1 FROM summaries WHERE key = ?", (key,)).fetchone() is not None
+
+	def set(self, key: str, value: str) -> None:
+		size = len(key) + len(value.encode("utf-8"))
+		with self._lock:
+			self._conn.execute(
+				"INSERT OR REPLACE INTO summaries (key, value, size, accessed) VALUES (?, ?, ?, ?)",
+				(key, value, size, time.time()),
+			)
+			self._evict()
+			self._conn.commit()
+
+	def _evict(self) -> None:
+		count, total = self._conn.execute(
+			"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM summaries"
+		).fetchone()
+		if count <= self.max_entries and total <= self.max_bytes:
+			return
+		# Walk from least recently used until both limits are satisfied
+		evict: list[str] = []
+		for key, size in self._conn.execute("SELECT key, size FROM summaries ORDER BY accessed ASC"):
+			if count <= self.max_entries and total <= self.max_bytes:
+				break
+			evict.append(key)
+			count -= 1
+			total -= size
+		self._conn.executemany("DELETE FROM summaries WHERE key = ?", [(k,) for k in evict])
+
+	def clear(self) -> None:
+		with self._lock:
+			self._conn.execute("DELETE FROM summaries")
+			self._conn.commit()
+
+	def stats(self) -> Dict[str, int]:
+		with self._lock:
+			count, total = self._conn.execute(
+				"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM summaries"
+			).fetchone()
+		return {"entries": count, "bytes": total, "hits": self.hits, "misses": self.misses}
+
+	def close(self) -> None:
+		with self._lock:
+			self._conn.close()
+
+
+_default_cache: Optional[SummaryCache] = None
+_default_lock = threading.Lock()
+
+
+def get_default_cache() -> SummaryCache:
+	"""Return the process-wide summary cache, creating it on first use."""
+	global _default_cache
+	with _default_lock:
+		if _default_cache is None:
+			_default_cache = SummaryCache()
+		return _default_cache
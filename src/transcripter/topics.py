@@ -1,13 +1,18 @@
 """
 Topic/Keyword Extraction Module
 
-Extracts top keywords from transcript using TF-IDF or Counter.
+Extracts top keywords from transcript using Counter or TF-IDF against a
+corpus-level IDF index.
 Lightweight and optimized for 8GB RAM systems.
 """
 
-import re
 from collections import Counter
-from typing import List
+from typing import TYPE_CHECKING, List, Optional, Union
+
+from .document import Document, as_document
+
+if TYPE_CHECKING:
+    from .idf_index import IDFIndex
 
 
 # Common English stopwords (lightweight, no external library needed)
@@ -25,7 +30,12 @@ STOPWORDS = {
 }
 
 
-def extract_topics(transcript: str, top_n: int = 5) -> List[str]:
+def topic_words(words: List[str]) -> List[str]:
+    """Filter out stopwords and very short words."""
+    return [word for word in words if len(word) > 3 and word not in STOPWORDS]
+
+
+def extract_topics(transcript: Union[str, Document], top_n: int = 5) -> List[str]:
     """
     Extract top keywords/topics from transcript.
     
@@ -33,28 +43,19 @@ def extract_topics(transcript: str, top_n: int = 5) -> List[str]:
     Lightweight alternative to full TF-IDF for 8GB RAM systems.
     
     Args:
-        transcript: The full transcript text
+        transcript: The full transcript text, or a pre-built Document
         top_n: Number of top topics to return (default: 5)
         
     Returns:
         List of top keywords/topics
     """
-    if not transcript or not transcript.strip():
-        return []
-    
-    # Clean transcript: lowercase and remove punctuation
-    text = transcript.lower()
-    text = re.sub(r'[^\w\s]', ' ', text)
-    text = re.sub(r'\s+', ' ', text).strip()
+    doc = as_document(transcript)
     
-    # Split into words
-    words = text.split()
+    # Lowercased, punctuation-free words
+    words = doc.words
     
     # Filter out stopwords and very short words
-    filtered_words = [
-        word for word in words
-        if len(word) > 3 and word not in STOPWORDS
-    ]
+    filtered_words = topic_words(words)
     
     # Count word frequencies
     word_counts = Counter(filtered_words)
@@ -68,46 +69,36 @@ def extract_topics(transcript: str, top_n: int = 5) -> List[str]:
     return topics
 
 
-def extract_topics_tfidf(transcript: str, top_n: int = 5) -> List[str]:
+def extract_topics_tfidf(
+    transcript: Union[str, Document],
+    top_n: int = 5,
+    index: Optional["IDFIndex"] = None,
+    update: bool = False,
+) -> List[str]:
     """
-    Extract top keywords using TF-IDF (requires sklearn).
+    Extract top keywords using TF-IDF against the corpus of processed meetings.
     
-    This is an alternative method that uses sklearn's TfidfVectorizer.
-    Falls back to simple Counter method if sklearn is not available.
+    Term rarity comes from a persistent hashed document-frequency index
+    shared by every transcript processed so far, so common meeting words
+    rank below the terms specific to this meeting. Unigrams and bigrams are
+    scored with one sparse TF x IDF product; nothing is refitted.
     
     Args:
-        transcript: The full transcript text
+        transcript: The full transcript text, or a pre-built Document
         top_n: Number of top topics to return (default: 5)
+        index: IDF index to score against (default: the on-disk corpus index)
+        update: Whether to add this transcript to the index first (the
+            index is then saved to disk in batches)
         
     Returns:
         List of top keywords/topics
     """
-    try:
-        from sklearn.feature_extraction.text import TfidfVectorizer
-        
-        # Use TF-IDF vectorizer
-        vectorizer = TfidfVectorizer(
-            max_features=top_n * 2,  # Get more features for better selection
-            stop_words='english',
-            ngram_range=(1, 2),  # Include unigrams and bigrams
-            min_df=1,
-            max_df=0.95
-        )
-        
-        # Fit and transform
-        tfidf_matrix = vectorizer.fit_transform([transcript])
-        
-        # Get feature names and scores
-        feature_names = vectorizer.get_feature_names_out()
-        scores = tfidf_matrix.toarray()[0]
-        
-        # Get top N features
-        top_indices = scores.argsort()[-top_n:][::-1]
-        topics = [feature_names[i].title() for i in top_indices if scores[i] > 0]
-        
-        return topics[:top_n]
+    from .idf_index import get_default_index
     
-    except ImportError:
-        # Fallback to simple Counter method
-        return extract_topics(transcript, top_n)
-
+    doc = as_document(transcript)
+    if index is None:
+        index = get_default_index()
+    if update:
+        index.add_document(doc)
+    
+    return [term.title() for term, score in index.top_terms(doc, top_n) if score > 0]
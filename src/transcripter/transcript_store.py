@@ -0,0 +1,301 @@
+"""
+Transcript Store Module
+
+Compact binary format for a transcript and its Vosk word timings.
+
+Words are grouped into fixed-size blocks. Each block keeps its columns
+side by side: start times (ms, delta-encoded), durations (ms), confidences
+(quantized to uint16) and the words themselves. Every block is compressed
+on its own with zstd (when `zstandard` is installed) or zlib. A small
+uncompressed index of each block's time span and byte range comes first,
+so reading a time range only decompresses the blocks that overlap it.
+
+Layout:
+    header   MAGIC, codec, flags, block size, word count, block count,
+             stored-text length
+    index    per block: first start ms, last end ms, byte offset, length
+    text     compressed transcript text, only when it is not simply the
+             words joined by spaces
+    blocks   compressed column blocks
+
+Example:
+    data = encode_transcript(words, transcript)
+    reader = TranscriptReader(data)
+    reader.words_in_range(60.0, 90.0)
+"""
+
+import mmap
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+MAGIC = b"MTX1"
+FILE_SUFFIX = ".mtx"
+BLOCK_WORDS = 256
+
+CODEC_ZLIB = 1
+CODEC_ZSTD = 2
+_CODEC_NAMES = {CODEC_ZLIB: "zlib", CODEC_ZSTD: "zstd"}
+
+# Set when the words carry no timings (e.g. a transcript loaded from text)
+FLAG_UNTIMED = 1
+
+_HEADER = struct.Struct("<4sBBHIII")
+_INDEX_ENTRY = struct.Struct("<IIII")
+_CONF_SCALE = 65535
+
+
+def default_codec() -> int:
+    return CODEC_ZSTD if zstandard is not None else CODEC_ZLIB
+
+
+def _compress(data: bytes, codec: int) -> bytes:
+    if codec == CODEC_ZSTD:
+        return zstandard.ZstdCompressor(level=9).compress(data)
+    return zlib.compress(data, 6)
+
+
+def _decompress(data: bytes, codec: int) -> bytes:
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("Transcript is zstd-compressed; install it with: pip install zstandard")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+def _to_ms(value: Any) -> int:
+    return int(round(float(value) * 1000))
+
+
+def _encode_block(words: Sequence[Mapping[str, Any]], timed: bool) -> bytes:
+    n = len(words)
+    starts = np.zeros(n, dtype=np.int64)
+    durations = np.zeros(n, dtype=np.uint32)
+    conf = np.full(n, _CONF_SCALE, dtype=np.uint16)
+    if timed:
+        starts[:] = [_to_ms(w.get("start", 0.0)) for w in words]
+        ends = np.array([_to_ms(w.get("end", w.get("start", 0.0))) for w in words], dtype=np.int64)
+        durations[:] = np.maximum(ends - starts, 0)
+        conf[:] = np.round(np.clip([float(w.get("conf", 1.0)) for w in words], 0.0, 1.0) * _CONF_SCALE)
+    # Small, mostly repeated deltas compress far better than absolute times
+    deltas = np.diff(starts, prepend=0).astype(np.int32)
+    text = "\n".join(str(w.get("word", "")) for w in words).encode("utf-8")
+    return b"".join((
+        struct.pack("<I", n),
+        deltas.astype("<i4").tobytes(),
+        durations.astype("<u4").tobytes(),
+        conf.astype("<u2").tobytes(),
+        text,
+    ))
+
+
+def encode_transcript(
+    words: Sequence[Mapping[str, Any]],
+    text: Optional[str] = None,
+    block_words: int = BLOCK_WORDS,
+    codec: Optional[int] = None,
+) -> bytes:
+    """
+    Encode word timings (and the transcript text) into the store format.
+
+    Args:
+        words: Vosk word dicts ("word", "start", "end", "conf"; times in
+            seconds). Words without "start" are stored untimed.
+        text: Transcript text; only stored separately when it differs from
+            the words joined by spaces
+        block_words: Words per compressed block (the unit of random access)
+        codec: CODEC_ZSTD or CODEC_ZLIB (default: zstd when available)
+
+    Returns:
+        Encoded bytes
+    """
+    if codec is None:
+        codec = default_codec()
+    if text is not None and not words:
+        words = [{"word": word} for word in text.split()]
+    timed = bool(words) and all("start" in w for w in words)
+
+    joined = " ".join(str(w.get("word", "")) for w in words)
+    stored_text = b""
+    if text is not None and text != joined:
+        stored_text = _compress(text.encode("utf-8"), codec)
+
+    index = []
+    blocks = []
+    offset = 0
+    for first in range(0, len(words), block_words):
+        chunk = words[first:first + block_words]
+        payload = _compress(_encode_block(chunk, timed), codec)
+        start_ms = _to_ms(chunk[0].get("start", 0.0)) if timed else 0
+        end_ms = max(_to_ms(w.get("end", w.get("start", 0.0))) for w in chunk) if timed else 0
+        index.append(_INDEX_ENTRY.pack(start_ms, end_ms, offset, len(payload)))
+        blocks.append(payload)
+        offset += len(payload)
+
+    header = _HEADER.pack(
+        MAGIC, codec, 0 if timed else FLAG_UNTIMED, block_words, len(words), len(blocks), len(stored_text)
+    )
+    return b"".join([header, *index, stored_text, *blocks])
+
+
+def is_encoded(data: bytes) -> bool:
+    return bytes(data[:len(MAGIC)]) == MAGIC
+
+
+class TranscriptReader:
+    """
+    Random-access reader over encoded transcript bytes.
+
+    Only the header and block index are parsed up front; blocks are
+    decompressed when a query touches them. Works on bytes, memoryview or
+    an mmap, so a file-backed reader only pages in what it reads.
+    """
+
+    def __init__(self, data: bytes | memoryview | mmap.mmap) -> None:
+        self._data = memoryview(data)
+        magic, self.codec, self.flags, self.block_words, self.n_words, n_blocks, text_len = (
+            _HEADER.unpack_from(self._data, 0)
+        )
+        if magic != MAGIC:
+            raise ValueError("Not an encoded transcript")
+        if self.codec not in _CODEC_NAMES:
+            raise ValueError(f"Unknown transcript codec {self.codec}")
+
+        index_start = _HEADER.size
+        index = np.frombuffer(
+            self._data, dtype="<u4", count=n_blocks * 4, offset=index_start
+        ).reshape(n_blocks, 4)
+        self._block_start_ms = index[:, 0].astype(np.int64)
+        self._block_end_ms = index[:, 1].astype(np.int64)
+        self._block_offset = index[:, 2]
+        self._block_length = index[:, 3]
+        self._text_start = index_start + n_blocks * _INDEX_ENTRY.size
+        self._text_len = text_len
+        self._blocks_start = self._text_start + text_len
+
+    @property
+    def timed(self) -> bool:
+        return not self.flags & FLAG_UNTIMED
+
+    @property
+    def codec_name(self) -> str:
+        return _CODEC_NAMES[self.codec]
+
+    @property
+    def n_blocks(self) -> int:
+        return len(self._block_offset)
+
+    @property
+    def duration_seconds(self) -> float:
+        if not self.timed or not self.n_blocks:
+            return 0.0
+        return float(self._block_end_ms.max()) / 1000
+
+    def _block(self, i: int) -> List[Dict[str, Any]]:
+        start = self._blocks_start + int(self._block_offset[i])
+        raw = _decompress(bytes(self._data[start:start + int(self._block_length[i])]), self.codec)
+        (n,) = struct.unpack_from("<I", raw, 0)
+        pos = 4
+        deltas = np.frombuffer(raw, dtype="<i4", count=n, offset=pos)
+        pos += 4 * n
+        durations = np.frombuffer(raw, dtype="<u4", count=n, offset=pos)
+        pos += 4 * n
+        conf = np.frombuffer(raw, dtype="<u2", count=n, offset=pos)
+        pos += 2 * n
+        tokens = raw[pos:].decode("utf-8").split("\n") if n else []
+        if not self.timed:
+            return [{"word": token} for token in tokens]
+
+        starts = np.cumsum(deltas, dtype=np.int64)
+        ends = starts + durations
+        return [
+            {
+                "word": token,
+                "start": start_ms / 1000,
+                "end": end_ms / 1000,
+                "conf": round(c / _CONF_SCALE, 4),
+            }
+            for token, start_ms, end_ms, c in zip(tokens, starts.tolist(), ends.tolist(), conf.tolist())
+        ]
+
+    def words(self) -> List[Dict[str, Any]]:
+        """All words with their timings."""
+        return [word for i in range(self.n_blocks) for word in self._block(i)]
+
+    def text(self) -> str:
+        """The full transcript text."""
+        if self._text_len:
+            raw = bytes(self._data[self._text_start:self._text_start + self._text_len])
+            return _decompress(raw, self.codec).decode("utf-8")
+        return " ".join(word["word"] for word in self.words())
+
+    def words_in_range(self, start: float = 0.0, end: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Words overlapping [start, end) seconds (end None: to the end),
+        decompressing only the blocks whose time span overlaps the range.
+        """
+        if not self.timed:
+            raise ValueError("Transcript has no word timings")
+        start_ms = _to_ms(start)
+        end_ms = _to_ms(end) if end is not None else int(self._block_end_ms.max(initial=0)) + 1
+        # Blocks are in time order: skip those ending before the range and
+        # stop at the first one starting after it
+        first = int(np.searchsorted(np.maximum.accumulate(self._block_end_ms), start_ms, side="right"))
+        last = int(np.searchsorted(self._block_start_ms, end_ms, side="left"))
+        return [
+            word
+            for i in range(first, last)
+            for word in self._block(i)
+            if word["end"] * 1000 > start_ms and word["start"] * 1000 < end_ms
+        ]
+
+    def text_in_range(self, start: float = 0.0, end: Optional[float] = None) -> str:
+        return " ".join(word["word"] for word in self.words_in_range(start, end))
+
+
+def write_transcript(
+    path: str | Path,
+    words: Sequence[Mapping[str, Any]],
+    text: Optional[str] = None,
+    codec: Optional[int] = None,
+) -> Path:
+    path = Path(path)
+    path.write_bytes(encode_transcript(words, text, codec=codec))
+    return path
+
+
+def read_transcript(path: str | Path) -> TranscriptReader:
+    """Open a stored transcript memory-mapped; blocks are read on demand."""
+    with open(path, "rb") as handle:
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    return TranscriptReader(mapped)
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Print a stored transcript, or one time range of it.")
+    parser.add_argument("path", help=f"Transcript file ({FILE_SUFFIX})")
+    parser.add_argument("--start", type=float, default=None, help="Range start in seconds")
+    parser.add_argument("--end", type=float, default=None, help="Range end in seconds")
+    args = parser.parse_args()
+
+    reader = read_transcript(args.path)
+    if args.start is None and args.end is None:
+        print(reader.text())
+        return
+    for word in reader.words_in_range(args.start or 0.0, args.end):
+        print(f"[{word['start']:8.2f}s] {word['word']}")
+
+
+if __name__ == "__main__":
+    main()
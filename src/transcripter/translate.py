@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from typing import Optional
+import math
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from .registry import get_registry
 
 try:
 	from transformers import pipeline, AutoTokenizer, AutoModelForSeq2SeqLM
@@ -17,6 +23,188 @@ DEFAULT_TRANSLATION_MODEL = "Helsinki-NLP/opus-mt-hi-en"
 # - "facebook/mbart-large-50-many-to-many-mmt" (multilingual, very large)
 
 
+def _load_translation_pipeline(model_name: str):
+	print(f"Loading translation model: {model_name}...")
+	print("(This may take a moment on first use)")
+	return pipeline(
+		"translation",
+		model=model_name,
+		tokenizer=model_name,
+		device=-1,  # Use CPU (-1), set to 0 for GPU if available
+	)
+
+
+def _get_translation_pipeline(model_name: str):
+	return get_registry().get(
+		("translation", model_name),
+		lambda: _load_translation_pipeline(model_name),
+	)
+
+
+# Sentence ends: Latin punctuation needs following whitespace (so "3.5" is not
+# split); the Devanagari danda/double danda ends a sentence on its own.
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+|(?<=[\u0964\u0965])\s*")
+
+
+def split_sentences(text: str) -> List[str]:
+	"""Split Hindi or English text into sentences, including on । and ॥."""
+	return [s.strip() for s in _SENTENCE_SPLIT.split(text) if s.strip()]
+
+
+class HindiTranslator:
+	"""
+	Persistent Hindi to English translator.
+
+	The model is loaded once through the shared model registry. Sentences are
+	split on Latin and Devanagari punctuation, over-long ones are cut to the
+	model's token budget, and the rest are length-sorted and packed into
+	batches bounded by total tokens. Translations are kept in an LRU cache
+	per sentence, so repeated phrases are never translated twice.
+	"""
+
+	def __init__(
+		self,
+		model_name: str = DEFAULT_TRANSLATION_MODEL,
+		max_input_tokens: int = 400,
+		batch_tokens: int = 4096,
+		max_batch_size: int = 32,
+		cache_size: int = 20000,
+	) -> None:
+		self.model_name = model_name
+		self.max_input_tokens = max_input_tokens
+		self.batch_tokens = batch_tokens
+		self.max_batch_size = max_batch_size
+		self.cache_size = cache_size
+		self._cache: "OrderedDict[str, str]" = OrderedDict()
+		self._lock = threading.Lock()
+		self.cache_hits = 0
+		self.cache_misses = 0
+
+	@property
+	def pipe(self):
+		return _get_translation_pipeline(self.model_name)
+
+	def _token_lengths(self, texts: List[str]) -> List[int]:
+		encoded = self.pipe.tokenizer(texts, add_special_tokens=True)["input_ids"]
+		return [len(ids) for ids in encoded]
+
+	def _split_long(self, sentence: str, tokens: int) -> List[str]:
+		words = sentence.split()
+		pieces = min(math.ceil(tokens / self.max_input_tokens), len(words))
+		size = math.ceil(len(words) / pieces)
+		return [" ".join(words[i:i + size]) for i in range(0, len(words), size)]
+
+	def _cache_get(self, sentence: str) -> Optional[str]:
+		with self._lock:
+			value = self._cache.get(sentence)
+			if value is None:
+				self.cache_misses += 1
+				return None
+			self._cache.move_to_end(sentence)
+			self.cache_hits += 1
+			return value
+
+	def _cache_set(self, sentence: str, value: str) -> None:
+		with self._lock:
+			self._cache[sentence] = value
+			self._cache.move_to_end(sentence)
+			while len(self._cache) > self.cache_size:
+				self._cache.popitem(last=False)
+
+	def _pack(self, units: List[str], lengths: List[int]) -> List[List[int]]:
+		"""Group unit indices into batches bounded by padded token count."""
+		order = sorted(range(len(units)), key=lambda i: lengths[i])
+		batches: list[list[int]] = []
+		current: list[int] = []
+		for i in order:
+			# Sorted ascending, so the newest unit sets the padded length
+			if current and (
+				len(current) >= self.max_batch_size
+				or lengths[i] * (len(current) + 1) > self.batch_tokens
+			):
+				batches.append(current)
+				current = []
+			current.append(i)
+		if current:
+			batches.append(current)
+		return batches
+
+	def _translate_units(self, units: List[str], show_progress: bool = False) -> Dict[str, str]:
+		if not units:
+			return {}
+		lengths = self._token_lengths(units)
+		batches = self._pack(units, lengths)
+		translations: dict[str, str] = {}
+		for n, batch in enumerate(batches, 1):
+			texts = [units[i] for i in batch]
+			try:
+				results = self.pipe(texts, max_length=512, batch_size=len(texts))
+				for source, result in zip(texts, results):
+					translated = result.get("translation_text", "") if isinstance(result, dict) else ""
+					translations[source] = translated or source
+					if translated:
+						self._cache_set(source, translated)
+			except Exception as e:
+				print(f"Warning: Error translating batch {n}: {e}")
+				# Fallback: keep original text if translation fails
+				for source in texts:
+					translations[source] = source
+			if show_progress:
+				print(f"Translated batch {n}/{len(batches)}")
+		return translations
+
+	def translate_sentences(self, sentences: List[str], show_progress: bool = False) -> List[str]:
+		"""Translate a list of sentences, returning one translation per input."""
+		done: dict[str, str] = {}
+		missing: list[str] = []
+		for sentence in dict.fromkeys(s for s in sentences if s):
+			cached = self._cache_get(sentence)
+			if cached is None:
+				missing.append(sentence)
+			else:
+				done[sentence] = cached
+
+		# Sentences over the model's input budget are cut into word windows
+		pieces: dict[str, list[str]] = {}
+		if missing:
+			for sentence, tokens in zip(missing, self._token_lengths(missing)):
+				pieces[sentence] = (
+					self._split_long(sentence, tokens) if tokens > self.max_input_tokens else [sentence]
+				)
+		units = list(dict.fromkeys(p for parts in pieces.values() for p in parts))
+		translated = self._translate_units(units, show_progress)
+
+		for sentence, parts in pieces.items():
+			done[sentence] = " ".join(translated.get(p, p) for p in parts)
+			if len(parts) > 1:
+				self._cache_set(sentence, done[sentence])
+		return [done.get(s, "") for s in sentences]
+
+	def translate(self, text: str, show_progress: bool = False) -> str:
+		"""Translate a full Hindi text to English."""
+		if not text or not text.strip():
+			return ""
+		return " ".join(t for t in self.translate_sentences(split_sentences(text), show_progress) if t).strip()
+
+
+_translators: Dict[str, HindiTranslator] = {}
+_translators_lock = threading.Lock()
+
+
+def get_translator(model_name: Optional[str] = None) -> HindiTranslator:
+	"""Return the shared translator (and its sentence cache) for a model."""
+	if not TRANSFORMERS_AVAILABLE:
+		raise ImportError(
+			"Transformers library is required for translation. "
+			"Install it with: pip install transformers torch"
+		)
+	model_name = model_name or DEFAULT_TRANSLATION_MODEL
+	with _translators_lock:
+		if model_name not in _translators:
+			_translators[model_name] = HindiTranslator(model_name)
+		return _translators[model_name]
+
+
 def translate_hindi_to_english(
 	text: str,
 	model_name: Optional[str] = None,
@@ -28,74 +216,15 @@ def translate_hindi_to_english(
 	Args:
 		text: Hindi text to translate
 		model_name: Optional model name (defaults to Helsinki-NLP/opus-mt-hi-en)
-		chunk_size: Maximum characters per chunk for translation (to avoid memory issues)
+		chunk_size: Unused; inputs are now packed by token budget
+			(see HindiTranslator). Kept for backward compatibility.
 	
 	Returns:
 		Translated English text
 	"""
-	if not TRANSFORMERS_AVAILABLE:
-		raise ImportError(
-			"Transformers library is required for translation. "
-			"Install it with: pip install transformers torch"
-		)
-	
-	if not text or not text.strip():
-		return ""
-	
-	if model_name is None:
-		model_name = DEFAULT_TRANSLATION_MODEL
-	
-	print(f"Loading translation model: {model_name}...")
-	print("(This may take a moment on first use)")
-	
-	# Load translation pipeline
-	translator = pipeline(
-		"translation",
-		model=model_name,
-		tokenizer=model_name,
-		device=-1,  # Use CPU (-1), set to 0 for GPU if available
-	)
-	
-	# Split long text into chunks to avoid memory issues
-	chunks: list[str] = []
-	current_chunk = ""
-	
-	# Simple sentence-based chunking
-	sentences = text.split('. ')
-	for sentence in sentences:
-		if len(current_chunk) + len(sentence) < chunk_size:
-			current_chunk += sentence + '. '
-		else:
-			if current_chunk:
-				chunks.append(current_chunk.strip())
-			current_chunk = sentence + '. '
-	
-	if current_chunk:
-		chunks.append(current_chunk.strip())
-	
-	# Translate each chunk
-	translated_chunks: list[str] = []
+	translator = get_translator(model_name)
 	print("Translating...")
-	
-	for i, chunk in enumerate(chunks):
-		if not chunk.strip():
-			continue
-		
-		try:
-			result = translator(chunk, max_length=512)
-			if result and isinstance(result, list) and len(result) > 0:
-				translated_text = result[0].get('translation_text', '')
-				if translated_text:
-					translated_chunks.append(translated_text)
-					print(f"Translated chunk {i+1}/{len(chunks)}")
-		except Exception as e:
-			print(f"Warning: Error translating chunk {i+1}: {e}")
-			# Fallback: keep original text if translation fails
-			translated_chunks.append(chunk)
-	
-	# Join translated chunks
-	translated = ' '.join(translated_chunks)
-	return translated.strip()
+	return translator.translate(text, show_progress=True)
 
 
 def is_hindi_text(text: str) -> bool:
@@ -0,0 +1,98 @@
+import pytest
+
+pytest.importorskip("mongomock_motor")
+
+from bson import ObjectId
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import ai.meetings
+import auth.database as database
+from ai.meetings import get_meeting_audio, save_meeting
+from ai.search import index_meeting
+from auth.routes import router as auth_router
+
+
+WORDS = [
+	{"word": "budget", "start": 0.0, "end": 0.4, "conf": 1.0},
+	{"word": "review", "start": 0.5, "end": 0.9, "conf": 1.0},
+]
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+	monkeypatch.setattr(database, "MONGO_URI", database.IN_MEMORY_URI)
+	monkeypatch.setattr(database, "_client", None)
+	monkeypatch.setattr(ai.meetings, "UPLOAD_DIR", tmp_path)
+	app = FastAPI()
+	app.include_router(auth_router, prefix="/auth")
+	with TestClient(app) as test_client:
+		yield test_client
+	database.close_database()
+
+
+def _login(client: TestClient, email: str) -> tuple[dict[str, str], str]:
+	client.post("/auth/register", json={"email": email, "password": "secret1"})
+	token = client.post("/auth/login", json={"email": email, "password": "secret1"}).json()["access_token"]
+	headers = {"Authorization": f"Bearer {token}"}
+	return headers, client.get("/auth/profile", headers=headers).json()["user_id"]
+
+
+async def _store_meeting(user_id: str, upload_dir) -> str:
+	audio_file = f"{ObjectId()}.wav"
+	(upload_dir / audio_file).write_bytes(b"RIFF")
+	meeting_id = await save_meeting(
+		database.get_meetings_collection(),
+		user_id,
+		filename="standup.wav",
+		transcript="budget review",
+		summary="Budget review.",
+		action_items=[],
+		highlights=[],
+		topics=["Budget"],
+		words=WORDS,
+		audio_file=audio_file,
+	)
+	await index_meeting(
+		database.get_postings_collection(), database.get_search_stats_collection(), user_id, meeting_id, WORDS
+	)
+	return meeting_id
+
+
+async def _stored_counts(user_id: str) -> dict[str, int]:
+	owner = ObjectId(user_id)
+	return {
+		"users": await database.get_users_collection().count_documents({"_id": owner}),
+		"meetings": await database.get_meetings_collection().count_documents({"user_id": owner}),
+		"postings": await database.get_postings_collection().count_documents({"user_id": owner}),
+		"search_stats": await database.get_search_stats_collection().count_documents({"_id": owner}),
+	}
+
+
+def test_deleting_account_removes_all_user_data(client, tmp_path):
+	headers, user_id = _login(client, "gone@example.com")
+	other_headers, other_id = _login(client, "stays@example.com")
+	for _ in range(2):
+		client.portal.call(_store_meeting, user_id, tmp_path)
+	other_meeting = client.portal.call(_store_meeting, other_id, tmp_path)
+
+	response = client.delete("/auth/profile", headers=headers)
+
+	assert response.status_code == 200
+	assert response.json()["deleted"] == {"meetings": 2, "postings": 4, "recordings": 2}
+	assert client.portal.call(_stored_counts, user_id) == {
+		"users": 0,
+		"meetings": 0,
+		"postings": 0,
+		"search_stats": 0,
+	}
+	# Only the other user's recording is left on disk, and their data is intact
+	other_audio = client.portal.call(get_meeting_audio, database.get_meetings_collection(), other_id, other_meeting)
+	assert [path.name for path in tmp_path.iterdir()] == [other_audio]
+	assert client.portal.call(_stored_counts, other_id) == {
+		"users": 1,
+		"meetings": 1,
+		"postings": 2,
+		"search_stats": 1,
+	}
+	assert client.get("/auth/profile", headers=headers).status_code == 401
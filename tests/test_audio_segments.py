@@ -0,0 +1,56 @@
+import struct
+
+import pytest
+
+from ai.audio_segments import RangeNotSatisfiableError, parse_range, read_wav_layout
+
+
+def _wav(data: bytes = b"\0" * 64, fmt_size: int = 16) -> bytes:
+	fmt = struct.pack("<HHIIHH", 1, 1, 16000, 32000, 2, 16)[:fmt_size]
+	return b"".join((
+		struct.pack("<4sI4s", b"RIFF", 4 + 8 + fmt_size + 8 + len(data), b"WAVE"),
+		struct.pack("<4sI", b"fmt ", fmt_size),
+		fmt,
+		struct.pack("<4sI", b"data", len(data)),
+		data,
+	))
+
+
+def test_layout_of_a_valid_file(tmp_path):
+	path = tmp_path / "ok.wav"
+	path.write_bytes(_wav())
+
+	layout = read_wav_layout(path)
+	assert (layout.data_offset, layout.data_size, layout.block_align) == (44, 64, 2)
+
+
+@pytest.mark.parametrize("content", [b"", b"RIFF", _wav()[:30], _wav(fmt_size=8)])
+def test_truncated_header_is_a_value_error(tmp_path, content):
+	path = tmp_path / "short.wav"
+	path.write_bytes(content)
+
+	with pytest.raises(ValueError, match="Truncated WAV header"):
+		read_wav_layout(path)
+
+
+@pytest.mark.parametrize(
+	("header", "expected"),
+	[
+		("bytes=0-9", (0, 9)),
+		("bytes=90-", (90, 99)),
+		("bytes=-10", (90, 99)),
+		("bytes=95-200", (95, 99)),
+		("bytes=5-3", None),
+		("bytes=200-100", None),
+		("bytes=a-b", None),
+		(None, None),
+	],
+)
+def test_parse_range(header, expected):
+	assert parse_range(header, 100) == expected
+
+
+@pytest.mark.parametrize("header", ["bytes=100-", "bytes=150-200", "bytes=-0"])
+def test_unsatisfiable_range(header):
+	with pytest.raises(RangeNotSatisfiableError):
+		parse_range(header, 100)
@@ -0,0 +1,46 @@
+import asyncio
+import os
+
+import pytest
+
+pytest.importorskip("reportlab")
+
+from src.transcripter.pdf_cache import PdfRenderCache, iter_file
+
+
+REPORT = ("Quarterly review", ["Send the minutes"], ["Budget approved"], ["Budget"])
+
+
+@pytest.fixture
+def renderer(tmp_path):
+	cache = PdfRenderCache(cache_dir=tmp_path, max_bytes=1, workers=1)
+	yield cache
+	cache.shutdown()
+
+
+def test_render_larger_than_budget_is_kept(renderer):
+	handle = asyncio.run(renderer.get_or_render(*REPORT))
+
+	with handle:
+		assert handle.read(5) == b"%PDF-"
+	assert os.path.exists(handle.name)
+
+
+def test_evicting_an_open_report_does_not_cut_it_short(renderer):
+	handle = asyncio.run(renderer.get_or_render(*REPORT))
+	size = os.path.getsize(handle.name)
+	# Another report's render evicts this one while it is being sent
+	asyncio.run(renderer.get_or_render("Other meeting", [], [], []))
+
+	assert not os.path.exists(handle.name)
+	assert len(b"".join(iter_file(handle))) == size
+	assert handle.closed
+
+
+def test_hit_on_evicted_report_renders_again(renderer):
+	with asyncio.run(renderer.get_or_render(*REPORT)) as handle:
+		os.unlink(handle.name)
+
+	with asyncio.run(renderer.get_or_render(*REPORT)) as handle:
+		assert handle.read(5) == b"%PDF-"
+	assert renderer.stats()["misses"] == 2
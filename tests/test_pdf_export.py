@@ -0,0 +1,54 @@
+from io import BytesIO
+
+import pytest
+
+pytest.importorskip("reportlab")
+
+from reportlab.platypus import Paragraph
+
+from src.transcripter.pdf_export import _build_story, export_to_pdf, write_pdf
+
+
+UNSAFE = {
+	"summary": 'Revenue < target & R&D <img src="/etc/hostname"/> ahead',
+	"action_items": ["- Ship <b>v2</b> & notify"],
+	"highlights": ['Budget < 10% <img src="/etc/hostname">'],
+	"topics": ["R&D", "<font>"],
+}
+
+
+def _texts(story: list) -> list[str]:
+	return [flowable.getPlainText() for flowable in story if isinstance(flowable, Paragraph)]
+
+
+def test_report_fields_render_as_literal_text():
+	texts = _texts(_build_story(**UNSAFE))
+
+	assert UNSAFE["summary"] in texts
+	assert "• Ship <b>v2</b> & notify" in texts
+	assert '• Budget < 10% <img src="/etc/hostname">' in texts
+	assert "R&D, <font>" in texts
+
+
+def test_markup_in_fields_does_not_break_or_load_files(monkeypatch):
+	opened = []
+	real_open = open
+
+	def tracking_open(path, *args, **kwargs):
+		opened.append(str(path))
+		return real_open(path, *args, **kwargs)
+
+	monkeypatch.setattr("builtins.open", tracking_open)
+	output = BytesIO()
+	write_pdf(output=output, **UNSAFE)
+
+	assert output.getvalue().startswith(b"%PDF")
+	assert "/etc/hostname" not in opened
+
+
+def test_export_to_path_still_returns_the_pdf_bytes(tmp_path):
+	path = tmp_path / "report.pdf"
+	data = export_to_pdf(output_path=str(path), **UNSAFE)
+
+	assert data.startswith(b"%PDF")
+	assert data == path.read_bytes()